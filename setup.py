@@ -30,6 +30,9 @@ setup(
     install_requires=[
         "requests>=2.25.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+    },
     entry_points={
         "console_scripts": [
             "text2speech=text2speech_skill.cli:main",
@@ -0,0 +1,43 @@
+"""Shared fixtures: in-process mock TTSWeb servers and a CLI runner"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from text2speech_skill.mock_server import MockConfig, MockServer  # noqa: E402
+
+
+@pytest.fixture
+def mock_server():
+    """Factory: mock_server(**MockConfig kwargs) starts a server that is stopped after the test"""
+    servers = []
+
+    def start(**config):
+        config.setdefault("latency", "fixed:0.1")
+        server = MockServer(MockConfig(**config)).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def run_cli(tmp_path):
+    """run_cli(server, *args): run the CLI against server in a subprocess; returns CompletedProcess"""
+    def run(server, *args, timeout=60):
+        env = dict(os.environ, TEXT2SPEECH_API_BASE=server.base_url,
+                   TEXT2SPEECH_CACHE_DIR=str(tmp_path / "cache"),
+                   PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+        return subprocess.run([sys.executable, "-m", "text2speech_skill.cli", *args], env=env,
+                              capture_output=True, text=True, timeout=timeout)
+
+    return run
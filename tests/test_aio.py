@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from text2speech_skill.aio import AsyncText2SpeechClient  # noqa: E402
+from text2speech_skill.audio import read_wav_layout  # noqa: E402
+from text2speech_skill.retry import DEFAULT_TIMEOUTS, RetryPolicy  # noqa: E402
+
+
+def test_jobs_run_concurrently(mock_server, tmp_path):
+    server = mock_server(workers=8, latency="fixed:0.3")
+
+    async def run():
+        async with AsyncText2SpeechClient(server.base_url) as client:
+            async def one(i):
+                job_id = await client.custom_voice(f"text {i}", "vivian")
+                status = await client.wait_for_completion(job_id)
+                return await client.download_audio(status["audio_url"], str(tmp_path / f"{i}.wav"))
+            return await asyncio.gather(*(one(i) for i in range(8)))
+
+    sizes = asyncio.run(run())
+    assert all(size > 44 for size in sizes)
+    for i in range(8):
+        with open(tmp_path / f"{i}.wav", "rb") as f:
+            read_wav_layout(f)
+    assert not list(tmp_path.glob(".*.part"))
+
+
+def test_transient_poll_errors_are_missed_polls(mock_server, monkeypatch):
+    server = mock_server(latency="fixed:0.2")
+
+    async def run():
+        async with AsyncText2SpeechClient(server.base_url) as client:
+            job_id = await client.custom_voice("hello", "vivian")
+            real = client.get_job_status
+            failures = iter([aiohttp.ClientConnectionError("reset"),
+                             aiohttp.ClientResponseError(None, (), status=503)])
+
+            async def flaky(job_id):
+                error = next(failures, None)
+                if error:
+                    raise error
+                return await real(job_id)
+
+            monkeypatch.setattr(client, "get_job_status", flaky)
+            return await client.wait_for_completion(job_id)
+
+    assert asyncio.run(run())["status"] == "completed"
+
+
+def test_client_errors_are_not_retried_as_polls(mock_server):
+    server = mock_server()
+
+    async def run():
+        async with AsyncText2SpeechClient(server.base_url) as client:
+            await client.wait_for_completion("no-such-job")
+
+    with pytest.raises(aiohttp.ClientResponseError) as info:
+        asyncio.run(run())
+    assert info.value.status == 404
+
+
+def test_timeout_and_close_cancel_jobs(mock_server):
+    server = mock_server(latency="fixed:30")
+
+    async def run():
+        client = AsyncText2SpeechClient(server.base_url)
+        timed_out = await client.custom_voice("slow", "vivian")
+        with pytest.raises(TimeoutError):
+            await client.wait_for_completion(timed_out, timeout=0.3)
+        left_running = await client.custom_voice("also slow", "vivian")
+        await client.close()
+        return timed_out, left_running
+
+    job_ids = asyncio.run(run())
+    assert [server.backend.jobs[j].status for j in job_ids] == ["cancelled", "cancelled"]
+
+
+def _record_requests(client, calls):
+    request = client.session.request
+
+    async def recording(method, url, **kwargs):
+        calls.append((method, url, kwargs))
+        return await request(method, url, **kwargs)
+
+    client.session.request = recording
+
+
+def test_submissions_retry_with_one_idempotency_key(mock_server, tmp_path):
+    server = mock_server(error_rate=0.5, seed=3)
+
+    async def run():
+        calls = []
+        retry = RetryPolicy(attempts=10, initial=0.01, maximum=0.05)
+        async with AsyncText2SpeechClient(server.base_url, retry=retry) as client:
+            _record_requests(client, calls)
+            job_ids = [await client.custom_voice(f"text {i}", "vivian") for i in range(6)]
+        return job_ids, [kwargs["headers"]["Idempotency-Key"] for _, url, kwargs in calls if "/tts/" in url]
+
+    job_ids, keys = asyncio.run(run())
+    assert len(keys) > 6  # some attempts got an injected 500
+    assert len(set(keys)) == len(set(job_ids)) == len(server.backend.jobs) == 6
+
+
+def test_requests_use_their_family_timeouts(mock_server, tmp_path):
+    server = mock_server(latency="fixed:0.05")
+
+    async def run():
+        calls = []
+        async with AsyncText2SpeechClient(server.base_url, timeouts={"status": (1.0, 2.0)}) as client:
+            _record_requests(client, calls)
+            await client.get_speakers()
+            job_id = await client.custom_voice("hello", "vivian")
+            status = await client.wait_for_completion(job_id)
+            await client.download_audio(status["audio_url"], str(tmp_path / "a.wav"))
+        return {url.rsplit("/", 1)[-1]: kwargs["timeout"].sock_read for _, url, kwargs in calls}
+
+    reads = asyncio.run(run())
+    assert reads["speakers"] == DEFAULT_TIMEOUTS["meta"][1]
+    assert reads["custom-voice"] == DEFAULT_TIMEOUTS["submit"][1]
+    assert reads["status"] == 2.0
+    assert any(name.endswith(".wav") and read == DEFAULT_TIMEOUTS["download"][1] for name, read in reads.items())
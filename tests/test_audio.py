@@ -0,0 +1,94 @@
+import io
+import struct
+
+import pytest
+
+from text2speech_skill.audio import WavWriter, concat_wavs, read_wav_layout, silent_wav, split_text
+from text2speech_skill.mock_server import synth_wav
+
+
+def test_silent_wav_layout():
+    wav = silent_wav(0.5, sample_rate=16000)
+    fmt, offset, size = read_wav_layout(io.BytesIO(wav))
+    assert size == 16000
+    assert offset + size == len(wav)
+    assert wav[offset:] == bytes(size)
+
+
+def test_synth_wav_shares_header():
+    tone, silence = synth_wav(0.25), silent_wav(0.25)
+    assert len(tone) == len(silence)
+    assert tone[:44] == silence[:44]
+    assert tone[44:] != silence[44:]
+
+
+def _wav_file(tmp_path, name, seconds):
+    path = tmp_path / name
+    path.write_bytes(synth_wav(seconds))
+    return str(path)
+
+
+def test_split_text_packs_whole_sentences():
+    text = "One two. Three four five. Six.\n\nNew paragraph here."
+    assert split_text(text, max_chars=20) == ["One two.", "Three four five.", "Six.", "New paragraph here."]
+    assert split_text(text, max_chars=100) == ["One two. Three four five. Six.", "New paragraph here."]
+    assert split_text("  \n\n ") == []
+
+
+def test_split_text_breaks_long_sentences():
+    chunks = split_text("alpha, beta, gamma, delta " * 10, max_chars=30)
+    assert all(len(c) <= 30 for c in chunks)
+    assert " ".join(chunks).split() == ("alpha, beta, gamma, delta " * 10).split()
+
+
+def test_split_text_handles_cjk_punctuation():
+    assert split_text("你好。今天天气很好！", max_chars=8) == ["你好。", "今天天气很好！"]
+
+
+def test_concat_wavs_fixes_header_sizes(tmp_path):
+    paths = [_wav_file(tmp_path, f"{i}.wav", 0.1 * (i + 1)) for i in range(3)]
+    out = io.BytesIO()
+    data_bytes = concat_wavs(paths, out)
+    wav = out.getvalue()
+    fmt, offset, size = read_wav_layout(io.BytesIO(wav))
+    assert size == data_bytes == sum(len(synth_wav(0.1 * (i + 1))) - 44 for i in range(3))
+    assert struct.unpack('<I', wav[4:8])[0] == len(wav) - 8
+
+
+def test_concat_wavs_rejects_mixed_formats(tmp_path):
+    first = _wav_file(tmp_path, "a.wav", 0.1)
+    other = tmp_path / "b.wav"
+    other.write_bytes(silent_wav(0.1, sample_rate=16000))
+    with pytest.raises(ValueError):
+        concat_wavs([first, str(other)], io.BytesIO())
+
+
+class _Pipe(io.BytesIO):
+    """BytesIO that refuses tell/seek, like a pipe"""
+
+    def tell(self):
+        raise OSError("not seekable")
+
+    def seek(self, *args):
+        raise OSError("not seekable")
+
+
+def test_split_text_short_first_chunk():
+    text = "A fairly short opening sentence. " + " ".join(f"Then sentence {i}." for i in range(20))
+    chunks = split_text(text, max_chars=120, first_chars=40)
+    assert len(chunks[0]) <= 40
+    assert all(len(c) <= 120 for c in chunks[1:])
+    assert " ".join(chunks).split() == text.split()
+    assert split_text(text, max_chars=120, first_chars=500) == split_text(text, max_chars=120)
+
+
+def test_wav_writer_to_pipe_keeps_streaming_placeholder(tmp_path):
+    out = _Pipe()
+    writer = WavWriter(out)
+    for i in range(2):
+        writer.append(_wav_file(tmp_path, f"{i}.wav", 0.1))
+    writer.close()
+    wav = out.getvalue()
+    assert struct.unpack('<I', wav[4:8])[0] == 0xFFFFFFFF
+    assert struct.unpack('<I', wav[40:44])[0] == 0xFFFFFFFF
+    assert len(wav) - 44 == writer.data_bytes
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from text2speech_skill.backends import BackendPool, parse_backends
+from text2speech_skill.cli import Text2SpeechClient
+
+URLS = ["http://a/api/v1", "http://b/api/v1", "http://c/api/v1"]
+
+
+def test_parse_backends():
+    assert parse_backends("http://a/api/v1/, local ,http://a/api/v1", "http://localhost/api/v1/") == \
+        ["http://a/api/v1", "http://localhost/api/v1"]
+    assert parse_backends(URLS, "") == URLS
+    with pytest.raises(ValueError):
+        parse_backends(" , ", "")
+
+
+def test_least_outstanding_spreads_jobs():
+    pool = BackendPool(URLS)
+    for i in range(6):
+        pool.assign(f"job{i}", pool.choose())
+    assert [b.outstanding for b in pool.backends] == [2, 2, 2]
+    pool.finish("job1")
+    assert pool.choose() is pool.owner("job1")
+    assert pool.choose(exclude=[pool.owner("job1")]) is pool.backends[0]
+
+
+def test_reserved_slots_spread_racing_submissions():
+    pool = BackendPool(URLS[:2])
+    first, second = pool.choose(reserve=True), pool.choose(reserve=True)
+    assert first is not second
+    pool.assign("job", first, reserved=True)
+    pool.release(second)
+    assert [b.outstanding for b in pool.backends] == [1, 0]
+
+
+def test_latency_strategy_weighs_turnaround():
+    pool = BackendPool(URLS[:2], strategy="latency")
+    pool.backends[0].latency, pool.backends[1].latency = 1.0, 4.0
+    picks = []
+    for i in range(5):
+        backend = pool.choose()
+        pool.assign(f"job{i}", backend)
+        picks.append(backend.url)
+    assert picks.count(URLS[0]) == 4  # 1s * 4 in flight still beats 4s * 1
+    with pytest.raises(ValueError):
+        BackendPool(URLS, strategy="random")
+
+
+def test_failures_eject_until_health_check_passes():
+    pool = BackendPool(URLS[:2], max_failures=2)
+    first = pool.backends[0]
+    pool.mark_failure(first)
+    assert first.available
+    pool.mark_failure(first)
+    assert not first.available
+    assert pool.choose() is pool.backends[1]
+    assert pool.choose(exclude=[pool.backends[1]]) is first  # every backend out: try anyway
+    pool.check_health(lambda backend: True)
+    assert first.available and first.failures == 0
+
+
+def test_model_affinity():
+    pool = BackendPool(URLS)
+    pool.refresh_models(lambda b: {"base"} if b.url == URLS[2] else {"custom_voice"})
+    assert pool.choose(model="base") is pool.backends[2]
+    assert pool.lacking("voice_design") == pool.backends
+    assert pool.cold("voice_design")
+    pool.mark_warming(pool.backends[1], "voice_design")
+    assert not pool.cold("voice_design")
+    assert pool.choose(model="voice_design") is pool.backends[1]
+    assert pool.wanted == {"base", "voice_design"}
+
+
+def test_adopt_keeps_jobs_on_their_backend():
+    pool = BackendPool(URLS[:1])
+    assert pool.adopt("old", "http://b/api/v1/").url == "http://b/api/v1"
+    assert pool.adopt("older").url == URLS[0]
+    assert sorted(pool.in_flight()) == ["old", "older"]
+    pool.finish("old", record_latency=False)
+    assert pool.owner("old").latency is None
+    assert pool.in_flight() == ["older"]
+
+
+def test_jobs_spread_over_live_backends(mock_server, tmp_path):
+    servers = [mock_server(latency="fixed:0.3") for _ in range(2)]
+    client = Text2SpeechClient([s.base_url for s in servers])
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        statuses = list(pool.map(
+            lambda i: client.synthesize("custom", f"text {i}", str(tmp_path / f"{i}.wav"), speaker="vivian"),
+            range(6)))
+    assert all(s["output"] for s in statuses)
+    assert [s.backend.stats["submitted"] for s in servers] == [3, 3]
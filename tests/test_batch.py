@@ -0,0 +1,94 @@
+import json
+import time
+from pathlib import Path
+
+from text2speech_skill import cli
+from text2speech_skill.cli import Text2SpeechClient
+from text2speech_skill.journal import JOURNAL_NAME, BatchJournal
+
+
+def _write_texts(directory, texts):
+    directory.mkdir()
+    for name, text in texts.items():
+        (directory / name).write_text(text, encoding="utf-8")
+
+
+def _report(output_dir):
+    with open(output_dir / "batch_report.json") as f:
+        return {r["file"]: r for r in json.load(f)}
+
+
+def test_batch_speak_writes_every_file(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    _write_texts(tmp_path / "in", {f"{i}.txt": f"text number {i}" for i in range(6)})
+    result = run_cli(server, "batch-speak", str(tmp_path / "in"), str(tmp_path / "out"), "-c", "3")
+    assert result.returncode == 0, result.stderr
+    assert "Complete: 6/6 successful" in result.stdout
+    assert sorted(p.name for p in (tmp_path / "out").glob("*.wav")) == [f"{i}.wav" for i in range(6)]
+
+
+def test_unchanged_files_are_skipped(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    _write_texts(tmp_path / "in", {f"{i}.txt": f"text number {i}" for i in range(4)})
+    args = ("batch-speak", str(tmp_path / "in"), str(tmp_path / "out"), "--no-cache")
+    assert run_cli(server, *args).returncode == 0
+    submitted = server.backend.stats["submitted"]
+
+    (tmp_path / "in" / "0.txt").write_text("an edited text", encoding="utf-8")
+    result = run_cli(server, *args)
+    assert "Complete: 4/4 successful (3 unchanged)" in result.stdout
+    assert server.backend.stats["submitted"] == submitted + 1
+
+
+def test_resume_reattaches_to_journaled_job(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    _write_texts(tmp_path / "in", {"a.txt": "first text", "b.txt": "second text"})
+    out = tmp_path / "out"
+    out.mkdir()
+    # An earlier run submitted a.txt and was killed before it finished
+    client = Text2SpeechClient(server.base_url)
+    job_id = client.custom_voice("first text", "vivian")
+    fingerprint = client.synthesis_key("custom", "first text", speaker="vivian", language="Auto", instruct=None)
+    with BatchJournal(out / JOURNAL_NAME) as journal:
+        journal.record("a.txt", "submitted", fingerprint, job_id=job_id, backend=server.base_url)
+
+    result = run_cli(server, "batch-speak", str(tmp_path / "in"), str(out), "--no-cache")
+    assert result.returncode == 0, result.stderr
+    assert f"re-attaching to {job_id}" in result.stdout
+    assert "Complete: 2/2 successful" in result.stdout
+    assert server.backend.stats["submitted"] == 2  # the journaled job plus b.txt
+    assert not (out / JOURNAL_NAME).exists()  # compacted into the manifest
+
+
+def test_duplicate_texts_fan_out(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    _write_texts(tmp_path / "in", {"a.txt": "same words", "b.txt": "same  words", "c.txt": "other words"})
+    out = tmp_path / "out"
+    result = run_cli(server, "batch-speak", str(tmp_path / "in"), str(out), "--no-cache", "-c", "2")
+    assert result.returncode == 0, result.stderr
+    assert "(1 duplicates)" in result.stdout
+    assert server.backend.stats["submitted"] == 2
+    assert (out / "a.wav").read_bytes() == (out / "b.wav").read_bytes()
+    report = _report(out)
+    assert report["b.txt"]["status"] == "success"
+    assert report["b.txt"]["duplicate_of"] == "a.txt"
+
+
+def test_first_duplicate_in_input_order_leads(mock_server, monkeypatch, tmp_path):
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url)
+    monkeypatch.setattr(cli, "_cli_client", lambda *args: client)
+    _write_texts(tmp_path / "in", {f"{i}.txt": "same words" for i in range(4)})
+    read_text = Path.read_text
+
+    def slow_first(path, *args, **kwargs):
+        if path.name == "0.txt":
+            time.sleep(0.3)
+        return read_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", slow_first)
+    cli.cmd_batch_speak(str(tmp_path / "in"), str(tmp_path / "out"), "vivian", concurrency=4)
+    report = _report(tmp_path / "out")
+    assert "duplicate_of" not in report["0.txt"]
+    assert all(report[f"{i}.txt"]["duplicate_of"] == "0.txt" for i in range(1, 4))
+    assert server.backend.stats["submitted"] == 1
@@ -0,0 +1,37 @@
+import json
+
+from text2speech_skill.bench import percentile, run_level, summarize
+from text2speech_skill.cli import Text2SpeechClient
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([3.0, 1.0, 2.0], 0) == 1.0
+    assert percentile([], 50) is None
+
+
+def test_summarize():
+    assert summarize([1.0, 2.0, 3.0, 4.0]) == {"p50": 2.0, "p95": 4.0, "p99": 4.0, "mean": 2.5}
+    assert summarize([]) == {"p50": None, "p95": None, "p99": None, "mean": None}
+
+
+def test_run_level_reports_phases(mock_server):
+    server = mock_server(workers=4, latency="fixed:0.1")
+    client = Text2SpeechClient(server.base_url)
+    result = run_level(client, "custom", [f"bench text {i}" for i in range(6)], 3, speaker="vivian")
+    assert (result["requests"], result["completed"], result["errors"]) == (6, 6, 0)
+    assert result["latency"]["total"]["p50"] >= 0.1
+    assert result["throughput"]["audio_seconds_per_s"] > 0
+
+
+def test_bench_command_writes_json(mock_server, run_cli, tmp_path):
+    server = mock_server(workers=4)
+    report = tmp_path / "bench.json"
+    result = run_cli(server, "bench", "-c", "1,2", "-n", "3", "--json", str(report))
+    assert result.returncode == 0, result.stderr
+    levels = json.loads(report.read_text())["levels"]
+    assert [level["concurrency"] for level in levels] == [1, 2]
+    assert all(level["completed"] == 3 for level in levels)
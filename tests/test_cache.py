@@ -0,0 +1,76 @@
+import os
+
+from text2speech_skill.cache import SynthesisCache, cache_key
+
+
+def _source(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(os.urandom(size))
+    return path
+
+
+def test_cache_key_ignores_unset_params():
+    assert cache_key("custom", text="hi", speaker="vivian", instruct=None) == \
+        cache_key("custom", speaker="vivian", text="hi")
+    assert cache_key("custom", text="hi") != cache_key("design", text="hi")
+
+
+def test_store_and_fetch(tmp_path):
+    cache = SynthesisCache(tmp_path / "cache")
+    source = _source(tmp_path, "a.wav", 100)
+    assert not cache.fetch("a" * 64, str(tmp_path / "out.wav"))
+    cache.store("a" * 64, str(source))
+    assert cache.fetch("a" * 64, str(tmp_path / "out.wav"))
+    assert (tmp_path / "out.wav").read_bytes() == source.read_bytes()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = SynthesisCache(tmp_path / "cache", max_bytes=300, low_water=1.0)
+    keys = [c * 64 for c in "abc"]
+    for age, key in enumerate(keys):
+        cache.store(key, str(_source(tmp_path, f"{key[0]}.wav", 100)))
+        os.utime(cache._path(key), (1000 + age, 1000 + age))
+    assert cache.fetch(keys[0], str(tmp_path / "out.wav"))  # a is now the most recent
+    cache.store("d" * 64, str(_source(tmp_path, "d.wav", 100)))
+    assert not cache._path(keys[1]).exists()
+    assert all(cache._path(k).exists() for k in (keys[0], keys[2], "d" * 64))
+
+
+def test_restoring_a_key_does_not_inflate_size(tmp_path):
+    cache = SynthesisCache(tmp_path / "cache", max_bytes=10_000)
+    source = _source(tmp_path, "a.wav", 1000)
+    for _ in range(5):
+        cache.store("a" * 64, str(source))
+    cache.store("b" * 64, str(_source(tmp_path, "b.wav", 1000)))
+    assert cache._size == cache.stats()["bytes"] == 2000
+
+
+def test_full_cache_is_not_rescanned_on_every_store(tmp_path, monkeypatch):
+    cache = SynthesisCache(tmp_path / "cache", max_bytes=100 * 100)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+    source = _source(tmp_path, "x.wav", 100)
+    for i in range(300):
+        cache.store(f"{i:064x}", str(source))
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    assert len(scans) <= 25  # about one eviction pass per 10 stores once full
+
+
+def test_clear(tmp_path):
+    cache = SynthesisCache(tmp_path / "cache")
+    cache.store("a" * 64, str(_source(tmp_path, "a.wav", 100)))
+    assert cache.clear()["removed"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_cached_speak_makes_no_requests(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    args = ("speak", "Hello there", "-o", str(tmp_path / "a.wav"))
+    assert run_cli(server, *args).returncode == 0
+    submitted = server.backend.stats["submitted"]
+    result = run_cli(server, "speak", "Hello there", "-o", str(tmp_path / "b.wav"))
+    assert result.returncode == 0, result.stderr
+    assert server.backend.stats["submitted"] == submitted
+    assert (tmp_path / "a.wav").read_bytes() == (tmp_path / "b.wav").read_bytes()
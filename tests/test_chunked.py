@@ -0,0 +1,70 @@
+import io
+import threading
+import time
+
+from text2speech_skill.audio import read_wav_layout, split_text
+from text2speech_skill.cli import Text2SpeechClient
+from text2speech_skill.mock_server import synth_wav
+
+TEXT = " ".join(f"This is sentence number {i}." for i in range(12))
+
+
+def test_chunks_are_stitched_in_order(mock_server, tmp_path):
+    server = mock_server(workers=4)
+    client = Text2SpeechClient(server.base_url)
+    output = tmp_path / "long.wav"
+    status = client.synthesize_chunked("custom", TEXT, str(output), chunk_chars=60, concurrency=4,
+                                       speaker="vivian")
+    assert status["status"] == "completed" and status["chunks"] > 3
+    # The mock's audio length follows the text length, so stitching order shows in the data
+    expected = b"".join(synth_wav(max(0.25, len(chunk) * 0.06))[44:] for chunk in split_text(TEXT, 60))
+    with open(output, "rb") as f:
+        _, offset, size = read_wav_layout(f)
+        f.seek(offset)
+        assert f.read(size) == expected
+
+
+def test_on_chunk_calls_do_not_overlap(mock_server, tmp_path):
+    server = mock_server(workers=8, latency="fixed:0.05")
+    client = Text2SpeechClient(server.base_url)
+    active, overlaps, seen = [0], [], []
+    lock = threading.Lock()
+
+    def on_chunk(i, total, status):
+        with lock:
+            active[0] += 1
+            overlaps.append(active[0] > 1)
+        time.sleep(0.05)
+        seen.append(i)
+        with lock:
+            active[0] -= 1
+
+    client.synthesize_chunked("custom", TEXT, str(tmp_path / "a.wav"), chunk_chars=40, concurrency=8,
+                              on_chunk=on_chunk, speaker="vivian")
+    assert sorted(seen) == list(range(len(seen))) and len(seen) > 4
+    assert not any(overlaps)
+
+
+def test_failed_chunk_fails_the_whole_text(mock_server, tmp_path):
+    server = mock_server(fail_rate=1.0)
+    client = Text2SpeechClient(server.base_url)
+    output = tmp_path / "a.wav"
+    status = client.synthesize_chunked("custom", TEXT, str(output), chunk_chars=60, speaker="vivian")
+    assert status["status"] == "failed" and "chunk" in status["error"]
+    assert not output.exists()
+
+
+def test_stream_writes_chunks_in_order_with_ttfa(mock_server):
+    server = mock_server(workers=4)
+    client = Text2SpeechClient(server.base_url)
+    out = io.BytesIO()
+    order = []
+    result = client.synthesize_stream("custom", TEXT, out, first_chars=30, chunk_chars=80, concurrency=4,
+                                      on_chunk=lambda i, total, status: order.append(i), speaker="vivian")
+    assert result["status"] == "completed"
+    assert order == list(range(result["chunks"]))
+    assert 0 < result["ttfa"] <= result["elapsed"]
+    expected = b"".join(synth_wav(max(0.25, len(chunk) * 0.06))[44:]
+                        for chunk in split_text(TEXT, 80, first_chars=30))
+    _, offset, size = read_wav_layout(io.BytesIO(out.getvalue()))
+    assert out.getvalue()[offset:offset + size] == expected
@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from text2speech_skill import cli
+from text2speech_skill.cli import Text2SpeechClient
+
+
+def _pool(client):
+    pools = client.session.get_adapter(client.base_url).poolmanager.pools
+    (key,) = pools.keys()
+    return pools[key]
+
+
+def test_prewarmed_connection_is_reused(mock_server, tmp_path):
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url)
+    assert client.prewarm()
+    client.synthesize("custom", "hello", str(tmp_path / "a.wav"), speaker="vivian")
+    assert _pool(client).num_connections == 1
+
+
+def test_shared_client_keeps_its_pool(mock_server, monkeypatch):
+    server = mock_server()
+    monkeypatch.setattr(cli, "_shared_clients", {})
+    client = cli.shared_client(server.base_url)
+    assert client.prewarm()
+    assert cli.shared_client(server.base_url, max_connections=40) is client
+    client.get_speakers()
+    assert _pool(client).num_connections == 1
+
+
+def test_concurrent_requests_open_connections_lazily(mock_server):
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(lambda _: client.get_speakers(), range(30)))
+    pool_ = _pool(client)
+    assert 1 <= pool_.num_connections <= 6
+    assert pool_.pool.maxsize == cli.DEFAULT_MAX_CONNECTIONS
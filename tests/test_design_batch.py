@@ -0,0 +1,53 @@
+from text2speech_skill import cli
+from text2speech_skill.cli import Text2SpeechClient
+
+
+def _write_texts(directory, count):
+    directory.mkdir()
+    for i in range(count):
+        (directory / f"{i:02d}.txt").write_text(f"text number {i}", encoding="utf-8")
+
+
+def test_texts_are_grouped_into_jobs(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    _write_texts(tmp_path / "in", 7)
+    result = run_cli(server, "design-batch", str(tmp_path / "in"), str(tmp_path / "out"),
+                     "-d", "warm narrator", "-g", "3")
+    assert result.returncode == 0, result.stderr
+    assert "7 to synthesize in 3 jobs of up to 3" in result.stdout
+    assert "Complete: 7/7 successful" in result.stdout
+    groups = sorted(job.texts for job in server.backend.jobs.values())
+    assert [len(g) for g in groups] == [3, 3, 1]
+    assert sorted(t for g in groups for t in g) == sorted(f"text number {i}" for i in range(7))
+    assert len(list((tmp_path / "out").glob("*.wav"))) == 7
+
+
+def test_every_group_shares_one_design_text(mock_server, monkeypatch, tmp_path):
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url)
+    monkeypatch.setattr(cli, "_cli_client", lambda *args, **kwargs: client)
+    design_texts = []
+    design_clone = client.synthesize_design_clone
+
+    def record(description, texts, outputs, design_text=None, **kwargs):
+        design_texts.append(design_text)
+        return design_clone(description, texts, outputs, design_text=design_text, **kwargs)
+
+    monkeypatch.setattr(client, "synthesize_design_clone", record)
+    _write_texts(tmp_path / "in", 5)
+    cli.cmd_design_batch(str(tmp_path / "in"), str(tmp_path / "out"), "warm narrator", group_size=2)
+    assert design_texts == ["text number 0"] * 3
+
+
+def test_unchanged_texts_are_not_regrouped(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    _write_texts(tmp_path / "in", 4)
+    args = ("design-batch", str(tmp_path / "in"), str(tmp_path / "out"), "-d", "warm narrator", "-g", "2")
+    assert run_cli(server, *args).returncode == 0
+    jobs = len(server.backend.jobs)
+
+    (tmp_path / "in" / "03.txt").write_text("an edited text", encoding="utf-8")
+    result = run_cli(server, *args)
+    assert "1 to synthesize in 1 jobs" in result.stdout
+    assert "Complete: 4/4 successful (3 unchanged)" in result.stdout
+    assert [job.texts for job in list(server.backend.jobs.values())[jobs:]] == [["an edited text"]]
@@ -0,0 +1,35 @@
+import pytest
+import requests
+
+from text2speech_skill.cli import Text2SpeechClient, atomic_write
+
+
+def test_download_is_streamed_into_place(mock_server, tmp_path):
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url, chunk_size=1024)
+    status = client.wait_for_completion(client.custom_voice("a longer sentence to speak", "vivian"))
+    output = tmp_path / "out" / "a.wav"
+    written = client.download_audio(status["audio_url"], str(output), status["job_id"])
+    assert written == output.stat().st_size > 1024
+    assert output.read_bytes()[:4] == b"RIFF"
+    assert not list(output.parent.glob(".*.part"))
+
+
+def test_failed_download_keeps_the_old_file(mock_server, tmp_path):
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url)
+    output = tmp_path / "a.wav"
+    output.write_bytes(b"old")
+    with pytest.raises(requests.HTTPError):
+        client.download_audio("/audio/missing-0.wav", str(output))
+    assert output.read_bytes() == b"old"
+    assert not list(tmp_path.glob(".*.part"))
+
+
+def test_atomic_write_discards_partial_file(tmp_path):
+    output = tmp_path / "a.wav"
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(output)) as f:
+            f.write(b"partial")
+            raise RuntimeError("connection lost")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,56 @@
+import pytest
+
+from text2speech_skill.cli import Text2SpeechClient
+from text2speech_skill.hedge import HedgePolicy
+
+
+def test_no_delay_until_enough_samples():
+    policy = HedgePolicy(min_samples=3, min_delay=0.0)
+    for wait in (1.0, 2.0):
+        policy.record(wait)
+    assert policy.delay() is None
+    policy.record(3.0)
+    assert policy.delay() == 3.0
+
+
+def test_delay_is_the_percentile_wait_at_least_min_delay():
+    policy = HedgePolicy(percentile=90, min_samples=1, min_delay=0.5)
+    for i in range(100):
+        policy.record(i / 10)
+    assert policy.delay() == pytest.approx(9.0)
+    small = HedgePolicy(min_samples=1, min_delay=0.5)
+    small.record(0.01)
+    assert small.delay() == 0.5
+
+
+def test_window_forgets_old_waits():
+    policy = HedgePolicy(percentile=50, min_samples=1, min_delay=0.0, window=4)
+    for wait in (10, 10, 10, 10, 1, 1, 1, 1):
+        policy.record(wait)
+    assert policy.delay() == 1
+
+
+def test_budget_caps_hedged_share():
+    policy = HedgePolicy(max_ratio=0.1)
+    assert policy.allow()  # one hedge is always allowed
+    assert not policy.allow()
+    for _ in range(20):
+        policy.begin()
+    assert policy.allow()
+    assert not policy.allow()
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=100)
+
+
+def test_job_stuck_in_a_queue_is_hedged(mock_server, tmp_path):
+    busy = mock_server(workers=1, latency="fixed:3")
+    idle = mock_server(latency="fixed:0.1")
+    Text2SpeechClient(busy.base_url).custom_voice("blocker", "vivian")
+    hedge = HedgePolicy(min_samples=1, min_delay=0.2)
+    hedge.record(0.0)
+    client = Text2SpeechClient([busy.base_url, idle.base_url], hedge=hedge)
+    status = client.synthesize("custom", "hello", str(tmp_path / "a.wav"), speaker="vivian")
+    assert status["output"] and status["hedged_by"]
+    assert status["timings"]["total"] < 2
+    assert idle.backend.stats["submitted"] == 1
+    assert [job.status for job in busy.backend.jobs.values()][-1] == "cancelled"
@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from text2speech_skill import limits
+from text2speech_skill.limits import AIMDController, RateLimiter, TokenBucket
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(limits.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_token_bucket_allows_burst_then_paces(sleeps):
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.1, abs=0.01)
+    assert bucket.acquire() == pytest.approx(0.2, abs=0.01)
+    assert sleeps == pytest.approx([0.1, 0.2], abs=0.01)
+
+
+def test_token_bucket_goes_into_debt_for_large_requests(sleeps):
+    bucket = TokenBucket(rate=100)
+    assert bucket.acquire(300) == pytest.approx(2.0, abs=0.01)  # 100 in the bucket, 200 owed
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_rate_limiter_charges_both_buckets(sleeps):
+    limiter = RateLimiter(requests_per_second=100, chars_per_second=50)
+    assert limiter.acquire(chars=50) == 0.0
+    assert limiter.acquire(chars=25) == pytest.approx(0.5, abs=0.02)
+    assert RateLimiter().acquire(chars=10 ** 6) == 0.0
+
+
+def _complete(controller, latency=0.1, error=False):
+    controller.acquire()
+    controller.release(latency, error)
+
+
+def test_slow_start_doubles_each_round():
+    controller = AIMDController(initial=2, maximum=32)
+    for expected in (4, 8, 16):
+        for _ in range(int(controller.limit)):
+            _complete(controller)
+        assert controller.limit == expected
+
+
+def test_error_halves_limit_once_per_round():
+    controller = AIMDController(initial=8, maximum=32)
+    for _ in range(4):
+        controller.acquire()
+    controller.release(error=True)
+    assert controller.limit == 4
+    for _ in range(3):
+        controller.release(error=True)  # the jobs already in flight do not cut again
+    assert controller.limit == 4
+    controller.throttle()
+    assert controller.limit == 2
+    for _ in range(3):
+        controller.throttle()
+    assert controller.limit == 1  # never below minimum
+
+
+def test_additive_increase_after_congestion():
+    controller = AIMDController(initial=4, maximum=32)
+    _complete(controller, error=True)
+    assert controller.limit == 2
+    for _ in range(2):
+        _complete(controller)
+    assert controller.limit == pytest.approx(2.9, abs=0.1)  # about +1 per round, not doubling
+
+
+def test_latency_rise_is_congestion():
+    controller = AIMDController(initial=16, maximum=16, smoothing=1.0)
+    for _ in range(3):
+        _complete(controller, latency=0.1)
+    assert controller.limit == 16
+    _complete(controller, latency=5.0)
+    assert controller.limit == 8
+
+
+def test_acquire_blocks_at_limit():
+    controller = AIMDController(initial=1, maximum=1)
+    controller.acquire()
+    entered = threading.Event()
+
+    def second():
+        controller.acquire()
+        entered.set()
+
+    threading.Thread(target=second, daemon=True).start()
+    assert not entered.wait(0.1)
+    controller.release()
+    assert entered.wait(1.0)
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from text2speech_skill.manifest import iter_manifest, parse_row
+
+
+def test_iter_manifest_reports_bad_lines(tmp_path):
+    path = tmp_path / "items.jsonl"
+    path.write_text('{"text": "one"}\n\n# comment\nnot json\n[1]\n', encoding="utf-8")
+    rows = list(iter_manifest(path))
+    assert [lineno for lineno, _ in rows] == [1, 4, 5]
+    assert rows[0][1] == {"text": "one"}
+    assert "invalid JSON" in rows[1][1]["error"]
+    assert rows[2][1] == {"error": "row is not a JSON object"}
+
+
+def test_iter_manifest_csv_drops_empty_cells(tmp_path):
+    path = tmp_path / "items.csv"
+    path.write_text("text,speaker,output\nhello,,a.wav\n", encoding="utf-8")
+    assert list(iter_manifest(path)) == [(2, {"text": "hello", "output": "a.wav"})]
+
+
+def test_parse_row_defaults(tmp_path):
+    item = parse_row({"text": " hi "}, 7, tmp_path, speaker="vivian")
+    assert item == {"kind": "custom", "text": "hi", "output": "line00007.wav",
+                    "params": {"language": "Auto", "speaker": "vivian", "instruct": None}}
+    (tmp_path / "intro.txt").write_text("from a file", encoding="utf-8")
+    item = parse_row({"text_file": "intro.txt", "endpoint": "design", "description": "warm"}, 1, tmp_path)
+    assert (item["text"], item["output"], item["params"]["instruct"]) == ("from a file", "intro.wav", "warm")
+
+
+def test_parse_row_clone_resolves_reference(tmp_path):
+    (tmp_path / "ref.wav").write_bytes(b"RIFF")
+    item = parse_row({"endpoint": "clone", "text": "hi", "ref_audio": "ref.wav", "x_vector_only": "yes"},
+                     1, tmp_path)
+    assert item["params"]["audio_path"] == str(tmp_path / "ref.wav")
+    assert item["params"]["x_vector_only"] is True
+
+
+@pytest.mark.parametrize("row, message", [
+    ({"error": "invalid JSON: x"}, "invalid JSON"),
+    ({"text": "hi", "endpoint": "sing"}, "unknown endpoint"),
+    ({"speaker": "vivian"}, "neither text nor text_file"),
+    ({"text": "   "}, "empty text"),
+    ({"text": "hi", "endpoint": "design"}, "need instruct"),
+    ({"text": "hi", "endpoint": "timbre"}, "need speaker"),
+    ({"text": "hi", "endpoint": "clone"}, "need ref_audio"),
+    ({"text": "hi", "endpoint": "clone", "ref_audio": "missing.wav"}, "not found"),
+    ({"text": "hi", "output": "/tmp/escape.wav"}, "inside the output directory"),
+    ({"text": "hi", "output": "../escape.wav"}, "inside the output directory"),
+    ({"text": "hi", "output": "sub/../../escape.wav"}, "inside the output directory"),
+])
+def test_parse_row_rejects(tmp_path, row, message):
+    with pytest.raises(ValueError, match=message):
+        parse_row(row, 1, tmp_path)
+
+
+def test_parse_row_allows_subdirectories(tmp_path):
+    assert parse_row({"text": "hi", "output": "chapter1/./a.wav"}, 1, tmp_path)["output"] == "chapter1/a.wav"
+
+
+def test_manifest_duplicate_outputs_keep_the_first_row(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    manifest = tmp_path / "items.jsonl"
+    rows = [{"text": f"row {i}", "output": "same.wav"} for i in range(4)]
+    rows.append({"text": "escape", "output": "../escape.wav"})
+    manifest.write_text("\n".join(json.dumps(r) for r in rows), encoding="utf-8")
+    out = tmp_path / "out"
+    result = run_cli(server, "batch-speak", str(manifest), str(out), "--no-cache", "-c", "4")
+    assert "Complete: 1/5 successful" in result.stdout
+    assert list(server.backend.jobs.values())[0].texts == ["row 0"]
+    assert not (tmp_path / "escape.wav").exists()
+    with open(out / "batch_report.json") as f:
+        report = json.load(f)
+    assert [r["status"] for r in report] == ["success", "error", "error", "error", "error"]
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+import requests
+
+from text2speech_skill.mock_server import sample_latency
+
+
+def test_sample_latency_specs():
+    rng = random.Random(1)
+    assert sample_latency("fixed:0.5", rng) == 0.5
+    assert all(0.2 <= sample_latency("uniform:0.2,1", rng) <= 1 for _ in range(50))
+    assert sample_latency("exp:0.5", rng) > 0
+    assert sample_latency("lognormal:-1,0.5", rng) > 0
+    with pytest.raises(ValueError):
+        sample_latency("gamma:1", rng)
+
+
+def test_job_lifecycle(mock_server):
+    server = mock_server(latency="fixed:30")
+    base = server.base_url
+    job_id = requests.post(f"{base}/tts/custom-voice", json={"text": "hi", "speaker": "vivian"}).json()["job_id"]
+    assert requests.get(f"{base}/jobs/{job_id}/status").json()["status"] in ("queued", "running")
+    assert requests.post(f"{base}/jobs/{job_id}/cancel").json()["status"] == "cancelled"
+    assert requests.get(f"{base}/jobs/missing/status").status_code == 404
+
+
+def test_idempotency_key_returns_the_same_job(mock_server):
+    server = mock_server()
+    post = lambda: requests.post(f"{server.base_url}/tts/custom-voice", json={"text": "hi", "speaker": "vivian"},
+                                 headers={"Idempotency-Key": "k1"}).json()["job_id"]
+    assert post() == post()
+    assert server.backend.stats["submitted"] == 1
+
+
+def test_full_queue_answers_429_with_retry_after(mock_server):
+    server = mock_server(workers=1, latency="fixed:30", queue_capacity=1)
+    codes = [requests.post(f"{server.base_url}/tts/custom-voice",
+                           json={"text": f"t{i}", "speaker": "vivian"}) for i in range(4)]
+    assert [r.status_code for r in codes].count(429) >= 2
+    assert next(r for r in codes if r.status_code == 429).headers["Retry-After"] == "1"
+
+
+def test_injected_errors(mock_server):
+    server = mock_server(error_rate=1.0)
+    resp = requests.post(f"{server.base_url}/tts/custom-voice", json={"text": "hi", "speaker": "vivian"})
+    assert resp.status_code == 500
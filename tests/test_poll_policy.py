@@ -0,0 +1,41 @@
+import pytest
+
+from text2speech_skill.cli import Text2SpeechClient
+from text2speech_skill.poller import PollPolicy, retry_after_hint
+
+
+def test_delay_backs_off_to_maximum():
+    policy = PollPolicy(initial=0.1, maximum=1.0, multiplier=2.0, jitter=0.0, use_eta=False)
+    assert [policy.next_delay(a) for a in range(6)] == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+
+def test_jitter_stays_within_bounds():
+    policy = PollPolicy(initial=1.0, maximum=1.0, jitter=0.2, use_eta=False)
+    delays = [policy.next_delay(0) for _ in range(200)]
+    assert all(0.8 <= d <= 1.2 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_progress_eta_pulls_poll_in():
+    policy = PollPolicy(initial=5.0, maximum=5.0, jitter=0.0)
+    samples = [(0.0, 0.2), (1.0, 0.6)]  # 0.4 per second, 0.4 left
+    assert PollPolicy.estimate_remaining(samples) == pytest.approx(1.0)
+    assert policy.next_delay(0, samples) == pytest.approx(1.0)
+    assert PollPolicy.estimate_remaining([(0.0, 0.5), (1.0, 0.5)]) is None
+
+
+def test_retry_hint_is_a_lower_bound():
+    policy = PollPolicy.fixed(0.1)
+    assert policy.next_delay(0, retry_after=2.0) == 2.0
+    assert retry_after_hint({"retry_after": "3"}) == 3.0
+    assert retry_after_hint({"status": "queued"}) is None
+
+
+def test_wait_for_completion(mock_server):
+    server = mock_server(latency="fixed:0.3")
+    client = Text2SpeechClient(server.base_url)
+    job_id = client.custom_voice("hello", "vivian")
+    progress = []
+    status = client.wait_for_completion(job_id, progress_callback=lambda s: progress.append(s["status"]))
+    assert status["status"] == "completed"
+    assert progress[-1] == "completed"
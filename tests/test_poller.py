@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from text2speech_skill.cli import Text2SpeechClient
+from text2speech_skill.poller import JobPoller, PollPolicy
+
+
+def test_jobs_complete(mock_server):
+    server = mock_server(workers=4)
+    client = Text2SpeechClient(server.base_url)
+    job_ids = [client.custom_voice(f"text {i}", "vivian") for i in range(10)]
+    with JobPoller(client) as poller:
+        futures = [poller.track(job_id) for job_id in job_ids]
+        statuses = [f.result(timeout=30) for f in futures]
+    assert [s["status"] for s in statuses] == ["completed"] * 10
+    assert {s["job_id"] for s in statuses} == set(job_ids)
+
+
+def test_bulk_polling_shares_requests(mock_server):
+    server = mock_server(workers=20, latency="uniform:0.5,1.5", seed=1)
+    client = Text2SpeechClient(server.base_url)
+    job_ids = [client.custom_voice(f"text {i}", "vivian") for i in range(40)]
+    with JobPoller(client) as poller:
+        for future in [poller.track(job_id) for job_id in job_ids]:
+            future.result(timeout=30)
+    assert server.backend.stats["status_requests"] < len(job_ids)
+
+
+def test_new_job_wakes_idle_poller(mock_server):
+    server = mock_server(latency="fixed:30")
+    client = Text2SpeechClient(server.base_url, poll_policy=PollPolicy.fixed(10))
+    with JobPoller(client) as poller:
+        poller.track(client.custom_voice("slow", "vivian"))
+        time.sleep(0.3)  # the poller thread is now asleep until the first job is due again
+        polled = []
+        tracked = time.monotonic()
+        poller.track(client.custom_voice("new", "vivian"), progress_callback=lambda s: polled.append(time.monotonic()))
+        deadline = time.monotonic() + 5
+        while not polled and time.monotonic() < deadline:
+            time.sleep(0.02)
+    assert polled and polled[0] - tracked < 1.0
+
+
+def test_failing_callback_fails_only_its_job(mock_server):
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url)
+    with JobPoller(client) as poller:
+        broken = poller.track(client.custom_voice("a", "vivian"), progress_callback=lambda s: 1 / 0)
+        healthy = poller.track(client.custom_voice("b", "vivian"))
+        with pytest.raises(ZeroDivisionError):
+            broken.result(timeout=10)
+        assert healthy.result(timeout=10)["status"] == "completed"
+
+
+def test_close_cancels_tracked_jobs(mock_server):
+    server = mock_server(latency="fixed:30")
+    client = Text2SpeechClient(server.base_url)
+    job_id = client.custom_voice("long", "vivian")
+    poller = JobPoller(client)
+    future = poller.track(job_id)
+    poller.close()
+    assert future.cancelled()
+    assert server.backend.jobs[job_id].status == "cancelled"
+
+
+def test_timeout_cancels_job(mock_server):
+    server = mock_server(latency="fixed:30")
+    client = Text2SpeechClient(server.base_url)
+    job_id = client.custom_voice("long", "vivian")
+    with JobPoller(client) as poller:
+        with pytest.raises(TimeoutError):
+            poller.wait(job_id, timeout=0.5)
+    assert server.backend.jobs[job_id].status == "cancelled"
+
+
+def test_client_close_cancels_in_flight(mock_server):
+    server = mock_server(latency="fixed:30")
+    client = Text2SpeechClient(server.base_url)
+    job_ids = [client.custom_voice(f"long {i}", "vivian") for i in range(3)]
+    client.close()
+    assert [server.backend.jobs[job_id].status for job_id in job_ids] == ["cancelled"] * 3
@@ -0,0 +1,61 @@
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from text2speech_skill.cli import Text2SpeechClient
+from text2speech_skill.retry import RetryPolicy, is_transient, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(formatdate(time.time() + 10, usegmt=True)) == pytest.approx(10, abs=1.5)
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+
+
+def test_delay_backs_off_with_jitter_and_gives_up():
+    policy = RetryPolicy(attempts=4, initial=1.0, maximum=3.0, multiplier=2.0)
+    for attempt, backoff in enumerate([1.0, 2.0, 3.0]):
+        delays = [policy.delay(attempt) for _ in range(100)]
+        assert all(backoff / 2 <= d <= backoff for d in delays)
+    assert policy.delay(3) is None
+    assert RetryPolicy.none().delay(0) is None
+
+
+def test_retry_after_is_a_lower_bound_within_maximum():
+    policy = RetryPolicy(initial=0.1, maximum=5.0)
+    assert policy.delay(0, retry_after=2.0) == 2.0
+    assert policy.delay(0, retry_after=60.0) is None
+
+
+def test_is_transient():
+    def http_error(code):
+        response = requests.Response()
+        response.status_code = code
+        return requests.HTTPError(response=response)
+
+    assert is_transient(requests.ConnectionError())
+    assert is_transient(http_error(429)) and is_transient(http_error(503))
+    assert not is_transient(http_error(404))
+    assert not is_transient(ValueError())
+
+
+def test_submit_retries_reuse_idempotency_key(mock_server):
+    server = mock_server(error_rate=0.5, seed=3)
+    client = Text2SpeechClient(server.base_url, retry=RetryPolicy(attempts=10, initial=0.01, maximum=0.05))
+    keys = []
+    request = client.session.request
+
+    def recording(method, url, **kwargs):
+        if "/tts/" in url:
+            keys.append(kwargs["headers"]["Idempotency-Key"])
+        return request(method, url, **kwargs)
+
+    client.session.request = recording
+    job_ids = [client.custom_voice(f"text {i}", "vivian") for i in range(6)]
+    assert len(keys) > 6
+    assert len(set(keys)) == len(set(job_ids)) == len(server.backend.jobs) == 6
@@ -0,0 +1,81 @@
+import pytest
+
+from text2speech_skill import poller
+from text2speech_skill.cli import Text2SpeechClient
+from text2speech_skill.poller import JobStalled, PollPolicy, StallPolicy, StallWatch
+
+
+def test_window_needs_samples_and_is_clamped():
+    policy = StallPolicy(factor=4, min_window=30, max_window=600, min_samples=3)
+    policy.record_gap(20.0)
+    policy.record_gap(20.0)
+    assert policy.window() is None
+    policy.record_gap(20.0)
+    assert policy.window() == 80.0
+    assert policy.window(longest_gap=50.0) == 200.0
+    assert policy.window(longest_gap=1000.0) == 600.0
+    quick = StallPolicy(min_samples=1, min_window=30)
+    quick.record_gap(0.1)
+    assert quick.window() == 30.0
+
+
+def test_none_never_stalls():
+    policy = StallPolicy.none()
+    for _ in range(10):
+        policy.record_gap(1.0)
+    assert policy.window() is None
+    assert not policy.allow(0)
+
+
+def test_resubmits_are_capped_per_job_and_overall():
+    policy = StallPolicy(max_resubmits=2, budget=0.1)
+    for _ in range(30):
+        policy.begin()
+    assert policy.allow(0) and policy.allow(1)
+    assert not policy.allow(2)
+    assert policy.allow(0)
+    assert not policy.allow(0)  # 3 of 30 jobs spent the budget
+
+
+def test_watch_reports_flat_progress(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(poller.time, "monotonic", lambda: clock[0])
+    policy = StallPolicy(factor=2, min_window=1, min_samples=1)
+    watch = StallWatch(policy)
+    assert watch.observe({"status": "queued"}) is None
+    for progress in (0.1, 0.2, 0.3):
+        assert watch.observe({"status": "running", "progress": progress}) is None
+        clock[0] += 1.0
+    assert policy.gaps == 2 and watch.longest == 1.0
+    clock[0] += 0.5  # flat for 1.5 s, window is 2 s
+    assert watch.observe({"status": "running", "progress": 0.3}) is None
+    clock[0] += 1.0
+    assert watch.observe({"status": "running", "progress": 0.3}) == pytest.approx(2.5)
+    assert StallWatch(None).observe({"status": "running", "progress": 0.3}) is None
+
+
+def _stall_policy(**kwargs):
+    policy = StallPolicy(factor=1, min_window=0.3, min_samples=1, budget=1.0, **kwargs)
+    policy.record_gap(0.1)
+    return policy
+
+
+def test_stalled_job_is_resubmitted_elsewhere(mock_server, tmp_path):
+    stuck = mock_server(stall_rate=1.0, latency="fixed:0.2")
+    healthy = mock_server(latency="fixed:0.2")
+    client = Text2SpeechClient([stuck.base_url, healthy.base_url], poll_policy=PollPolicy.fixed(0.05),
+                               stall=_stall_policy())
+    status = client.synthesize("custom", "hello", str(tmp_path / "a.wav"), speaker="vivian")
+    assert status["output"]
+    assert status["timings"]["resubmits"] == 1
+    assert [job.status for job in stuck.backend.jobs.values()] == ["cancelled"]
+    assert healthy.backend.stats["submitted"] == 1
+
+
+def test_job_that_keeps_stalling_raises(mock_server, tmp_path):
+    server = mock_server(stall_rate=1.0, latency="fixed:0.2")
+    client = Text2SpeechClient(server.base_url, poll_policy=PollPolicy.fixed(0.05),
+                               stall=_stall_policy(max_resubmits=1))
+    with pytest.raises(JobStalled):
+        client.synthesize("custom", "hello", str(tmp_path / "a.wav"), speaker="vivian")
+    assert [job.status for job in server.backend.jobs.values()] == ["cancelled", "cancelled"]
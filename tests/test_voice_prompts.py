@@ -0,0 +1,46 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from text2speech_skill import cli
+from text2speech_skill.audio import silent_wav
+from text2speech_skill.cli import Text2SpeechClient, VoicePrompt
+
+
+def _prompt(i):
+    audio = silent_wav(0.1 + i / 100)
+    return VoicePrompt(hashlib.sha256(audio).hexdigest(), f"ref{i}.wav", audio)
+
+
+def test_concurrent_registrations_all_reach_the_cache(mock_server, monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "VOICE_PROMPT_CACHE", tmp_path / "voice_prompts.json")
+    server = mock_server()
+    client = Text2SpeechClient(server.base_url)
+    prompts = [_prompt(i) for i in range(12)]
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        list(pool.map(client.register_voice_prompt, prompts))
+
+    cached = cli._load_json(cli.VOICE_PROMPT_CACHE, {})[client.base_url]
+    assert cached == {p.cache_key: p.prompt_id for p in prompts}
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_cached_prompt_is_not_uploaded_again(mock_server, monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "VOICE_PROMPT_CACHE", tmp_path / "voice_prompts.json")
+    server = mock_server()
+    first = Text2SpeechClient(server.base_url).register_voice_prompt(_prompt(0))
+    second = Text2SpeechClient(server.base_url).register_voice_prompt(_prompt(0))
+    assert second.prompt_id == first.prompt_id
+    assert len(server.backend.prompts) == 1
+
+
+def test_batch_clone_uploads_reference_once(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    (tmp_path / "in").mkdir()
+    for i in range(4):
+        (tmp_path / "in" / f"{i}.txt").write_text(f"text number {i}", encoding="utf-8")
+    (tmp_path / "ref.wav").write_bytes(silent_wav(0.5))
+    result = run_cli(server, "batch-clone", str(tmp_path / "in"), str(tmp_path / "out"),
+                     "-a", str(tmp_path / "ref.wav"), "-c", "4")
+    assert result.returncode == 0, result.stderr
+    assert "Complete: 4/4 successful" in result.stdout
+    assert len(server.backend.prompts) == 1
@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from text2speech_skill import cli
+from text2speech_skill.cli import Text2SpeechClient
+
+
+def _warm_ups(server):
+    return [job for job in server.backend.jobs.values() if job.texts == ["Hello."]]
+
+
+def test_warm_up_all_sends_one_job_per_cold_backend(mock_server):
+    servers = [mock_server(models=[]) for _ in range(3)]
+    client = Text2SpeechClient([s.base_url for s in servers])
+    assert len(client.warm_up_all("custom")) == 3
+    assert client.warm_up_all("custom") == []
+    assert [len(_warm_ups(s)) for s in servers] == [1, 1, 1]
+
+
+def test_background_warm_up_starts_once(mock_server, monkeypatch):
+    client = Text2SpeechClient([mock_server(models=[]).base_url for _ in range(2)])
+    calls = []
+    monkeypatch.setattr(client, "_warm_up_lacking", calls.append)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: client.warm_up_all("clone", wait=False), range(32)))
+    client.warm_up_all("design", wait=False)
+    assert sorted(calls) == ["clone", "design"]
+
+
+def test_batch_warms_other_backends_once(mock_server, monkeypatch, tmp_path):
+    servers = [mock_server(models=[], load_seconds=0.2) for _ in range(3)]
+    client = Text2SpeechClient([s.base_url for s in servers])
+    monkeypatch.setattr(cli, "_cli_client", lambda *args: client)
+    (tmp_path / "in").mkdir()
+    for i in range(8):
+        (tmp_path / "in" / f"{i}.txt").write_text(f"text number {i}", encoding="utf-8")
+    warm_threads = []
+    in_thread = cli._in_thread
+    monkeypatch.setattr(cli, "_in_thread", lambda func, *args: warm_threads.append(args) or in_thread(func, *args))
+
+    cli.cmd_batch_speak(str(tmp_path / "in"), str(tmp_path / "out"), "vivian", concurrency=4, no_cache=True)
+    assert warm_threads.count(("custom",)) == 1
+    assert sum(len(_warm_ups(s)) for s in servers) <= 2  # nodes that got a real job first need none
+
+
+def test_cached_speak_sends_no_request(mock_server, run_cli, tmp_path):
+    server = mock_server()
+    assert run_cli(server, "speak", "Hello there", "-o", str(tmp_path / "a.wav")).returncode == 0
+    before = dict(server.backend.stats)
+    result = run_cli(server, "speak", "Hello there", "-o", str(tmp_path / "b.wav"))
+    assert result.returncode == 0, result.stderr
+    assert server.backend.stats == before
@@ -1,4 +1,24 @@
 """Text2Speech Skill - Agent skill for Qwen3-TTS text-to-speech operations"""
 
 __version__ = "1.0.0"
-__all__ = ["Text2SpeechClient", "main"]
+__all__ = ["Text2SpeechClient", "AsyncText2SpeechClient", "main", "JobPoller", "PollPolicy",
+           "SynthesisCache", "shared_client"]
+
+# Resolved lazily so `python -m text2speech_skill.cli` does not import cli twice
+_EXPORTS = {
+    "Text2SpeechClient": "cli",
+    "AsyncText2SpeechClient": "aio",
+    "main": "cli",
+    "JobPoller": "poller",
+    "PollPolicy": "poller",
+    "SynthesisCache": "cache",
+    "shared_client": "cli",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+        module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
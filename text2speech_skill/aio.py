@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""Asyncio client for Text2Speech (TTSWeb) API operations"""
+
+import asyncio
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency: pip install text2speech-skill[async]
+    aiohttp = None
+
+from text2speech_skill.cli import API_BASE, DOWNLOAD_CHUNK_SIZE, resolve_audio_url
+from text2speech_skill.poller import TERMINAL_STATUSES, PollPolicy, retry_after_hint
+from text2speech_skill.retry import DEFAULT_TIMEOUTS, RETRY_STATUSES, RetryPolicy, parse_retry_after
+
+
+def _is_transient(error: BaseException) -> bool:
+    """aiohttp counterpart of retry.is_transient: network trouble, timeouts, 429 and 5xx"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError, OSError))
+
+
+def _open_part(output: Path):
+    """Hidden temp file next to output, as cli.atomic_write uses; returns (path, binary file)"""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.{uuid.uuid4().hex}.part")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    return tmp, os.fdopen(fd, 'wb')
+
+
+def _commit_part(f, tmp: Path, output: Path):
+    with f:
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, output)
+
+
+def _discard_part(f, tmp: Path):
+    f.close()
+    try:
+        os.unlink(tmp)
+    except FileNotFoundError:
+        pass
+
+
+class AsyncText2SpeechClient:
+    """Asyncio counterpart of Text2SpeechClient.
+
+    All requests share one aiohttp session whose connector keeps up to
+    `max_connections` keep-alive connections open, so many concurrent jobs can
+    run from a single event loop. Timeouts, retries and idempotency keys work
+    as in Text2SpeechClient._request. Use as `async with AsyncText2SpeechClient() as
+    client:` or call `close()` when done; either cancels jobs still in flight.
+    """
+
+    def __init__(self, base_url: str = API_BASE, poll_policy: Optional[PollPolicy] = None,
+                 max_connections: int = 100, keepalive_timeout: float = 30.0,
+                 chunk_size: int = DOWNLOAD_CHUNK_SIZE, timeouts: Optional[dict] = None,
+                 retry: Optional[RetryPolicy] = None):
+        if aiohttp is None:
+            raise ImportError("AsyncText2SpeechClient requires aiohttp: "
+                              "pip install 'text2speech-skill[async]'")
+        self.base_url = base_url.rstrip('/')
+        self.poll_policy = poll_policy or PollPolicy()
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.chunk_size = chunk_size
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.retry = retry or RetryPolicy()
+        self._session = None
+        self._in_flight = set()  # submitted job ids not yet seen in a terminal status
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections,
+                                             keepalive_timeout=self.keepalive_timeout)
+            # Timeouts are set per request, from the endpoint family (see _request)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=None))
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self.cancel_jobs(list(self._in_flight))
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _request(self, method: str, path: str, family: str, retry: bool = True,
+                       form: Optional[Callable[[], "aiohttp.FormData"]] = None,
+                       **kwargs) -> "aiohttp.ClientResponse":
+        """Send a request with the family's timeouts, retrying transient failures.
+
+        Mirrors Text2SpeechClient._request: connection errors, timeouts, 429
+        and 5xx are retried per self.retry, honouring Retry-After, and the
+        last response is returned for the caller's raise_for_status. POSTs to
+        /tts/* carry one Idempotency-Key across all attempts. `form` builds a
+        multipart body afresh for each attempt, as aiohttp sends a FormData once.
+        """
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        connect, read = self.timeouts[family]
+        kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read))
+        if method == "POST" and path.startswith("/tts/"):
+            kwargs["headers"] = {"Idempotency-Key": uuid.uuid4().hex, **(kwargs.get("headers") or {})}
+        policy = self.retry if retry else RetryPolicy.none()
+        attempt = 0
+        while True:
+            if form is not None:
+                kwargs["data"] = form()
+            try:
+                resp = await self.session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                delay = policy.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if resp.status not in RETRY_STATUSES:
+                    return resp
+                delay = policy.delay(attempt, parse_retry_after(resp.headers.get("Retry-After")))
+                if delay is None:
+                    return resp
+                resp.release()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _get_json(self, path: str):
+        async with await self._request("GET", path, "meta") as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def _post_job(self, path: str, **kwargs) -> str:
+        async with await self._request("POST", path, "submit", **kwargs) as resp:
+            resp.raise_for_status()
+            job_id = (await resp.json())["job_id"]
+        self._in_flight.add(job_id)
+        return job_id
+
+    async def health_check(self) -> dict:
+        """Check API health status"""
+        try:
+            async with await self._request("GET", "/health", "meta", retry=False) as resp:
+                return await resp.json()
+        except Exception as e:
+            return {"error": str(e), "status": "unavailable"}
+
+    async def get_speakers(self) -> List[dict]:
+        """Get available preset speakers"""
+        return await self._get_json("/meta/speakers")
+
+    async def get_languages(self) -> List[dict]:
+        """Get supported languages"""
+        return await self._get_json("/meta/languages")
+
+    async def get_models(self) -> List[dict]:
+        """Get loaded models status"""
+        return await self._get_json("/meta/models")
+
+    async def custom_voice(self, text: str, speaker: str, language: str = "Auto",
+                           instruct: Optional[str] = None) -> str:
+        """Generate speech with preset speaker voice"""
+        payload = {"text": text, "speaker": speaker, "language": language}
+        if instruct:
+            payload["instruct"] = instruct
+        return await self._post_job("/tts/custom-voice", json=payload)
+
+    async def voice_design(self, text: str, instruct: str, language: str = "Auto") -> str:
+        """Generate speech with natural language voice description"""
+        payload = {"text": text, "instruct": instruct, "language": language}
+        return await self._post_job("/tts/voice-design", json=payload)
+
+    async def voice_clone(self, text: str, audio_path: str, language: str = "Auto",
+                          ref_text: Optional[str] = None, x_vector_only: bool = False,
+                          instruct: Optional[str] = None) -> str:
+        """Clone voice from reference audio"""
+        audio = await asyncio.get_running_loop().run_in_executor(None, Path(audio_path).read_bytes)
+
+        def form():
+            data = aiohttp.FormData()
+            data.add_field('audio', audio, filename=Path(audio_path).name)
+            data.add_field('text', text)
+            data.add_field('language', language)
+            data.add_field('x_vector_only_mode', str(x_vector_only).lower())
+            data.add_field('consent_acknowledged', 'true')
+            if ref_text:
+                data.add_field('ref_text', ref_text)
+            if instruct:
+                data.add_field('instruct', instruct)
+            return data
+
+        return await self._post_job("/tts/voice-clone", form=form)
+
+    async def voice_clone_with_timbre(self, text: str, timbre_speaker: str, language: str = "Auto",
+                                      instruct: Optional[str] = None) -> str:
+        """Clone voice using preset timbre (no audio upload)"""
+        payload = {"text": text, "speaker": timbre_speaker, "language": language, "mode": "clone"}
+        if instruct:
+            payload["instruct"] = instruct
+        return await self._post_job("/tts/custom-voice", json=payload)
+
+    async def voice_design_clone(self, design_text: str, design_instruct: str,
+                                 clone_texts: List[str], design_language: str = "Auto",
+                                 clone_language: str = "Auto") -> str:
+        """Design voice then clone to multiple texts"""
+        payload = {
+            "design_text": design_text,
+            "design_instruct": design_instruct,
+            "clone_texts": clone_texts,
+            "design_language": design_language,
+            "clone_language": clone_language
+        }
+        return await self._post_job("/tts/voice-design-clone", json=payload)
+
+    async def get_job_status(self, job_id: str) -> dict:
+        """Get job status (a Retry-After header is surfaced as status["retry_after"])"""
+        async with await self._request("GET", f"/jobs/{job_id}/status", "status", retry=False) as resp:
+            resp.raise_for_status()
+            status = await resp.json()
+            if "Retry-After" in resp.headers and "retry_after" not in status:
+                status["retry_after"] = resp.headers["Retry-After"]
+            if status.get("status") in TERMINAL_STATUSES:
+                self._in_flight.discard(job_id)
+            return status
+
+    async def cancel_job(self, job_id: str, retry: bool = True):
+        """Cancel a running job"""
+        async with await self._request("POST", f"/jobs/{job_id}/cancel", "status", retry=retry) as resp:
+            resp.raise_for_status()
+        self._in_flight.discard(job_id)
+
+    async def cancel_jobs(self, job_ids: List[str]) -> int:
+        """Cancel jobs concurrently, best effort (no retries); returns how many the server accepted"""
+        results = await asyncio.gather(*(self.cancel_job(job_id, retry=False) for job_id in job_ids),
+                                       return_exceptions=True)
+        for job_id in job_ids:
+            self._in_flight.discard(job_id)
+        return sum(1 for r in results if not isinstance(r, BaseException))
+
+    async def wait_for_completion(self, job_id: str, poll_interval: Optional[float] = None,
+                                  timeout: float = 300.0, progress_callback=None) -> dict:
+        """Wait for job completion without blocking the event loop.
+
+        Transient polling errors (network, timeouts, 429, 5xx) count as a
+        missed poll. On timeout the job is cancelled before TimeoutError is raised.
+        """
+        policy = PollPolicy.fixed(poll_interval) if poll_interval else self.poll_policy
+        start = time.monotonic()
+        samples = []
+        attempt = 0
+        while True:
+            try:
+                status = await self.get_job_status(job_id)
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                status = {}
+            if status and progress_callback:
+                progress_callback(status)
+            if status.get("status") in TERMINAL_STATUSES:
+                return status
+            progress = status.get("progress")
+            if isinstance(progress, (int, float)):
+                if samples and progress < samples[-1][1]:
+                    samples = []
+                samples = samples[-4:] + [(time.monotonic(), float(progress))]
+            delay = policy.next_delay(attempt, samples, retry_after_hint(status))
+            attempt += 1
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                await self.cancel_jobs([job_id])
+                raise TimeoutError(f"Job {job_id} timeout")
+            await asyncio.sleep(min(delay, remaining))
+
+    async def _save_response(self, resp, output_path: str) -> int:
+        """Stream resp into output_path atomically; disk writes, fsync and rename run in the executor"""
+        loop = asyncio.get_running_loop()
+        output = Path(output_path)
+        tmp, f = await loop.run_in_executor(None, _open_part, output)
+        written = 0
+        try:
+            async for chunk in resp.content.iter_chunked(self.chunk_size):
+                await loop.run_in_executor(None, f.write, chunk)
+                written += len(chunk)
+            await loop.run_in_executor(None, _commit_part, f, tmp, output)
+        except BaseException:
+            await asyncio.shield(loop.run_in_executor(None, _discard_part, f, tmp))
+            raise
+        return written
+
+    async def download_audio(self, audio_url: str, output_path: str) -> int:
+        """Download audio file (streamed, atomically replaced); returns bytes written"""
+        async with await self._request("GET", resolve_audio_url(self.base_url, audio_url), "download") as resp:
+            resp.raise_for_status()
+            return await self._save_response(resp, output_path)
+
+    async def encode_audio(self, audio_path: str) -> dict:
+        """Encode audio to tokens"""
+        audio = await asyncio.get_running_loop().run_in_executor(None, Path(audio_path).read_bytes)
+
+        def form():
+            data = aiohttp.FormData()
+            data.add_field('audio', audio, filename=Path(audio_path).name)
+            return data
+
+        async with await self._request("POST", "/tokenizer/encode", "tokens", form=form) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def decode_tokens(self, tokens: List[int], output_path: str) -> int:
+        """Decode tokens to audio; returns bytes written"""
+        async with await self._request("POST", "/tokenizer/decode", "tokens", json={"tokens": tokens}) as resp:
+            resp.raise_for_status()
+            return await self._save_response(resp, output_path)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Text chunking and WAV container helpers for long-form synthesis"""
+
+import re
+import struct
+from typing import BinaryIO, List, Optional, Tuple
+
+DEFAULT_CHUNK_CHARS = 400
+DEFAULT_FIRST_CHUNK_CHARS = 80
+
+# Sentence enders (Latin and CJK) plus any closing quotes/brackets that follow them
+_SENTENCE_END = re.compile(r'[^.!?;。！？；…]*(?:[.!?;。！？；…]+["\'”’」』）)\]]*\s*|$)')
+_CLAUSE_END = re.compile(r'[^,，、:：]*(?:[,，、:：]+\s*|$)')
+_PARAGRAPH = re.compile(r'\n\s*\n')
+
+
+def _pieces(pattern: re.Pattern, text: str) -> List[str]:
+    return [m.group(0) for m in pattern.finditer(text) if m.group(0)]
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """Break one over-long sentence at clause punctuation, then hard-wrap"""
+    out = []
+    for clause in _pieces(_CLAUSE_END, sentence):
+        while len(clause) > max_chars:
+            cut = clause.rfind(' ', 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            out.append(clause[:cut])
+            clause = clause[cut:]
+        out.append(clause)
+    return out
+
+
+def _pack(pieces: List[str], max_chars: int) -> List[str]:
+    chunks, current = [], ""
+    for piece in pieces:
+        if current and len(current) + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_text(text: str, max_chars: int = DEFAULT_CHUNK_CHARS,
+               first_chars: Optional[int] = None) -> List[str]:
+    """Split text into chunks of at most max_chars at natural boundaries.
+
+    Paragraphs are never merged; within a paragraph, whole sentences are
+    packed greedily. Sentences longer than max_chars fall back to clause
+    punctuation and finally whitespace. With `first_chars`, the first chunk is
+    limited to that smaller size so its audio is ready sooner.
+    """
+    if first_chars and first_chars < max_chars:
+        head = split_text(text, first_chars)
+        if not head:
+            return []
+        rest = text[text.find(head[0]) + len(head[0]):]
+        return head[:1] + split_text(rest, max_chars)
+
+    chunks = []
+    for paragraph in _PARAGRAPH.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        sentences = []
+        for sentence in _pieces(_SENTENCE_END, paragraph):
+            sentences.extend(_split_long(sentence, max_chars) if len(sentence) > max_chars else [sentence])
+        chunks.extend(_pack(sentences, max_chars))
+    return [c.strip() for c in chunks if c.strip()]
+
+
+def read_wav_layout(f: BinaryIO) -> Tuple[bytes, int, int]:
+    """Return (fmt chunk body, data offset, data size) for a RIFF/WAVE file"""
+    riff, _, wave = struct.unpack('<4sI4s', f.read(12))
+    if riff != b'RIFF' or wave != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE file")
+    fmt = None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("WAV file has no data chunk")
+        chunk_id, size = struct.unpack('<4sI', header)
+        if chunk_id == b'fmt ':
+            fmt = f.read(size)
+            f.read(size & 1)
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise ValueError("WAV data chunk precedes fmt chunk")
+            return fmt, f.tell(), size
+        else:
+            f.seek(size + (size & 1), 1)
+
+
+def wav_duration(path: str) -> float:
+    """Duration in seconds of a WAV file, from its header"""
+    with open(path, 'rb') as f:
+        fmt, _, size = read_wav_layout(f)
+    byte_rate = struct.unpack('<I', fmt[8:12])[0]
+    return size / byte_rate if byte_rate else 0.0
+
+
+def pcm16_wav(data: bytes, sample_rate: int = 24000) -> bytes:
+    """Wrap 16-bit little-endian mono samples in a WAV header"""
+    header = struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 36 + len(data), b'WAVE', b'fmt ', 16, 1, 1,
+                         sample_rate, sample_rate * 2, 2, 16, b'data', len(data))
+    return header + data
+
+
+def silent_wav(seconds: float, sample_rate: int = 24000) -> bytes:
+    """16-bit mono PCM WAV of silence"""
+    return pcm16_wav(bytes(2 * max(1, int(seconds * sample_rate))), sample_rate)
+
+
+class WavWriter:
+    """Append the sample data of WAV files into one WAV stream without re-encoding.
+
+    The header is written from the first input's fmt chunk. All inputs must
+    share that exact format. On seekable outputs `close()` rewrites the RIFF
+    and data sizes. Non-seekable outputs (pipes) keep the maximum-size
+    placeholder that streaming players accept.
+    """
+
+    _PLACEHOLDER = 0xFFFFFFFF
+
+    def __init__(self, out: BinaryIO, block_size: int = 1 << 16):
+        self.out = out
+        self.block_size = block_size
+        self.fmt = None
+        self.data_bytes = 0
+        self._size_offset = None
+
+    def _write_header(self, fmt: bytes):
+        self.fmt = fmt
+        try:
+            start = self.out.tell()
+        except (OSError, ValueError):
+            start = None
+        self.out.write(struct.pack('<4sI4s', b'RIFF', self._PLACEHOLDER, b'WAVE'))
+        self.out.write(struct.pack('<4sI', b'fmt ', len(fmt)) + fmt + b'\0' * (len(fmt) & 1))
+        self.out.write(struct.pack('<4sI', b'data', self._PLACEHOLDER))
+        self._size_offset = start
+
+    def append(self, path: str) -> int:
+        """Copy the data chunk of the WAV at path; returns bytes appended"""
+        with open(path, 'rb') as f:
+            fmt, offset, size = read_wav_layout(f)
+            if self.fmt is None:
+                self._write_header(fmt)
+            elif fmt != self.fmt:
+                raise ValueError(f"WAV format of {path} differs from the first chunk")
+            f.seek(offset)
+            remaining = size
+            while remaining > 0:
+                block = f.read(min(self.block_size, remaining))
+                if not block:
+                    break
+                self.out.write(block)
+                remaining -= len(block)
+            appended = size - remaining
+        self.data_bytes += appended
+        self.out.flush()
+        return appended
+
+    def close(self):
+        """Finalize sizes in the header when the output is seekable"""
+        if self.fmt is None:
+            raise ValueError("No WAV data written")
+        if self.data_bytes & 1:
+            self.out.write(b'\0')
+        if self._size_offset is None:
+            return
+        fmt_len = len(self.fmt) + (len(self.fmt) & 1)
+        end = self.out.tell()
+        self.out.seek(self._size_offset + 4)
+        self.out.write(struct.pack('<I', 4 + 8 + fmt_len + 8 + self.data_bytes + (self.data_bytes & 1)))
+        self.out.seek(self._size_offset + 12 + 8 + fmt_len + 4)
+        self.out.write(struct.pack('<I', self.data_bytes))
+        self.out.seek(end)
+
+
+def concat_wavs(paths: List[str], out: BinaryIO) -> int:
+    """Concatenate WAV files into out in order; returns total data bytes"""
+    writer = WavWriter(out)
+    for path in paths:
+        writer.append(path)
+    writer.close()
+    return writer.data_bytes
@@ -0,0 +1,271 @@
+"""Backend selection for clients spread over several TTSWeb nodes"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Union
+
+ROUTING_STRATEGIES = ("least-outstanding", "latency")
+# Server-side model (as named by /meta/models) each kind of job runs on
+KIND_MODELS = {
+    "custom": "custom_voice",
+    "timbre": "custom_voice",
+    "design": "voice_design",
+    "clone": "base",
+    "design-clone": "voice_design",
+}
+
+
+def parse_backends(value: Union[str, List[str]], local_url: str) -> List[str]:
+    """Backend base URLs from a list or a comma-separated string; "local" stands for local_url"""
+    items = value.split(",") if isinstance(value, str) else list(value)
+    urls = []
+    for item in items:
+        url = item.strip().rstrip("/")
+        if url.lower() == "local":
+            url = local_url.rstrip("/")
+        if url and url not in urls:
+            urls.append(url)
+    if not urls:
+        raise ValueError("no backend URL given")
+    return urls
+
+
+class Backend:
+    """One TTSWeb node: its URL plus the load and health the client has observed"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.latency = None  # EWMA of job turnaround, seconds
+        self.healthy = True
+        self.ejected_until = 0.0
+        self.failures = 0
+        self.bulk_status = None  # POST /jobs/status support; None = not probed yet
+        self.models: Optional[Set[str]] = None  # loaded models per /meta/models; None = unknown
+        self.models_checked = 0.0
+        self.warming: Set[str] = set()  # models a warm-up job was sent for
+
+    def has_model(self, model: str) -> bool:
+        return self.models is not None and (model in self.models or model in self.warming)
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and time.monotonic() >= self.ejected_until
+
+    def __repr__(self):
+        return f"Backend({self.url!r}, outstanding={self.outstanding})"
+
+
+class BackendPool:
+    """Routes submissions across backends and remembers which backend owns each job.
+
+    "least-outstanding" sends each job to the backend with the fewest jobs in
+    flight from this client. "latency" weighs that count by each backend's
+    observed job turnaround. Ties go to the faster backend, then to list
+    order. A backend is ejected for `eject_seconds` after `max_failures`
+    consecutive connection failures, or until its next passing health check
+    after a failing one. When every backend is out, all of them are tried
+    again rather than failing outright.
+
+    A job that needs a particular model goes only to backends that report it
+    loaded (or were sent a warm-up job for it), as long as there are any.
+    Loaded models come from /meta/models and are refreshed every
+    `models_interval` seconds.
+    """
+
+    def __init__(self, urls: List[str], strategy: str = "least-outstanding", eject_seconds: float = 30.0,
+                 max_failures: int = 2, health_interval: float = 30.0, smoothing: float = 0.3,
+                 models_interval: float = 60.0):
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"unknown routing strategy {strategy!r} (expected one of {', '.join(ROUTING_STRATEGIES)})")
+        self.backends = [Backend(url) for url in urls]
+        self.strategy = strategy
+        self.eject_seconds = eject_seconds
+        self.max_failures = max_failures
+        self.health_interval = health_interval
+        self.smoothing = smoothing
+        self.models_interval = models_interval
+        self.wanted: Set[str] = set()  # models jobs were routed for
+        self._owners: Dict[str, Backend] = {}
+        self._started: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._health_thread = None
+
+    def __len__(self):
+        return len(self.backends)
+
+    def choose(self, exclude=(), model: Optional[str] = None, reserve: bool = False) -> Backend:
+        """Best backend for a new job, skipping `exclude` and unavailable ones where possible.
+
+        With `model`, backends that have it loaded are preferred. With
+        `reserve`, the job counts as outstanding from this moment, so
+        submissions racing each other spread out, and the backend counts as
+        warming `model`, since the job will load it there. Follow up with
+        assign(..., reserved=True) or release().
+        """
+        with self._lock:
+            backend = self._choose(exclude, model)
+            if reserve:
+                backend.outstanding += 1
+                if model:
+                    backend.warming.add(model)
+            return backend
+
+    def _choose(self, exclude, model: Optional[str]) -> Backend:
+        """choose() without the lock or reservation"""
+        candidates = [b for b in self.backends if b not in exclude]
+        available = [b for b in candidates if b.available] or candidates or self.backends
+        if model:
+            self.wanted.add(model)
+            available = [b for b in available if b.has_model(model)] or available
+        if len(available) == 1:
+            return available[0]
+        fallback = min(b.latency for b in available if b.latency is not None) \
+            if any(b.latency is not None for b in available) else 1.0
+
+        def score(backend):
+            latency = backend.latency if backend.latency is not None else fallback
+            if self.strategy == "latency":
+                return (latency * (backend.outstanding + 1), self.backends.index(backend))
+            return (backend.outstanding, latency, self.backends.index(backend))
+
+        return min(available, key=score)
+
+    def assign(self, job_id: str, backend: Backend, reserved: bool = False):
+        """Record that backend accepted job_id (reserved: its slot was taken by choose)"""
+        with self._lock:
+            self._owners[job_id] = backend
+            self._started[job_id] = time.monotonic()
+            if not reserved:
+                backend.outstanding += 1
+            backend.failures = 0
+
+    def release(self, backend: Backend):
+        """Give back a slot reserved by choose() for a submission that failed"""
+        with self._lock:
+            backend.outstanding -= 1
+
+    def adopt(self, job_id: str, url: Optional[str] = None) -> Backend:
+        """Take over a job submitted by an earlier run to the backend at `url`.
+
+        A URL no longer configured still gets a Backend, outside the routing
+        set, so the job is polled and cancelled where it runs. Without a URL
+        (journals written before owners were recorded) the first backend is
+        assumed.
+        """
+        if url is None:
+            backend = self.backends[0]
+        else:
+            url = url.rstrip("/")
+            backend = next((b for b in self.backends if b.url == url), None) or Backend(url)
+        self.assign(job_id, backend)
+        return backend
+
+    def owner(self, job_id: Optional[str]) -> Optional[Backend]:
+        with self._lock:
+            return self._owners.get(job_id)
+
+    def in_flight(self) -> List[str]:
+        """Ids of assigned jobs that have not finished"""
+        with self._lock:
+            return list(self._started)
+
+    def finish(self, job_id: str, record_latency: bool = True):
+        """Job reached a terminal status: free its slot and fold its turnaround into the latency estimate.
+
+        The owner stays on record so the job's audio can still be downloaded.
+        Cancelled jobs pass record_latency=False.
+        """
+        with self._lock:
+            started = self._started.pop(job_id, None)
+            backend = self._owners.get(job_id)
+            if started is None or backend is None:
+                return
+            backend.outstanding -= 1
+            if not record_latency:
+                return
+            elapsed = time.monotonic() - started
+            if backend.latency is None:
+                backend.latency = elapsed
+            else:
+                backend.latency += self.smoothing * (elapsed - backend.latency)
+
+    def mark_failure(self, backend: Backend):
+        """Connection to backend failed; eject it after max_failures in a row"""
+        with self._lock:
+            backend.failures += 1
+            if backend.failures >= self.max_failures:
+                backend.ejected_until = time.monotonic() + self.eject_seconds
+
+    def cold(self, model: str) -> bool:
+        """True when every available backend's models are known and none has `model` loaded or warming"""
+        with self._lock:
+            available = [b for b in self.backends if b.available] or self.backends
+            return all(b.models is not None and not b.has_model(model) for b in available)
+
+    def lacking(self, model: str) -> List[Backend]:
+        """Available backends whose models are known and include neither `model` nor a warm-up for it"""
+        with self._lock:
+            available = [b for b in self.backends if b.available] or self.backends
+            return [b for b in available if b.models is not None and not b.has_model(model)]
+
+    def mark_warming(self, backend: Backend, model: str):
+        with self._lock:
+            backend.warming.add(model)
+
+    def start_health_checks(self, check: Callable[[Backend], bool], after: Optional[Callable[[], None]] = None):
+        """Run check(backend) for every backend, then after(), every health_interval seconds in a daemon thread"""
+        with self._lock:
+            if self._health_thread is not None or len(self.backends) < 2:
+                return
+            self._health_thread = threading.Thread(target=self._health_loop, args=(check, after),
+                                                   name="t2s-health", daemon=True)
+            self._health_thread.start()
+
+    def check_health(self, check: Callable[[Backend], bool]):
+        """Probe all backends concurrently and update their healthy flags"""
+        def probe(backend):
+            healthy = check(backend)
+            with self._lock:
+                backend.healthy = healthy
+                if healthy:
+                    backend.failures = 0
+                    backend.ejected_until = 0.0
+
+        self._each(probe, self.backends)
+
+    def refresh_models(self, fetch: Callable[[Backend], Optional[Set[str]]], max_age: Optional[float] = None):
+        """Update loaded models, via fetch(backend), for backends checked more than max_age seconds ago.
+
+        With max_age None, only backends never checked are fetched. A failed
+        fetch (None) leaves the models unknown until the next refresh.
+        """
+        now = time.monotonic()
+        stale = [b for b in self.backends
+                 if not b.models_checked or (max_age is not None and now - b.models_checked >= max_age)]
+
+        def update(backend):
+            models = fetch(backend)
+            with self._lock:
+                backend.models = models
+                backend.models_checked = time.monotonic()
+                if models:
+                    backend.warming -= models
+
+        self._each(update, stale)
+
+    @staticmethod
+    def _each(func: Callable[[Backend], None], backends: List[Backend]):
+        """Run func(backend) for all backends concurrently and wait for them"""
+        threads = [threading.Thread(target=func, args=(b,), daemon=True) for b in backends]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _health_loop(self, check: Callable[[Backend], bool], after: Optional[Callable[[], None]]):
+        while True:
+            self.check_health(check)
+            if after:
+                after()
+            time.sleep(self.health_interval)
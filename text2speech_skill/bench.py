@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Load generation and latency percentiles for a TTSWeb backend"""
+
+import math
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from text2speech_skill.audio import wav_duration
+
+PHASES = ("submit", "queue", "synthesis", "download", "total")
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile; None for an empty list"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values: List[float]) -> dict:
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "mean": sum(values) / len(values) if values else None,
+    }
+
+
+def run_job(client, kind: str, text: str, output_path: str, **params) -> dict:
+    """Run one job through client.synthesize and flatten its timings into phases"""
+    status = client.synthesize(kind, text, output_path, **params)
+    t = status["timings"]
+    record = {"job_id": t["job_id"], "status": status["status"], "chars": len(text),
+              "submit": t["submit_rtt"]}
+    if not status.get("output"):
+        record["error"] = status.get("error", "Unknown")
+        return record
+    record.update(queue=t["queue_wait"], synthesis=t["synthesis"], download=t["download_seconds"],
+                  total=t["total"], bytes=t["download_bytes"], polls=t["polls"],
+                  audio_seconds=wav_duration(output_path))
+    return record
+
+
+def run_level(client, kind: str, texts: List[str], concurrency: int,
+              rate: Optional[float] = None, **params) -> dict:
+    """Run len(texts) jobs at the given concurrency (optionally paced to `rate` submits/s)"""
+    pace_lock = threading.Lock()
+    next_slot = [time.monotonic()]
+
+    with tempfile.TemporaryDirectory(prefix="t2s-bench-") as tmp_dir:
+        def one(i):
+            if rate:
+                with pace_lock:
+                    slot = next_slot[0]
+                    next_slot[0] = max(slot, time.monotonic()) + 1.0 / rate
+                time.sleep(max(0.0, slot - time.monotonic()))
+            try:
+                return run_job(client, kind, texts[i], str(Path(tmp_dir) / f"{i}.wav"), **params)
+            except Exception as e:
+                return {"status": "error", "error": str(e), "chars": len(texts[i])}
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            records = list(pool.map(one, range(len(texts))))
+        wall = time.monotonic() - start
+
+    ok = [r for r in records if "total" in r]
+    return {
+        "concurrency": concurrency,
+        "rate": rate,
+        "requests": len(records),
+        "completed": len(ok),
+        "errors": len(records) - len(ok),
+        "wall_seconds": wall,
+        "latency": {phase: summarize([r[phase] for r in ok]) for phase in PHASES},
+        "throughput": {
+            "jobs_per_s": len(ok) / wall if wall else 0.0,
+            "chars_per_s": sum(r["chars"] for r in ok) / wall if wall else 0.0,
+            "audio_seconds_per_s": sum(r["audio_seconds"] for r in ok) / wall if wall else 0.0,
+        },
+        "error_samples": sorted({r["error"] for r in records if "error" in r})[:5],
+    }
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Content-addressed on-disk cache of synthesized audio"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path(os.environ.get("TEXT2SPEECH_CACHE_DIR", Path.home() / ".cache" / "text2speech"))
+DEFAULT_MAX_BYTES = int(os.environ.get("TEXT2SPEECH_CACHE_MAX_BYTES", 1 << 30))
+
+
+def cache_key(endpoint: str, **params) -> str:
+    """Stable hash of an endpoint plus the parameters that determine its audio"""
+    fields = {k: v for k, v in params.items() if v is not None}
+    blob = json.dumps({"endpoint": endpoint, **fields}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SynthesisCache:
+    """Size-bounded LRU cache of WAV files keyed by `cache_key`.
+
+    Entries live under `root/objects/<aa>/<key>.wav`. Recency is the file
+    mtime, which is bumped on every hit, so eviction needs no separate index
+    and several processes can share one cache directory. Hits are copied out
+    by default; `link=True` hardlinks instead, which is only safe when outputs
+    are never rewritten in place. A store that overflows max_bytes evicts
+    down to `low_water` of it, so a full cache is not rescanned on every store.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 link: bool = False, low_water: float = 0.9):
+        self.root = Path(root) if root else CACHE_DIR / "audio"
+        self.max_bytes = max_bytes
+        self.link = link
+        self.low_water = low_water
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # running estimate, computed on first store
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / "objects" / key[:2] / f"{key}.wav"
+
+    def _entries(self):
+        objects = self.root / "objects"
+        if not objects.is_dir():
+            return []
+        entries = []
+        for path in objects.glob("*/*.wav"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Materialize a cached entry at output_path; False on a miss"""
+        path = self._path(key)
+        if not path.exists():
+            self.misses += 1
+            return False
+        output = Path(output_path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output.with_name(f".{output.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if self.link:
+                try:
+                    os.link(path, tmp)
+                except OSError:
+                    shutil.copyfile(path, tmp)
+            else:
+                shutil.copyfile(path, tmp)
+            os.replace(tmp, output)
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another process between exists() and link
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key: str, source_path: str):
+        """Copy a finished WAV into the cache, evicting old entries if needed"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copyfile(source_path, tmp)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp, path)
+        size = path.stat().st_size
+        with self._lock:
+            if self._size is None:
+                self._size = sum(e[1] for e in self._entries())
+            else:
+                self._size += size - replaced
+            over = self._size > self.max_bytes
+        if over:
+            self.prune(int(self.max_bytes * self.low_water))
+
+    def prune(self, max_bytes: Optional[int] = None) -> dict:
+        """Evict least recently used entries until the cache fits max_bytes"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(e[1] for e in entries)
+        removed = freed = 0
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+            freed += size
+        with self._lock:
+            self._size = total
+        return {"removed": removed, "freed_bytes": freed, "bytes": total}
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        return {
+            "root": str(self.root),
+            "entries": len(entries),
+            "bytes": sum(e[1] for e in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self) -> dict:
+        return self.prune(0)
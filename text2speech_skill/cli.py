@@ -4,85 +4,606 @@
 import argparse
 import json
 import requests
+import socket
 import sys
 import os
 from pathlib import Path
-from typing import Optional, List, BinaryIO
+from typing import Optional, List, BinaryIO, Callable, Dict, Set, Tuple, Union
 import time
 import base64
-
-API_BASE = "https://mc.agaii.org/TTS/api/v1"
+import hashlib
+import threading
+import tempfile
+import shutil
+import signal
+import unicodedata
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+if __package__ in (None, ""):
+    # Allow running this file directly as a script (the npm wrapper does)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from text2speech_skill.audio import (DEFAULT_CHUNK_CHARS, DEFAULT_FIRST_CHUNK_CHARS, WavWriter,
+                                     concat_wavs, silent_wav, split_text)
+from text2speech_skill.bench import PHASES, run_level
+from text2speech_skill.backends import KIND_MODELS, Backend, BackendPool, parse_backends
+from text2speech_skill.cache import CACHE_DIR, SynthesisCache, cache_key
+from text2speech_skill.hedge import HedgePolicy
+from text2speech_skill.journal import JOURNAL_NAME, BatchJournal
+from text2speech_skill.limits import AIMDController, RateLimiter
+from text2speech_skill.manifest import MANIFEST_SUFFIXES, iter_manifest, parse_row
+from text2speech_skill.poller import (TERMINAL_STATUSES, JobPoller, JobStalled, PollPolicy, StallPolicy,
+                                      StallWatch, retry_after_hint)
+from text2speech_skill.retry import DEFAULT_TIMEOUTS, RETRY_STATUSES, RetryPolicy, is_transient, parse_retry_after
+
+# One base URL, or several separated by commas to spread jobs over nodes
+# ("local" stands for LOCAL_API)
+API_BASE = os.environ.get("TEXT2SPEECH_API_BASE", "https://mc.agaii.org/TTS/api/v1")
 LOCAL_API = "http://localhost:24536/api/v1"
+ROUTING = os.environ.get("TEXT2SPEECH_ROUTING", "least-outstanding")
+VOICE_PROMPT_CACHE = CACHE_DIR / "voice_prompts.json"
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+# Pooled keep-alive connections per host. urllib3 opens them lazily, so a
+# generous size costs nothing until that many requests are in flight.
+DEFAULT_MAX_CONNECTIONS = 64
+# `-c auto` on batch commands: AIMD-controlled, up to MAX_AUTO_CONCURRENCY in flight
+AUTO_CONCURRENCY = 0
+MAX_AUTO_CONCURRENCY = 32
+# Commands that always talk to the server, so a connection is warmed up while
+# arguments are parsed. Synthesis and batch commands are left out: they may be
+# served from the local cache or journal without any request.
+PREWARM_COMMANDS = {"encode", "decode", "status", "speakers", "languages"}
+
+
+def resolve_audio_url(base_url: str, audio_url: str) -> str:
+    """Turn a job's audio_url (absolute, rooted or relative) into a full URL"""
+    if audio_url.startswith('/'):
+        # Remove /api/v1 prefix if base_url already has it
+        if audio_url.startswith('/api/v1') and base_url.endswith('/api/v1'):
+            audio_url = audio_url[7:]  # Remove /api/v1 prefix
+        return f"{base_url}{audio_url}"
+    if not audio_url.startswith('http'):
+        return f"{base_url}/{audio_url}"
+    return audio_url
+
+
+@contextmanager
+def atomic_write(output_path: str):
+    """Yield a binary file that replaces output_path only once fully written.
+
+    Data goes to a hidden temp file in the target directory, is fsynced, and
+    is renamed over output_path, so a crash never leaves a partial file.
+    """
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.{uuid.uuid4().hex}.part")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, output)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _sha256_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Hex sha256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# One lock for every read-modify-write of VOICE_PROMPT_CACHE; per-prompt locks do not cover other prompts
+_voice_prompt_cache_lock = threading.Lock()
+
+
+def _load_json(path: Path, default):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _save_json(path: Path, data):
+    """Write JSON via a temp file + rename so readers never see a partial file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+class VoicePrompt:
+    """Reusable reference-audio handle for repeated voice cloning.
+
+    When a backend supports registered prompts, `prompt_ids[backend_url]`
+    identifies its server-side copy and no audio is sent per clone. Otherwise
+    the prompt is a local stand-in that keeps the reference bytes in memory so
+    they are read from disk only once.
+    """
+
+    def __init__(self, audio_hash: str, filename: str, audio: bytes,
+                 ref_text: Optional[str] = None, x_vector_only: bool = False):
+        self.audio_hash = audio_hash
+        self.filename = filename
+        self.audio = audio
+        self.ref_text = ref_text
+        self.x_vector_only = x_vector_only
+        self.prompt_ids: Dict[str, Optional[str]] = {}  # backend URL -> id (None: no registry)
+        self.lock = threading.Lock()
+
+    @property
+    def registered(self) -> bool:
+        """True once registration was attempted on any backend"""
+        return bool(self.prompt_ids)
+
+    @property
+    def prompt_id(self) -> Optional[str]:
+        """A server-side prompt id, if any backend issued one"""
+        return next((i for i in self.prompt_ids.values() if i), None)
+
+    @classmethod
+    def from_file(cls, audio_path: str, ref_text: Optional[str] = None,
+                  x_vector_only: bool = False) -> "VoicePrompt":
+        """Local, not yet registered prompt (no network)"""
+        audio = Path(audio_path).read_bytes()
+        return cls(hashlib.sha256(audio).hexdigest(), Path(audio_path).name, audio, ref_text, x_vector_only)
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.audio_hash}:{self.ref_text or ''}:{str(self.x_vector_only).lower()}"
+
+
+class JobTimings:
+    """Per-job phase timings recorded by Text2SpeechClient.synthesize.
+
+    Client-side marks use a monotonic clock and are reported in seconds since
+    submission started. When the server reports created/started/completed
+    timestamps, queue_wait and synthesis come from those instead of poll
+    observations. If the job stalled and was resubmitted, the phases describe
+    the last attempt and `stalls` lists the abandoned jobs.
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.job_id = None
+        self.cached = False
+        self.polls = 0
+        self.download_bytes = 0
+        self.download_seconds = None
+        self.server = {}
+        self.stalls = []
+        self._start = time.monotonic()
+        self._submitted = None
+        self._running = None
+        self._done = None
+        self._end = None
+
+    def _since_start(self, mark: Optional[float]) -> Optional[float]:
+        return None if mark is None else mark - self._start
+
+    def mark_submitted(self, job_id: str):
+        self.job_id = job_id
+        self._submitted = time.monotonic()
+
+    def mark_resubmitted(self, stalled_job: str, stalled_for: float, job_id: str):
+        """stalled_job was cancelled after stalled_for seconds without progress and replaced by job_id"""
+        self.stalls.append({"job_id": stalled_job, "stalled_for": round(stalled_for, 3)})
+        self.server = {}
+        self._running = None
+        self.mark_submitted(job_id)
+
+    def observe(self, status: dict):
+        """Record one status poll"""
+        self.polls += 1
+        if self._running is None and status.get("status") == "running":
+            self._running = time.monotonic()
+        for key in ("created_at", "started_at", "completed_at"):
+            if status.get(key) is not None:
+                self.server[key] = status[key]
+
+    def mark_done(self):
+        self._done = time.monotonic()
+
+    def mark_downloaded(self, nbytes: int):
+        self.download_bytes = nbytes
+        self.download_seconds = time.monotonic() - self._done
+
+    def finish(self):
+        self._end = time.monotonic()
+
+    def _server_span(self, start_key: str, end_key: str) -> Optional[float]:
+        try:
+            return max(0.0, float(self.server[end_key]) - float(self.server[start_key]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def to_dict(self) -> dict:
+        submit_rtt = self._since_start(self._submitted)
+        running = self._running if self._running is not None else self._done
+        queue_wait = self._server_span("created_at", "started_at")
+        if queue_wait is None and running is not None and self._submitted is not None:
+            queue_wait = running - self._submitted
+        synthesis = self._server_span("started_at", "completed_at")
+        if synthesis is None and running is not None and self._done is not None:
+            synthesis = self._done - running
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "cached": self.cached,
+            "submit_rtt": submit_rtt,
+            "time_to_running": self._since_start(self._running),
+            "time_to_completion": self._since_start(self._done),
+            "queue_wait": queue_wait,
+            "synthesis": synthesis,
+            "download_bytes": self.download_bytes,
+            "download_seconds": self.download_seconds,
+            "polls": self.polls,
+            "resubmits": len(self.stalls),
+            "stalls": self.stalls,
+            "total": self._since_start(self._end),
+        }
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets use TCP keep-alive, so idle pooled connections survive NAT/LB timeouts"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        super().init_poolmanager(*args, **kwargs)
 
 
 class Text2SpeechClient:
     """Client for Text2Speech (TTSWeb) API operations"""
 
-    def __init__(self, base_url: str = API_BASE):
-        self.base_url = base_url.rstrip('/')
+    def __init__(self, base_url: Union[str, List[str]] = API_BASE, poll_policy: Optional[PollPolicy] = None,
+                 cache: Optional[SynthesisCache] = None, chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+                 on_timings: Optional[Callable[[JobTimings], None]] = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS, timeouts: Optional[dict] = None,
+                 retry: Optional[RetryPolicy] = None, rate_limiter: Optional[RateLimiter] = None,
+                 on_throttle: Optional[Callable[[], None]] = None, routing: str = ROUTING,
+                 hedge: Optional[HedgePolicy] = None, stall: Optional[StallPolicy] = None):
+        # base_url: one URL, a comma-separated string or a list of backends.
+        # Submissions are routed by self.backends; a job's status, cancel and
+        # audio requests go to the backend that accepted it.
+        self.backends = BackendPool(parse_backends(base_url, LOCAL_API), strategy=routing)
+        self.hedge = hedge  # hedged requests in synthesize(); needs two or more backends
+        self._local = threading.local()
+        self._warmed: Set[str] = set()  # kinds warm_up_all ran for
+        self.base_url = self.backends.backends[0].url
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.on_throttle = on_throttle
         self.session = requests.Session()
+        self.max_connections = max_connections
+        adapter = _KeepAliveAdapter(pool_connections=max(4, len(self.backends)), pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._warm_lock = threading.Lock()
+        self.poll_policy = poll_policy or PollPolicy()
+        self.stall = stall or StallPolicy()  # StallPolicy.none() turns stall detection off
+        self.cache = cache
+        self.chunk_size = chunk_size
+        self.on_timings = on_timings
+
+    def prewarm(self) -> bool:
+        """Resolve DNS and finish the TCP/TLS handshake before the first real request.
+
+        The connection goes back to the pool for the next call to reuse.
+        """
+        try:
+            self._request("GET", "/health", "meta", retry=False).close()
+            return True
+        except requests.RequestException:
+            return False
+
+    def _request(self, method: str, path: str, family: str, retry: bool = True, chars: int = 0,
+                 backend: Optional[Backend] = None, **kwargs) -> requests.Response:
+        """Send a request with the family's timeouts, retrying transient failures.
+
+        `path` is relative to `backend` (default: the first backend) unless it is a full URL. Connection
+        errors, timeouts, 429 and 5xx are retried per self.retry. The last
+        response is returned as is for the caller's raise_for_status. POSTs to
+        /tts/* carry an Idempotency-Key that stays the same across retries, so
+        a retried submission cannot start a second job. Every submit attempt
+        first passes self.rate_limiter, which is charged `chars` characters,
+        and a 429/503 answer is reported to self.on_throttle.
+        """
+        url = path if path.startswith("http") else f"{backend.url if backend else self.base_url}{path}"
+        kwargs.setdefault("timeout", self.timeouts[family])
+        if method == "POST" and path.startswith("/tts/"):
+            kwargs["headers"] = {"Idempotency-Key": uuid.uuid4().hex, **(kwargs.get("headers") or {})}
+        policy = self.retry if retry else RetryPolicy.none()
+        attempt = 0
+        while True:
+            if self.rate_limiter and family == "submit":
+                self.rate_limiter.acquire(chars)
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = policy.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if resp.status_code in (429, 503) and self.on_throttle:
+                    self.on_throttle()
+                if resp.status_code not in RETRY_STATUSES:
+                    return resp
+                delay = policy.delay(attempt, parse_retry_after(resp.headers.get("Retry-After")))
+                if delay is None:
+                    return resp
+                resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _save_stream(self, resp, output_path: str) -> int:
+        """Stream a response body to output_path atomically; returns bytes written"""
+        written = 0
+        with atomic_write(output_path) as f:
+            for chunk in resp.iter_content(chunk_size=self.chunk_size):
+                f.write(chunk)
+                written += len(chunk)
+        return written
 
     def health_check(self) -> dict:
         """Check API health status"""
         try:
-            resp = self.session.get(f"{self.base_url}/health", timeout=5)
+            resp = self._request("GET", "/health", "meta", retry=False)
             return resp.json()
         except Exception as e:
             return {"error": str(e), "status": "unavailable"}
 
     def get_speakers(self) -> List[dict]:
         """Get available preset speakers"""
-        resp = self.session.get(f"{self.base_url}/meta/speakers")
+        resp = self._request("GET", "/meta/speakers", "meta")
         resp.raise_for_status()
         return resp.json()
 
     def get_languages(self) -> List[dict]:
         """Get supported languages"""
-        resp = self.session.get(f"{self.base_url}/meta/languages")
+        resp = self._request("GET", "/meta/languages", "meta")
         resp.raise_for_status()
         return resp.json()
 
     def get_models(self) -> List[dict]:
         """Get loaded models status"""
-        resp = self.session.get(f"{self.base_url}/meta/models")
+        resp = self._request("GET", "/meta/models", "meta")
         resp.raise_for_status()
         return resp.json()
 
+    def _route(self, attempt: Callable[[Backend], str], kind: Optional[str] = None) -> str:
+        """Run attempt(backend) on the best backend and record it as the job's owner.
+
+        Backends with the model for `kind` loaded are preferred; their loaded
+        models are fetched before the first such job. A backend that refuses
+        connections is marked failed, and the job goes to the next one. Other
+        errors, including read timeouts (the job may already exist), are
+        raised as is.
+        """
+        model = KIND_MODELS.get(kind)
+        if len(self.backends) > 1:
+            self.backends.start_health_checks(self._backend_healthy, after=self._maintain_models)
+            if model:
+                self.backends.refresh_models(self._fetch_models)
+        tried = list(getattr(self._local, "avoid", ()))
+        while True:
+            backend = self.backends.choose(exclude=tried, model=model, reserve=True)
+            try:
+                job_id = attempt(backend)
+            except requests.ConnectionError:
+                self.backends.release(backend)
+                self.backends.mark_failure(backend)
+                tried.append(backend)
+                if len(tried) >= len(self.backends):
+                    raise
+                continue
+            except BaseException:
+                self.backends.release(backend)
+                raise
+            self.backends.assign(job_id, backend, reserved=True)
+            return job_id
+
+    def _backend_healthy(self, backend: Backend) -> bool:
+        try:
+            resp = self._request("GET", "/health", "meta", retry=False, backend=backend)
+            return resp.ok and resp.json().get("status") != "unavailable"
+        except (requests.RequestException, ValueError):
+            return False
+
+    def _fetch_models(self, backend: Backend) -> Optional[set]:
+        """Names of the models backend reports loaded, or None if it cannot say"""
+        try:
+            resp = self._request("GET", "/meta/models", "meta", retry=False, backend=backend)
+            resp.raise_for_status()
+            return {m["name"] for m in resp.json() if m.get("loaded")}
+        except (requests.RequestException, ValueError, KeyError, TypeError):
+            return None
+
+    def _maintain_models(self):
+        """Refresh stale model lists and warm up models jobs need that no backend has loaded"""
+        self.backends.refresh_models(self._fetch_models, max_age=self.backends.models_interval)
+        for kind in sorted({k for k, m in KIND_MODELS.items() if m in self.backends.wanted}):
+            self.warm_up(kind)
+
+    def warm_up(self, kind: str) -> Optional[str]:
+        """Send a tiny throwaway job so a backend loads the model `kind` jobs need.
+
+        `kind` is one of custom, timbre, design, clone or design-clone. Nothing
+        is sent when a backend already has the model loaded (or is warming
+        it up), or when no backend reports its models. Returns the warm-up
+        job's id, if one was sent.
+        """
+        model = KIND_MODELS[kind]
+        self.backends.refresh_models(self._fetch_models)
+        if not self.backends.cold(model):
+            return None
+        return self._send_warm_up(self.backends.choose(model=model), model)
+
+    def warm_up_all(self, kind: str, wait: bool = True) -> List[str]:
+        """Warm up the model for `kind` on every available backend that lacks it, once per client.
+
+        For batches, whose jobs spread over all backends: call it at the
+        first submission, so the later backends load in parallel with the
+        first. Returns the warm-up jobs' ids. With wait=False the warm-ups
+        are sent from a background thread, started only by the first call
+        for `kind`, and nothing is returned.
+        """
+        with self._warm_lock:
+            if kind in self._warmed:
+                return []
+            self._warmed.add(kind)
+        if not wait:
+            _in_thread(self._warm_up_lacking, kind)
+            return []
+        return self._warm_up_lacking(kind)
+
+    def _warm_up_lacking(self, kind: str) -> List[str]:
+        model = KIND_MODELS[kind]
+        self.backends.refresh_models(self._fetch_models)
+        job_ids = [self._send_warm_up(backend, model) for backend in self.backends.lacking(model)]
+        return [job_id for job_id in job_ids if job_id]
+
+    def _send_warm_up(self, backend: Backend, model: str) -> Optional[str]:
+        if model == "base":
+            request = {"path": "/tts/voice-clone", "files": {"audio": ("warmup.wav", silent_wav(1.0))},
+                       "data": {"text": "Hello.", "x_vector_only_mode": "true", "consent_acknowledged": "true"}}
+        elif model == "voice_design":
+            request = {"path": "/tts/voice-design", "json": {"text": "Hello.", "instruct": "A calm, neutral voice."}}
+        else:
+            request = {"path": "/tts/custom-voice", "json": {"text": "Hello.", "speaker": "vivian"}}
+        try:
+            job_id = self._post_job(backend, **request)
+        except requests.RequestException:
+            return None
+        self.backends.mark_warming(backend, model)
+        return job_id
+
+    def _post_job(self, backend: Backend, path: str, chars: int = 0, **kwargs) -> str:
+        resp = self._request("POST", path, "submit", chars=chars, backend=backend, **kwargs)
+        resp.raise_for_status()
+        return resp.json()["job_id"]
+
     def custom_voice(self, text: str, speaker: str, language: str = "Auto", instruct: Optional[str] = None) -> str:
         """Generate speech with preset speaker voice"""
         payload = {"text": text, "speaker": speaker, "language": language}
         if instruct:
             payload["instruct"] = instruct
-        resp = self.session.post(f"{self.base_url}/tts/custom-voice", json=payload)
-        resp.raise_for_status()
-        return resp.json()["job_id"]
+        return self._route(lambda b: self._post_job(b, "/tts/custom-voice", len(text), json=payload), "custom")
 
     def voice_design(self, text: str, instruct: str, language: str = "Auto") -> str:
         """Generate speech with natural language voice description"""
         payload = {"text": text, "instruct": instruct, "language": language}
-        resp = self.session.post(f"{self.base_url}/tts/voice-design", json=payload)
-        resp.raise_for_status()
-        return resp.json()["job_id"]
+        return self._route(lambda b: self._post_job(b, "/tts/voice-design", len(text), json=payload), "design")
 
     def voice_clone(self, text: str, audio_path: str, language: str = "Auto",
                     ref_text: Optional[str] = None, x_vector_only: bool = False,
                     instruct: Optional[str] = None) -> str:
         """Clone voice from reference audio"""
-        with open(audio_path, 'rb') as f:
-            files = {'audio': f}
-            data = {
-                'text': text,
-                'language': language,
-                'x_vector_only_mode': str(x_vector_only).lower(),
-                'consent_acknowledged': 'true'
-            }
-            if ref_text:
-                data['ref_text'] = ref_text
-            if instruct:
-                data['instruct'] = instruct
-            resp = self.session.post(f"{self.base_url}/tts/voice-clone", files=files, data=data)
+        # Read up front so a retried upload resends the whole file
+        files = {'audio': (Path(audio_path).name, Path(audio_path).read_bytes())}
+        data = {
+            'text': text,
+            'language': language,
+            'x_vector_only_mode': str(x_vector_only).lower(),
+            'consent_acknowledged': 'true'
+        }
+        if ref_text:
+            data['ref_text'] = ref_text
+        if instruct:
+            data['instruct'] = instruct
+        return self._route(lambda b: self._post_job(b, "/tts/voice-clone", len(text), files=files, data=data),
+                           "clone")
+
+    def create_voice_prompt(self, audio_path: str, ref_text: Optional[str] = None,
+                            x_vector_only: bool = False, use_cache: bool = True) -> VoicePrompt:
+        """Upload reference audio once and return a reusable VoicePrompt.
+
+        Registered prompt ids are cached in VOICE_PROMPT_CACHE keyed by base URL
+        and audio content hash, so later invocations skip the upload entirely.
+        """
+        prompt = VoicePrompt.from_file(audio_path, ref_text, x_vector_only)
+        self.register_voice_prompt(prompt, use_cache)
+        return prompt
+
+    def register_voice_prompt(self, prompt: VoicePrompt, use_cache: bool = True,
+                              backend: Optional[Backend] = None) -> VoicePrompt:
+        """Give a local VoicePrompt a prompt id on `backend` (default: the first), at most once per backend"""
+        url = backend.url if backend else self.base_url
+        with prompt.lock:
+            if url in prompt.prompt_ids:
+                return prompt
+            prompt.prompt_ids[url] = None
+            cache = _load_json(VOICE_PROMPT_CACHE, {}) if use_cache else {}
+            cached_id = cache.get(url, {}).get(prompt.cache_key)
+            if cached_id:
+                prompt.prompt_ids[url] = cached_id
+                return prompt
+
+            data = {'x_vector_only_mode': str(prompt.x_vector_only).lower(), 'consent_acknowledged': 'true'}
+            if prompt.ref_text:
+                data['ref_text'] = prompt.ref_text
+            resp = self._request("POST", "/tts/voice-prompts", "submit", backend=backend,
+                                 files={'audio': (prompt.filename, prompt.audio)}, data=data)
+            if resp.status_code in (404, 405, 501):
+                # Backend has no prompt registry; fall back to the in-memory stand-in
+                return prompt
             resp.raise_for_status()
-            return resp.json()["job_id"]
+            prompt.prompt_ids[url] = resp.json()["prompt_id"]
+            if use_cache:
+                with _voice_prompt_cache_lock:
+                    cache = _load_json(VOICE_PROMPT_CACHE, {})
+                    cache.setdefault(url, {})[prompt.cache_key] = prompt.prompt_ids[url]
+                    _save_json(VOICE_PROMPT_CACHE, cache)
+            return prompt
+
+    def voice_clone_prompt(self, text: str, prompt: VoicePrompt, language: str = "Auto",
+                           instruct: Optional[str] = None) -> str:
+        """Clone voice from a VoicePrompt without re-reading the reference audio"""
+        data = {
+            'text': text,
+            'language': language,
+            'x_vector_only_mode': str(prompt.x_vector_only).lower(),
+            'consent_acknowledged': 'true'
+        }
+        if prompt.ref_text:
+            data['ref_text'] = prompt.ref_text
+        if instruct:
+            data['instruct'] = instruct
+
+        def attempt(backend):
+            self.register_voice_prompt(prompt, backend=backend)
+            prompt_id = prompt.prompt_ids.get(backend.url)
+            if prompt_id:
+                resp = self._request("POST", "/tts/voice-clone", "submit", backend=backend,
+                                     data={**data, 'prompt_id': prompt_id}, chars=len(text))
+                if resp.status_code not in (404, 410):
+                    resp.raise_for_status()
+                    return resp.json()["job_id"]
+                # Server forgot the prompt: drop the stale id and send the audio instead
+                prompt.prompt_ids[backend.url] = None
+                with _voice_prompt_cache_lock:
+                    cache = _load_json(VOICE_PROMPT_CACHE, {})
+                    if cache.get(backend.url, {}).pop(prompt.cache_key, None):
+                        _save_json(VOICE_PROMPT_CACHE, cache)
+            files = {'audio': (prompt.filename, prompt.audio)}
+            return self._post_job(backend, "/tts/voice-clone", len(text), files=files, data=data)
+
+        return self._route(attempt, "clone")
 
     def voice_clone_with_timbre(self, text: str, timbre_speaker: str, language: str = "Auto",
                                  instruct: Optional[str] = None) -> str:
@@ -95,9 +616,7 @@ class Text2SpeechClient:
         }
         if instruct:
             payload["instruct"] = instruct
-        resp = self.session.post(f"{self.base_url}/tts/custom-voice", json=payload)
-        resp.raise_for_status()
-        return resp.json()["job_id"]
+        return self._route(lambda b: self._post_job(b, "/tts/custom-voice", len(text), json=payload), "timbre")
 
     def voice_design_clone(self, design_text: str, design_instruct: str,
                            clone_texts: List[str], design_language: str = "Auto",
@@ -110,190 +629,1010 @@ class Text2SpeechClient:
             "design_language": design_language,
             "clone_language": clone_language
         }
-        resp = self.session.post(f"{self.base_url}/tts/voice-design-clone", json=payload)
-        resp.raise_for_status()
-        return resp.json()["job_id"]
+        chars = len(design_text) + sum(len(t) for t in clone_texts)
+        return self._route(lambda b: self._post_job(b, "/tts/voice-design-clone", chars, json=payload),
+                           "design-clone")
+
+    def submit(self, kind: str, text: str, speaker: Optional[str] = None, language: str = "Auto",
+               instruct: Optional[str] = None, audio_path: Optional[str] = None,
+               ref_text: Optional[str] = None, x_vector_only: bool = False,
+               prompt: Optional[VoicePrompt] = None) -> str:
+        """Submit a synthesis job of the given kind: custom, design, timbre or clone"""
+        if kind == "custom":
+            return self.custom_voice(text, speaker, language, instruct)
+        if kind == "design":
+            return self.voice_design(text, instruct, language)
+        if kind == "timbre":
+            return self.voice_clone_with_timbre(text, speaker, language, instruct)
+        if kind == "clone":
+            if prompt is not None:
+                return self.voice_clone_prompt(text, prompt, language, instruct)
+            return self.voice_clone(text, audio_path, language, ref_text, x_vector_only, instruct)
+        raise ValueError(f"Unknown synthesis kind: {kind}")
+
+    @staticmethod
+    def synthesis_key(kind: str, text: str, speaker: Optional[str] = None, language: str = "Auto",
+                      instruct: Optional[str] = None, audio_path: Optional[str] = None,
+                      ref_text: Optional[str] = None, x_vector_only: bool = False,
+                      prompt: Optional[VoicePrompt] = None) -> str:
+        """Cache key for the audio a `submit` call with these arguments would produce"""
+        ref_hash = None
+        if kind == "clone":
+            if prompt is not None:
+                ref_hash, ref_text, x_vector_only = prompt.audio_hash, prompt.ref_text, prompt.x_vector_only
+            else:
+                ref_hash = _sha256_file(audio_path)
+        else:
+            ref_text, x_vector_only = None, None
+        return cache_key(kind, text=text, speaker=speaker, language=language, instruct=instruct,
+                         ref_audio=ref_hash, ref_text=ref_text, x_vector_only=x_vector_only)
+
+    def synthesize(self, kind: str, text: str, output_path: str, wait=None, on_submit=None,
+                   progress_callback=None, job_id: Optional[str] = None, backend: Optional[str] = None,
+                   **params) -> dict:
+        """Submit, wait for and download one job, serving repeats from self.cache.
+
+        Pass `job_id` to re-attach to an already submitted job instead of
+        submitting a new one, with `backend` the URL of the node running it. A job that stalls (see self.stall) is cancelled
+        and resubmitted, and on_submit is called with the new id. Returns the
+        final status dict. status["output"] is set once the audio is written;
+        cache hits return {"status": "completed", "cached": True}.
+        status["timings"] holds the JobTimings fields, which are also passed
+        to self.on_timings.
+        """
+        timings = JobTimings(kind)
+        key = self.synthesis_key(kind, text, **params) if self.cache else None
+        if key and self.cache.fetch(key, output_path):
+            timings.cached = True
+            status = {"status": "completed", "cached": True, "output": output_path}
+        else:
+            if job_id is None:
+                job_id = self.submit(kind, text, **params)
+                if on_submit:
+                    on_submit(job_id)
+            elif self.backends.owner(job_id) is None:
+                # Re-attached job from an earlier run: poll and cancel it where it runs
+                self.backends.adopt(job_id, backend)
+            timings.mark_submitted(job_id)
+
+            def observe(job_status):
+                timings.observe(job_status)
+                if progress_callback:
+                    progress_callback(job_status)
+
+            self.stall.begin()
+            while True:
+                try:
+                    if self.hedge and len(self.backends) > 1:
+                        status = self._wait_hedged(kind, text, job_id, wait, observe, params)
+                    else:
+                        status = (wait or self.wait_for_completion)(job_id, progress_callback=observe)
+                    break
+                except JobStalled as e:
+                    # The stalled job is already cancelled; try again, elsewhere if possible
+                    if not self.stall.allow(len(timings.stalls)):
+                        raise
+                    owner = self.backends.owner(e.job_id)
+                    if owner and self.stall.other_backend and len(self.backends) > 1:
+                        self._local.avoid = [owner]
+                    try:
+                        job_id = self.submit(kind, text, **params)
+                    finally:
+                        self._local.avoid = ()
+                    timings.mark_resubmitted(e.job_id, e.stalled_for, job_id)
+                    if on_submit:
+                        on_submit(job_id)
+            timings.mark_done()
+            status.setdefault("job_id", job_id)
+            if status["status"] == "completed" and status.get("audio_url"):
+                timings.mark_downloaded(self.download_audio(status["audio_url"], output_path, status["job_id"]))
+                status["output"] = output_path
+                if key:
+                    self.cache.store(key, output_path)
+        timings.finish()
+        status["timings"] = timings.to_dict()
+        if self.on_timings:
+            self.on_timings(timings)
+        return status
+
+    def _wait_hedged(self, kind: str, text: str, job_id: str, wait, progress_callback, params: dict) -> dict:
+        """Wait for job_id, racing a duplicate on another backend if it straggles (see HedgePolicy).
+
+        The first copy to complete wins and the other is cancelled. The
+        returned status has the winner's job_id and, when a duplicate was
+        sent, "hedged_by" with the duplicate's id.
+        """
+        policy = self.hedge
+        policy.begin()
+        wait = wait or self.wait_for_completion
+        submitted = time.monotonic()
+        headway = {"started": False, "progress": None, "at": submitted}
+
+        def observe(status):
+            now = time.monotonic()
+            if not headway["started"] and status.get("status") != "queued":
+                headway["started"] = True
+                headway["at"] = now
+                policy.record(now - submitted)
+            if status.get("progress") != headway["progress"]:
+                headway["progress"], headway["at"] = status.get("progress"), now
+            progress_callback(status)
+
+        waits = {_in_thread(wait, job_id, progress_callback=observe): job_id}
+        hedge_id = None
+        outcomes = {}
+        pending = set(waits)
+        while pending:
+            timeout = None
+            if hedge_id is None:
+                delay = policy.delay()
+                timeout = 1.0 if delay is None else min(1.0, max(0.0, headway["at"] + delay - time.monotonic()))
+            done, pending = wait_futures(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcomes[waits[future]] = future
+                if future.exception() is None and future.result().get("status") == "completed":
+                    winner = waits[future]
+                    for loser in [j for j in waits.values() if j != winner and j not in outcomes]:
+                        try:
+                            self.cancel_job(loser)
+                        except requests.RequestException:
+                            pass
+                    status = dict(future.result(), job_id=winner)
+                    if hedge_id:
+                        status["hedged_by"] = hedge_id
+                    return status
+            if hedge_id is not None or not pending:
+                continue
+            delay = policy.delay()
+            if delay is None or time.monotonic() - headway["at"] < delay or not policy.allow():
+                continue
+            owner = self.backends.owner(job_id)
+            self._local.avoid = [owner] if owner else []
+            try:
+                hedge_id = self.submit(kind, text, **params)
+            except requests.RequestException:
+                hedge_id = ""  # no second copy; keep waiting on the first
+                continue
+            finally:
+                self._local.avoid = ()
+            future = _in_thread(wait, hedge_id)
+            waits[future] = hedge_id
+            pending.add(future)
+        # Neither copy completed: report the original
+        first = outcomes[job_id]
+        status = dict(first.result(), job_id=job_id)
+        if hedge_id:
+            status["hedged_by"] = hedge_id
+        return status
+
+    def synthesize_design_clone(self, description: str, clone_texts: List[str], output_paths: List[str],
+                                design_text: Optional[str] = None, language: str = "Auto", wait=None,
+                                on_submit=None, timeout: Optional[float] = None) -> dict:
+        """Design a voice once and clone it onto several texts in one server job.
+
+        Clip i is written to output_paths[i]. The design utterance defaults to
+        the first clone text. Waits 300 s plus 30 s per text unless `timeout` is
+        given. On success status["outputs"] lists the written files.
+        """
+        if len(clone_texts) != len(output_paths):
+            raise ValueError("clone_texts and output_paths differ in length")
+        job_id = self.voice_design_clone(design_text or clone_texts[0], description, list(clone_texts),
+                                         language, language)
+        if on_submit:
+            on_submit(job_id)
+        status = (wait or self.wait_for_completion)(job_id, timeout=timeout or 300.0 + 30.0 * len(clone_texts))
+        status.setdefault("job_id", job_id)
+        if status["status"] != "completed":
+            return status
+        urls = status.get("audio_urls") or ([status["audio_url"]] if status.get("audio_url") else [])
+        if len(urls) != len(output_paths):
+            status["status"] = "failed"
+            status["error"] = f"expected {len(output_paths)} clips, server returned {len(urls)}"
+            return status
+        for url, path in zip(urls, output_paths):
+            self.download_audio(url, path, job_id)
+        status["outputs"] = list(output_paths)
+        return status
+
+    def synthesize_chunked(self, kind: str, text: str, output_path: str,
+                           chunk_chars: int = DEFAULT_CHUNK_CHARS, concurrency: int = 4,
+                           on_chunk=None, **params) -> dict:
+        """Synthesize long text as sentence-aligned chunks in parallel, stitched in order.
+
+        Each chunk goes through `synthesize` (and so the cache). Chunk WAVs are
+        concatenated at the container level into output_path. on_chunk(index,
+        total, status) is called as each chunk finishes, one call at a time,
+        so it may print without its own locking.
+        """
+        chunks = split_text(text, chunk_chars)
+        if not chunks:
+            raise ValueError("No text to synthesize")
+        with tempfile.TemporaryDirectory(prefix="t2s-chunks-") as tmp_dir, JobPoller(self) as poller:
+            paths = [str(Path(tmp_dir) / f"{i:05d}.wav") for i in range(len(chunks))]
+            report_lock = threading.Lock()
+
+            def run(i):
+                status = self.synthesize(kind, chunks[i], paths[i], wait=poller.wait, **params)
+                if on_chunk:
+                    with report_lock:
+                        on_chunk(i, len(chunks), status)
+                return status
+
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks)))) as pool:
+                try:
+                    statuses = list(pool.map(run, range(len(chunks))))
+                except BaseException:
+                    poller.close()  # cancels the chunks' jobs so the workers return
+                    raise
+            failed = [(i, st) for i, st in enumerate(statuses) if not st.get("output")]
+            if failed:
+                i, st = failed[0]
+                return {"status": st.get("status", "failed"), "chunks": len(chunks),
+                        "error": f"chunk {i + 1}/{len(chunks)}: {st.get('error', 'Unknown')}"}
+            with atomic_write(output_path) as f:
+                concat_wavs(paths, f)
+        return {"status": "completed", "chunks": len(chunks), "output": output_path}
+
+    def synthesize_stream(self, kind: str, text: str, out: BinaryIO,
+                          first_chars: int = DEFAULT_FIRST_CHUNK_CHARS,
+                          chunk_chars: int = DEFAULT_CHUNK_CHARS, concurrency: int = 4,
+                          on_chunk=None, **params) -> dict:
+        """Synthesize text chunk by chunk, writing WAV audio to `out` as soon as it is ready.
+
+        The first chunk is kept short to minimize time to first audio (TTFA).
+        Later chunks are synthesized concurrently but written strictly in order.
+        The result carries "ttfa" and "elapsed" in seconds.
+        """
+        start = time.monotonic()
+        chunks = split_text(text, chunk_chars, first_chars=first_chars)
+        if not chunks:
+            raise ValueError("No text to synthesize")
+        result = {"status": "completed", "chunks": len(chunks), "ttfa": None}
+        writer = WavWriter(out)
+        with tempfile.TemporaryDirectory(prefix="t2s-stream-") as tmp_dir, JobPoller(self) as poller:
+            paths = [str(Path(tmp_dir) / f"{i:05d}.wav") for i in range(len(chunks))]
+
+            def run(i):
+                return self.synthesize(kind, chunks[i], paths[i], wait=poller.wait, **params)
+
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks)))) as pool:
+                futures = [pool.submit(run, i) for i in range(len(chunks))]
+                for i, future in enumerate(futures):
+                    try:
+                        status = future.result()
+                    except BaseException:
+                        for pending in futures:
+                            pending.cancel()
+                        poller.close()  # cancels the chunks' jobs so the workers return
+                        raise
+                    if not status.get("output"):
+                        for pending in futures[i + 1:]:
+                            pending.cancel()
+                        result.update(status=status.get("status", "failed"),
+                                      error=f"chunk {i + 1}/{len(chunks)}: {status.get('error', 'Unknown')}")
+                        break
+                    writer.append(paths[i])
+                    if result["ttfa"] is None:
+                        result["ttfa"] = time.monotonic() - start
+                    if on_chunk:
+                        on_chunk(i, len(chunks), status)
+        if writer.fmt is not None:
+            writer.close()
+        result["elapsed"] = time.monotonic() - start
+        return result
 
     def get_job_status(self, job_id: str) -> dict:
-        """Get job status"""
-        resp = self.session.get(f"{self.base_url}/jobs/{job_id}/status")
+        """Get job status (a Retry-After header is surfaced as status["retry_after"]).
+
+        Not retried here: polling loops re-poll on transient errors themselves.
+        """
+        resp = self._request("GET", f"/jobs/{job_id}/status", "status", retry=False,
+                             backend=self.backends.owner(job_id))
         resp.raise_for_status()
-        return resp.json()
+        status = resp.json()
+        if "Retry-After" in resp.headers and "retry_after" not in status:
+            status["retry_after"] = resp.headers["Retry-After"]
+        if status.get("status") in TERMINAL_STATUSES:
+            self.backends.finish(job_id, record_latency=status["status"] != "cancelled")
+        return status
+
+    def get_job_statuses(self, job_ids: List[str], bulk: bool = True) -> Dict[str, object]:
+        """Map job id -> status dict (or the exception raised fetching it).
+
+        Jobs are grouped by owning backend. With `bulk`, each group is fetched
+        in one `POST /jobs/status` where the backend supports it (probed on
+        first use; until it has answered once, any 4xx but 429 counts as unsupported);
+        other jobs are polled one by one.
+        """
+        groups: Dict[Optional[Backend], List[str]] = {}
+        for job_id in job_ids:
+            groups.setdefault(self.backends.owner(job_id), []).append(job_id)
+        results = {}
+        for backend, ids in groups.items():
+            target = backend or self.backends.backends[0]
+            if bulk and target.bulk_status is not False and len(ids) > 1:
+                try:
+                    resp = self._request("POST", "/jobs/status", "status", retry=False, backend=target,
+                                         json={"job_ids": ids})
+                    unsupported = resp.status_code in (404, 405, 501) or (
+                        target.bulk_status is None and 400 <= resp.status_code < 500 and resp.status_code != 429)
+                    if unsupported:
+                        target.bulk_status = False
+                    else:
+                        resp.raise_for_status()
+                        target.bulk_status = True
+                        jobs = resp.json().get("jobs", [])
+                        if not isinstance(jobs, dict):
+                            jobs = {s["job_id"]: s for s in jobs if "job_id" in s}
+                        for job_id in ids:
+                            status = jobs.get(job_id)
+                            if isinstance(status, dict) and status.get("status") in TERMINAL_STATUSES:
+                                self.backends.finish(job_id, record_latency=status["status"] != "cancelled")
+                            results[job_id] = status
+                        continue
+                except requests.RequestException as e:
+                    results.update({job_id: e for job_id in ids})
+                    continue
+            for job_id in ids:
+                try:
+                    results[job_id] = self.get_job_status(job_id)
+                except Exception as e:
+                    results[job_id] = e
+        return results
 
     def cancel_job(self, job_id: str):
         """Cancel a running job"""
-        resp = self.session.post(f"{self.base_url}/jobs/{job_id}/cancel")
-        resp.raise_for_status()
-
-    def download_audio(self, audio_url: str, output_path: str):
-        """Download audio file"""
-        if audio_url.startswith('/'):
-            # Remove /api/v1 prefix if base_url already has it
-            base = self.base_url
-            if audio_url.startswith('/api/v1') and base.endswith('/api/v1'):
-                audio_url = audio_url[7:]  # Remove /api/v1 prefix
-            audio_url = f"{base}{audio_url}"
-        elif not audio_url.startswith('http'):
-            audio_url = f"{self.base_url}/{audio_url}"
-        resp = self.session.get(audio_url)
+        resp = self._request("POST", f"/jobs/{job_id}/cancel", "status", backend=self.backends.owner(job_id))
         resp.raise_for_status()
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(resp.content)
-
-    def wait_for_completion(self, job_id: str, poll_interval: float = 1.0, timeout: float = 300.0,
-                           progress_callback=None) -> dict:
-        """Wait for job completion"""
-        start = time.time()
-        while time.time() - start < timeout:
-            status = self.get_job_status(job_id)
-            if progress_callback:
+        self.backends.finish(job_id, record_latency=False)
+
+    def cancel_jobs(self, job_ids: List[str]) -> int:
+        """Cancel jobs concurrently, best effort; returns how many the server accepted.
+
+        Meant for timeouts, interrupts and close(), so nothing is retried and
+        errors are swallowed.
+        """
+        def cancel(job_id):
+            try:
+                return self._request("POST", f"/jobs/{job_id}/cancel", "status", retry=False,
+                                     backend=self.backends.owner(job_id)).ok
+            except requests.RequestException:
+                return False
+            finally:
+                self.backends.finish(job_id, record_latency=False)
+
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(16, len(job_ids))) as pool:
+            return sum(pool.map(cancel, job_ids))
+
+    def cancel_in_flight(self) -> int:
+        """Cancel every job this client submitted that has not finished; returns how many were cancelled"""
+        return self.cancel_jobs(self.backends.in_flight())
+
+    def close(self):
+        """Cancel in-flight jobs and release pooled connections"""
+        self.cancel_in_flight()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def download_audio(self, audio_url: str, output_path: str, job_id: Optional[str] = None) -> int:
+        """Download audio file (streamed in chunk_size pieces); returns bytes written.
+
+        A relative audio_url is resolved against the backend that owns `job_id`.
+        """
+        backend = self.backends.owner(job_id)
+        url = resolve_audio_url(backend.url if backend else self.base_url, audio_url)
+        with self._request("GET", url, "download", stream=True) as resp:
+            resp.raise_for_status()
+            return self._save_stream(resp, output_path)
+
+    def wait_for_completion(self, job_id: str, poll_interval: Optional[float] = None,
+                            timeout: float = 300.0, progress_callback=None) -> dict:
+        """Wait for job completion.
+
+        Polls on `self.poll_policy`; pass `poll_interval` for a fixed interval instead.
+        Transient polling errors (network, 429, 5xx) count as a missed poll.
+        On timeout the job is cancelled on the server before TimeoutError is raised,
+        and likewise before JobStalled when its progress stalls (see self.stall).
+        """
+        policy = PollPolicy.fixed(poll_interval) if poll_interval else self.poll_policy
+        watch = StallWatch(self.stall)
+        start = time.monotonic()
+        samples = []
+        attempt = 0
+        while True:
+            try:
+                status = self.get_job_status(job_id)
+            except requests.RequestException as e:
+                if not is_transient(e):
+                    raise
+                status = {}
+            if status and progress_callback:
                 progress_callback(status)
-            if status["status"] in ["completed", "failed", "cancelled"]:
+            flat = watch.observe(status) if status else None
+            if status.get("status") in ["completed", "failed", "cancelled"]:
                 return status
-            time.sleep(poll_interval)
-        raise TimeoutError(f"Job {job_id} timeout")
+            if flat is not None:
+                self.cancel_jobs([job_id])
+                raise JobStalled(job_id, flat)
+            progress = status.get("progress")
+            if isinstance(progress, (int, float)):
+                now = time.monotonic()
+                if samples and progress < samples[-1][1]:
+                    samples = []
+                samples = samples[-4:] + [(now, float(progress))]
+            delay = policy.next_delay(attempt, samples, retry_after_hint(status))
+            attempt += 1
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                self.cancel_jobs([job_id])
+                raise TimeoutError(f"Job {job_id} timeout")
+            time.sleep(min(delay, remaining))
 
     def encode_audio(self, audio_path: str) -> dict:
         """Encode audio to tokens"""
-        with open(audio_path, 'rb') as f:
-            files = {'audio': f}
-            resp = self.session.post(f"{self.base_url}/tokenizer/encode", files=files)
+        files = {'audio': (Path(audio_path).name, Path(audio_path).read_bytes())}
+        resp = self._request("POST", "/tokenizer/encode", "tokens", files=files)
+        resp.raise_for_status()
+        return resp.json()
+
+    def decode_tokens(self, tokens: List[int], output_path: str) -> int:
+        """Decode tokens to audio (streamed like download_audio); returns bytes written"""
+        with self._request("POST", "/tokenizer/decode", "tokens", json={"tokens": tokens},
+                           stream=True) as resp:
             resp.raise_for_status()
-            return resp.json()
+            return self._save_stream(resp, output_path)
 
-    def decode_tokens(self, tokens: List[int], output_path: str):
-        """Decode tokens to audio"""
-        resp = self.session.post(f"{self.base_url}/tokenizer/decode", json={"tokens": tokens})
-        resp.raise_for_status()
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(resp.content)
 
+_shared_clients = {}
+_shared_lock = threading.Lock()
 
-def cmd_speak(text: str, speaker: str, output: str, language: str = "Auto", instruct: Optional[str] = None, **kwargs):
-    """Text to speech with preset speaker"""
-    client = Text2SpeechClient()
-    print(f"Generating speech with speaker: {speaker}")
-    print(f"Text: {text[:60]}...")
 
-    job_id = client.custom_voice(text, speaker, language, instruct)
-    print(f"Job ID: {job_id}")
+def shared_client(base_url: Union[str, List[str]] = API_BASE,
+                  max_connections: int = DEFAULT_MAX_CONNECTIONS) -> Text2SpeechClient:
+    """Process-wide client for base_url, so every caller reuses one connection pool.
+
+    `max_connections` sizes the pool when the first caller creates the client.
+    """
+    key = base_url if isinstance(base_url, str) else tuple(base_url)
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = Text2SpeechClient(base_url, max_connections=max_connections)
+    return client
+
+
+def _in_thread(func: Callable, *args, **kwargs) -> Future:
+    """Run func(*args, **kwargs) in a daemon thread; returns a Future for its result"""
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _prewarm():
+    """Warm a pooled connection for the command about to run"""
+    shared_client().prewarm()
+
+
+def _cli_client(no_cache: bool = False, concurrency: int = 1, max_rps: Optional[float] = None,
+                max_cps: Optional[float] = None, hedge: Optional[float] = None) -> Text2SpeechClient:
+    """Shared client used by CLI commands (synthesis cache on unless --no-cache).
+
+    The pool leaves room for the JobPoller thread on top of `concurrency`
+    workers. One process runs one command, so setting the cache and rate
+    limits here is safe.
+    """
+    workers = MAX_AUTO_CONCURRENCY if concurrency == AUTO_CONCURRENCY else concurrency
+    client = shared_client(max_connections=max(DEFAULT_MAX_CONNECTIONS, workers + 2))
+    client.cache = None if no_cache else SynthesisCache()
+    client.rate_limiter = RateLimiter(max_rps, max_cps) if max_rps or max_cps else None
+    client.hedge = HedgePolicy(percentile=hedge) if hedge else None
+    return client
+
+
+def _parse_concurrency(value: str) -> int:
+    """argparse type for batch -c: a positive integer or "auto" (AUTO_CONCURRENCY)"""
+    if value.strip().lower() == "auto":
+        return AUTO_CONCURRENCY
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError("concurrency must be at least 1 or 'auto'")
+    return count
+
+
+def _batch_controller(client: Text2SpeechClient, concurrency: int) -> Tuple[int, Optional[AIMDController]]:
+    """Worker count for a batch and, for `-c auto`, the AIMD controller gating them"""
+    if concurrency != AUTO_CONCURRENCY:
+        if concurrency > 1:
+            print(f"Concurrency: {concurrency}")
+        return concurrency, None
+    controller = AIMDController(maximum=MAX_AUTO_CONCURRENCY)
+    client.on_throttle = controller.throttle
+    print(f"Concurrency: auto (1-{MAX_AUTO_CONCURRENCY})")
+    return MAX_AUTO_CONCURRENCY, controller
+
+
+def _job_feedback(result: Optional[dict]) -> tuple:
+    """(queue wait, failed) of a batch result for the AIMD controller; (None, False) if no job ran"""
+    if not result or result.get("unchanged") or result.get("cached") or result["status"] == "duplicate":
+        return None, False
+    if result["status"] != "success":
+        return None, True
+    return (result.get("timings") or {}).get("queue_wait"), False
+
+
+def _format_timings(t: dict) -> str:
+    """One-line summary of a JobTimings dict"""
+    if t.get("cached"):
+        return f"cache hit, {t['total']:.2f}s"
+
+    def secs(value):
+        return "n/a" if value is None else f"{value:.2f}s"
+
+    parts = [f"submit {secs(t['submit_rtt'])}", f"queue {secs(t['queue_wait'])}",
+             f"synth {secs(t['synthesis'])}"]
+    if t.get("download_seconds") is not None:
+        parts.append(f"download {secs(t['download_seconds'])} ({t['download_bytes'] / 1024:.0f} KB)")
+    parts.append(f"{t['polls']} polls")
+    if t.get("resubmits"):
+        parts.append(f"{t['resubmits']} stall resubmit(s)")
+    parts.append(f"total {secs(t['total'])}")
+    return " | ".join(parts)
+
+
+def _report_saved(status: dict, output: str, timings: bool = False):
+    if timings and status.get("timings"):
+        print(f"  Timings: {_format_timings(status['timings'])}")
+    if status.get("output"):
+        suffix = " (cached)" if status.get("cached") else ""
+        print(f"✓ Saved: {output}{suffix}")
+    else:
+        print(f"✗ Failed: {status.get('error', 'Unknown')}", file=sys.stderr)
+        sys.exit(1)
+
+
+def cmd_speak(text: str, speaker: str, output: str, language: str = "Auto", instruct: Optional[str] = None,
+              no_cache: bool = False, chunk: bool = False, chunk_size: int = DEFAULT_CHUNK_CHARS,
+              concurrency: int = 4, stream: bool = False,
+              first_chunk_size: int = DEFAULT_FIRST_CHUNK_CHARS, timings: bool = False,
+              max_rps: Optional[float] = None, max_cps: Optional[float] = None,
+              hedge: Optional[float] = None, **kwargs):
+    """Text to speech with preset speaker"""
+    client = _cli_client(no_cache, concurrency, max_rps, max_cps, hedge)
+    # With `-o -` the audio goes to stdout, so progress moves to stderr
+    info = sys.stderr if output == "-" else sys.stdout
+    print(f"Generating speech with speaker: {speaker}", file=info)
+    print(f"Text: {text[:60]}...", file=info)
+
+    if stream:
+        def show_chunk(i, total, status):
+            detail = f"  ({_format_timings(status['timings'])})" if timings else ""
+            print(f"  ▶ chunk {i + 1}/{total}{detail}", file=info)
+
+        params = dict(first_chars=first_chunk_size, chunk_chars=chunk_size, concurrency=concurrency,
+                      on_chunk=show_chunk, speaker=speaker, language=language, instruct=instruct)
+        if output == "-":
+            result = client.synthesize_stream("custom", text, sys.stdout.buffer, **params)
+        else:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            with open(output, 'wb') as out:
+                result = client.synthesize_stream("custom", text, out, **params)
+        ttfa = f"{result['ttfa']:.2f}s" if result["ttfa"] is not None else "n/a"
+        print(f"TTFA: {ttfa}  Total: {result['elapsed']:.2f}s  Chunks: {result['chunks']}", file=info)
+        if result["status"] != "completed":
+            print(f"✗ Failed: {result.get('error', 'Unknown')}", file=sys.stderr)
+            sys.exit(1)
+        if output != "-":
+            print(f"✓ Saved: {output}")
+        return
+
+    if chunk:
+        def show_chunk(i, total, status):
+            mark = "✓" if status.get("output") else "✗"
+            detail = f"  ({_format_timings(status['timings'])})" if timings else ""
+            print(f"  {mark} chunk {i + 1}/{total}{detail}")
+
+        status = client.synthesize_chunked("custom", text, output, chunk_chars=chunk_size,
+                                           concurrency=concurrency, on_chunk=show_chunk,
+                                           speaker=speaker, language=language, instruct=instruct)
+        _report_saved(status, output)
+        return
 
     def show_progress(status):
         progress = status.get("progress", 0)
         if progress:
             print(f"  Progress: {int(progress * 100)}%", end="\r")
 
-    status = client.wait_for_completion(job_id, progress_callback=show_progress)
+    status = client.synthesize("custom", text, output, speaker=speaker, language=language,
+                               instruct=instruct, on_submit=lambda job_id: print(f"Job ID: {job_id}"),
+                               progress_callback=show_progress)
     print()
+    _report_saved(status, output, timings)
 
-    if status["status"] == "completed" and status.get("audio_url"):
-        client.download_audio(status["audio_url"], output)
-        print(f"✓ Saved: {output}")
-    else:
-        print(f"✗ Failed: {status.get('error', 'Unknown')}", file=sys.stderr)
-        sys.exit(1)
 
-
-def cmd_design(text: str, description: str, output: str, language: str = "Auto", **kwargs):
+def cmd_design(text: str, description: str, output: str, language: str = "Auto",
+               no_cache: bool = False, timings: bool = False, max_rps: Optional[float] = None,
+               max_cps: Optional[float] = None, **kwargs):
     """Design voice from description"""
-    client = Text2SpeechClient()
+    client = _cli_client(no_cache, max_rps=max_rps, max_cps=max_cps)
     print(f"Designing voice: {description}")
     print(f"Text: {text[:60]}...")
 
-    job_id = client.voice_design(text, description, language)
-    print(f"Job ID: {job_id}")
-
-    status = client.wait_for_completion(job_id)
-
-    if status["status"] == "completed" and status.get("audio_url"):
-        client.download_audio(status["audio_url"], output)
-        print(f"✓ Saved: {output}")
-    else:
-        print(f"✗ Failed: {status.get('error', 'Unknown')}", file=sys.stderr)
-        sys.exit(1)
+    status = client.synthesize("design", text, output, instruct=description, language=language,
+                               on_submit=lambda job_id: print(f"Job ID: {job_id}"))
+    _report_saved(status, output, timings)
 
 
 def cmd_clone(audio: str, text: str, output: str, ref_text: Optional[str] = None,
               x_vector_only: bool = False, instruct: Optional[str] = None,
-              timbre: Optional[str] = None, language: str = "Auto", **kwargs):
+              timbre: Optional[str] = None, language: str = "Auto", no_cache: bool = False,
+              timings: bool = False, max_rps: Optional[float] = None, max_cps: Optional[float] = None,
+              **kwargs):
     """Clone voice from audio or timbre"""
-    client = Text2SpeechClient()
+    client = _cli_client(no_cache, max_rps=max_rps, max_cps=max_cps)
 
     if timbre:
         print(f"Using timbre: {timbre}")
-        job_id = client.voice_clone_with_timbre(text, timbre, language, instruct)
+        params = {"speaker": timbre}
     else:
         print(f"Cloning from: {audio}")
-        if not os.path.exists(audio):
+        if not audio or not os.path.exists(audio):
             print(f"✗ Audio file not found: {audio}", file=sys.stderr)
             sys.exit(1)
-        job_id = client.voice_clone(text, audio, language, ref_text, x_vector_only, instruct)
+        params = {"audio_path": audio, "ref_text": ref_text, "x_vector_only": x_vector_only}
 
     print(f"Text: {text[:60]}...")
-    print(f"Job ID: {job_id}")
+    status = client.synthesize("timbre" if timbre else "clone", text, output, language=language,
+                               instruct=instruct, on_submit=lambda job_id: print(f"Job ID: {job_id}"),
+                               **params)
+    _report_saved(status, output, timings)
+
+
+def _run_batch(items, worker, concurrency: int = 1,
+               controller: Optional[AIMDController] = None) -> list:
+    """Run worker(index, item, log) over items with up to `concurrency` in flight.
+
+    Results are returned in input order regardless of completion order. Each
+    item's log lines are printed as one block so concurrent output stays readable.
+    `items` may be a lazy iterable; it is consumed at most 2 * concurrency
+    items ahead of the workers. With a `controller`, its adaptive limit further
+    caps the workers running at once.
+    """
+    print_lock = threading.Lock()
+    stopped = threading.Event()
+
+    def run(index, item):
+        lines = []
+
+        def log(line):
+            if concurrency <= 1:
+                print(line)
+            else:
+                lines.append(line)
+
+        if controller is None:
+            result = worker(index, item, log)
+        else:
+            controller.acquire()
+            result = None
+            try:
+                if not stopped.is_set():
+                    result = worker(index, item, log)
+            finally:
+                controller.release(*_job_feedback(result))
+        if lines:
+            with print_lock:
+                print("\n".join(lines))
+        return result
+
+    if concurrency <= 1:
+        results = [run(i, item) for i, item in enumerate(items, 1)]
+    else:
+        slots = threading.BoundedSemaphore(2 * concurrency)
+        futures = []
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            for i, item in enumerate(items, 1):
+                slots.acquire()
+                future = pool.submit(run, i, item)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+            results = [f.result() for f in futures]
+        except BaseException:
+            # Interrupted: start no more items and do not wait for running ones.
+            # The caller's JobPoller.close() cancels their jobs, which frees them.
+            stopped.set()
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
+            raise
+        pool.shutdown()
+    if controller is not None:
+        print(f"\nAdaptive concurrency: ended at {int(controller.limit)} (peak {int(controller.peak)})")
+    return [r for r in results if r is not None]
+
+
+class _BatchDedup:
+    """Singleflight for one batch: a single job per identical (text, voice) tuple.
+
+    The first item in input order with a given key becomes the leader and is
+    synthesized. `claim` runs in the batch's producer loop, before items reach
+    the workers, so leadership never depends on which worker starts first.
+    Later items return a "duplicate" placeholder at once and do not hold a
+    worker. `fan_out` links or copies the leader's output into place once the
+    batch has finished.
+    """
+
+    def __init__(self):
+        self.leaders = {}
+        self.followers = {}
+
+    @staticmethod
+    def key(kind: str, text: str, **params) -> str:
+        normalized = unicodedata.normalize("NFC", " ".join(text.split()))
+        return Text2SpeechClient.synthesis_key(kind, normalized, **params)
+
+    def claim(self, name: str, out_file: Path, kind: str, text: str, **params) -> Optional[str]:
+        """Leader's item name if an earlier item has the same key, else None"""
+        leader = self.leaders.setdefault(self.key(kind, text, **params), name)
+        if leader == name:
+            return None
+        self.followers[name] = (leader, Text2SpeechClient.synthesis_key(kind, text, **params), out_file)
+        return leader
+
+    def claim_files(self, text_files: List[Path], output_path: Path, kind: str, **params):
+        """(file, text, duplicate_of) for each .txt file, claiming leaders as the files are read"""
+        for txt_file in text_files:
+            text = txt_file.read_text(encoding='utf-8').strip()
+            out_file = output_path / f"{txt_file.stem}.wav"
+            yield txt_file, text, self.claim(txt_file.name, out_file, kind, text, **params) if text else None
+
+    def fan_out(self, results: list, journal: BatchJournal) -> int:
+        """Materialize duplicate outputs from their leaders; returns the number written"""
+        by_name = {r["file"]: r for r in results}
+        written = 0
+        for result in results:
+            if result["status"] != "duplicate":
+                continue
+            leader, fingerprint, out_file = self.followers[result["file"]]
+            lead = by_name.get(leader, {})
+            if lead.get("status") != "success":
+                result["status"] = "failed"
+                result["error"] = f"{leader}: {lead.get('error', 'Unknown')}"
+                continue
+            tmp = out_file.with_name(f".{out_file.name}.{os.getpid()}.tmp")
+            try:
+                os.link(lead["output"], tmp)
+            except OSError:
+                shutil.copyfile(lead["output"], tmp)
+            os.replace(tmp, out_file)
+            journal.complete(result["file"], fingerprint, str(out_file), _sha256_file)
+            result["status"] = "success"
+            written += 1
+        return written
+
+
+def _batch_item(client: Text2SpeechClient, poller: JobPoller, journal: BatchJournal, name: str,
+                kind: str, text: str, out_file: Path, log, timings: bool = False,
+                duplicate_of: Optional[str] = None, **params) -> dict:
+    """Synthesize one batch item, resuming from the journal where possible.
+
+    `duplicate_of` names the item's leader when `_BatchDedup.claim` found one.
+    """
+    fingerprint = client.synthesis_key(kind, text, **params)
+    if journal.is_completed(name, fingerprint, str(out_file), _sha256_file):
+        log(f"  = {out_file.name} (unchanged)")
+        return {"file": name, "status": "success", "output": str(out_file), "unchanged": True}
+    if duplicate_of:
+        log(f"  ≡ duplicate of {duplicate_of}")
+        return {"file": name, "status": "duplicate", "output": str(out_file), "duplicate_of": duplicate_of}
+
+    def submitted(job_id):
+        owner = client.backends.owner(job_id)
+        journal.record(name, "submitted", fingerprint, job_id=job_id, backend=owner.url if owner else None)
+        log(f"  → {job_id}")
+        # The batch's first job loads the model on its backend; start the others loading too
+        client.warm_up_all(kind, wait=False)
+
+    try:
+        status = None
+        job_id = journal.pending_job(name, fingerprint)
+        if job_id:
+            log(f"  ↻ re-attaching to {job_id}")
+            try:
+                status = client.synthesize(kind, text, str(out_file), wait=poller.wait, job_id=job_id,
+                                           backend=journal.pending_backend(name, fingerprint), **params)
+                if status["status"] == "cancelled":
+                    log(f"  ⚠ {job_id} was cancelled, resubmitting")
+                    status = None
+            except requests.HTTPError as e:
+                log(f"  ⚠ {job_id} no longer available ({e.response.status_code}), resubmitting")
+        if status is None:
+            status = client.synthesize(kind, text, str(out_file), wait=poller.wait,
+                                       on_submit=submitted, **params)
+
+        if timings:
+            log(f"  ⏱ {_format_timings(status['timings'])}")
+        if status.get("output"):
+            journal.complete(name, fingerprint, str(out_file), _sha256_file, job_id=status.get("job_id"))
+            log(f"  ✓ {out_file.name}" + (" (cached)" if status.get("cached") else "")
+                + (" (hedged)" if status.get("hedged_by") else ""))
+            result = {"file": name, "status": "success", "output": str(out_file)}
+            if status.get("cached"):
+                result["cached"] = True
+            if status.get("hedged_by"):
+                result["hedged"] = True
+            result["timings"] = status["timings"]
+            return result
+        error = status.get("error") or ("Cancelled" if status.get("status") == "cancelled" else "Unknown")
+        journal.record(name, "failed", fingerprint, job_id=status.get("job_id"), error=error)
+        log(f"  ✗ {error}")
+        return {"file": name, "status": "failed", "error": error, "timings": status["timings"]}
+    except Exception as e:
+        log(f"  ✗ {e}")
+        return {"file": name, "status": "error", "error": str(e)}
+
+
+def _open_journal(output_path: Path, fresh: bool) -> BatchJournal:
+    journal = BatchJournal(output_path / JOURNAL_NAME)
+    if fresh:
+        journal.reset()
+    else:
+        pending = sum(1 for e in journal.state.values() if e.get("event") == "submitted")
+        if pending:
+            print(f"Resuming: {pending} jobs in flight in journal")
+    return journal
 
-    status = client.wait_for_completion(job_id)
 
-    if status["status"] == "completed" and status.get("audio_url"):
-        client.download_audio(status["audio_url"], output)
-        print(f"✓ Saved: {output}")
-    else:
-        print(f"✗ Failed: {status.get('error', 'Unknown')}", file=sys.stderr)
-        sys.exit(1)
+def _print_batch_summary(results: list):
+    success = sum(1 for r in results if r["status"] == "success")
+    notes = []
+    unchanged = sum(1 for r in results if r.get("unchanged"))
+    if unchanged:
+        notes.append(f"{unchanged} unchanged")
+    duplicates = sum(1 for r in results if r.get("duplicate_of"))
+    if duplicates:
+        notes.append(f"{duplicates} duplicates")
+    hedged = sum(1 for r in results if r.get("hedged"))
+    if hedged:
+        notes.append(f"{hedged} hedged")
+    suffix = f" ({', '.join(notes)})" if notes else ""
+    print(f"\nComplete: {success}/{len(results)} successful{suffix}")
 
 
 def cmd_batch_speak(input_dir: str, output_dir: str, speaker: str,
-                    language: str = "Auto", instruct: Optional[str] = None, **kwargs):
-    """Batch convert text files to speech"""
-    client = Text2SpeechClient()
+                    language: str = "Auto", instruct: Optional[str] = None,
+                    concurrency: int = 1, no_cache: bool = False, timings: bool = False,
+                    fresh: bool = False, max_rps: Optional[float] = None,
+                    max_cps: Optional[float] = None, hedge: Optional[float] = None, **kwargs):
+    """Batch convert text files (or the rows of a JSONL/CSV manifest) to speech"""
+    client = _cli_client(no_cache, concurrency, max_rps, max_cps, hedge)
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    if input_path.is_file():
+        if input_path.suffix.lower() not in MANIFEST_SUFFIXES:
+            print(f"✗ Manifest must be .jsonl or .csv: {input_path}", file=sys.stderr)
+            sys.exit(1)
+        results = _run_manifest(client, input_path, output_path, speaker, language, instruct,
+                                concurrency, timings, fresh)
+        _write_batch_report(output_path, results)
+        return
+
     text_files = sorted(input_path.glob("*.txt"))
     print(f"Found {len(text_files)} files to process")
+    workers, controller = _batch_controller(client, concurrency)
 
-    results = []
-    for i, txt_file in enumerate(text_files, 1):
-        print(f"\n[{i}/{len(text_files)}] {txt_file.name}")
-        text = txt_file.read_text(encoding='utf-8').strip()
+    params = {"speaker": speaker, "language": language, "instruct": instruct}
+
+    def process(i, entry, log):
+        txt_file, text, duplicate_of = entry
+        log(f"\n[{i}/{len(text_files)}] {txt_file.name}")
         if not text:
-            print("  ⚠ Empty file")
-            continue
+            log("  ⚠ Empty file")
+            return None
+        return _batch_item(client, poller, journal, txt_file.name, "custom", text,
+                           output_path / f"{txt_file.stem}.wav", log, timings, duplicate_of, **params)
 
-        try:
-            job_id = client.custom_voice(text, speaker, language, instruct)
-            print(f"  → {job_id}")
-            status = client.wait_for_completion(job_id)
+    dedup = _BatchDedup()
+    with _open_journal(output_path, fresh) as journal, JobPoller(client) as poller:
+        results = _run_batch(dedup.claim_files(text_files, output_path, "custom", **params), process,
+                             workers, controller)
+        dedup.fan_out(results, journal)
+        journal.compact()
 
-            if status["status"] == "completed" and status.get("audio_url"):
-                out_file = output_path / f"{txt_file.stem}.wav"
-                client.download_audio(status["audio_url"], str(out_file))
-                print(f"  ✓ {out_file.name}")
-                results.append({"file": txt_file.name, "status": "success", "output": str(out_file)})
-            else:
-                error = status.get("error", "Unknown")
-                print(f"  ✗ {error}")
-                results.append({"file": txt_file.name, "status": "failed", "error": error})
-        except Exception as e:
-            print(f"  ✗ {e}")
-            results.append({"file": txt_file.name, "status": "error", "error": str(e)})
+    _write_batch_report(output_path, results)
 
+
+def _write_batch_report(output_path: Path, results: list):
     report_file = output_path / "batch_report.json"
     with open(report_file, 'w') as f:
         json.dump(results, f, indent=2)
 
-    success = sum(1 for r in results if r["status"] == "success")
-    print(f"\nComplete: {success}/{len(results)} successful")
+    _print_batch_summary(results)
     print(f"Report: {report_file}")
 
 
+def _run_manifest(client: Text2SpeechClient, manifest: Path, output_path: Path, speaker: str,
+                  language: str, instruct: Optional[str], concurrency: int, timings: bool,
+                  fresh: bool) -> list:
+    """Run every row of a JSONL/CSV manifest as one batch, streaming rows from disk"""
+    print(f"Manifest: {manifest}")
+    workers, controller = _batch_controller(client, concurrency)
+    base_dir = manifest.parent
+    prompts = {}
+    outputs = set()
+
+    def voice_prompt(audio_path, ref_text, x_vector_only):
+        # One VoicePrompt per reference, so its audio is read and hashed once
+        key = (audio_path, ref_text, x_vector_only)
+        if key not in prompts:
+            prompts[key] = VoicePrompt.from_file(audio_path, ref_text, x_vector_only)
+        return prompts[key]
+
+    def rows():
+        # Parsed in the producer, so dedup leaders and duplicate outputs follow manifest order
+        for lineno, row in iter_manifest(manifest):
+            try:
+                item = parse_row(row, lineno, base_dir, speaker, language, instruct)
+                params = item["params"]
+                if item["kind"] == "clone":
+                    params["prompt"] = voice_prompt(params.pop("audio_path"), params.pop("ref_text"),
+                                                    params.pop("x_vector_only"))
+                if item["output"] in outputs:
+                    raise ValueError(f"output {item['output']} is already used by an earlier row")
+            except (OSError, ValueError) as e:
+                yield lineno, None, e
+                continue
+            outputs.add(item["output"])
+            item["duplicate_of"] = dedup.claim(item["output"], output_path / item["output"], item["kind"],
+                                               item["text"], **params)
+            yield lineno, item, None
+
+    def process(i, entry, log):
+        lineno, item, error = entry
+        if error is not None:
+            log(f"\n[{i}] line {lineno}")
+            log(f"  ✗ {error}")
+            return {"file": f"line {lineno}", "status": "error", "error": str(error)}
+
+        name = item["output"]
+        log(f"\n[{i}] {name} ({item['kind']}, line {lineno})")
+        out_file = output_path / name
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        return _batch_item(client, poller, journal, name, item["kind"], item["text"], out_file,
+                           log, timings, item["duplicate_of"], **item["params"])
+
+    dedup = _BatchDedup()
+    with _open_journal(output_path, fresh) as journal, JobPoller(client) as poller:
+        results = _run_batch(rows(), process, workers, controller)
+        dedup.fan_out(results, journal)
+        journal.compact()
+    return results
+
+
 def cmd_batch_clone(input_dir: str, output_dir: str, reference_audio: str,
-                    ref_text: Optional[str] = None, language: str = "Auto", **kwargs):
+                    ref_text: Optional[str] = None, language: str = "Auto",
+                    concurrency: int = 1, no_cache: bool = False, timings: bool = False,
+                    fresh: bool = False, max_rps: Optional[float] = None,
+                    max_cps: Optional[float] = None, hedge: Optional[float] = None, **kwargs):
     """Batch clone voice for multiple text files"""
-    client = Text2SpeechClient()
+    client = _cli_client(no_cache, concurrency, max_rps, max_cps, hedge)
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -304,41 +1643,120 @@ def cmd_batch_clone(input_dir: str, output_dir: str, reference_audio: str,
 
     text_files = sorted(input_path.glob("*.txt"))
     print(f"Cloning voice from: {reference_audio}")
+    # Registered lazily on the first submission, so unchanged runs stay offline
+    prompt = VoicePrompt.from_file(reference_audio, ref_text)
     print(f"Processing {len(text_files)} files")
+    workers, controller = _batch_controller(client, concurrency)
 
-    results = []
-    for i, txt_file in enumerate(text_files, 1):
-        print(f"\n[{i}/{len(text_files)}] {txt_file.name}")
-        text = txt_file.read_text(encoding='utf-8').strip()
+    def process(i, entry, log):
+        txt_file, text, duplicate_of = entry
+        log(f"\n[{i}/{len(text_files)}] {txt_file.name}")
         if not text:
-            print("  ⚠ Empty file")
-            continue
-
-        try:
-            job_id = client.voice_clone(text, reference_audio, language, ref_text)
-            print(f"  → {job_id}")
-            status = client.wait_for_completion(job_id)
+            log("  ⚠ Empty file")
+            return None
+        return _batch_item(client, poller, journal, txt_file.name, "clone", text,
+                           output_path / f"{txt_file.stem}.wav", log, timings, duplicate_of,
+                           prompt=prompt, language=language)
+
+    dedup = _BatchDedup()
+    with _open_journal(output_path, fresh) as journal, JobPoller(client) as poller:
+        results = _run_batch(dedup.claim_files(text_files, output_path, "clone", prompt=prompt, language=language),
+                             process, workers, controller)
+        dedup.fan_out(results, journal)
+        journal.compact()
+
+    if prompt.registered:
+        print(f"\nVoice prompt: {', '.join(filter(None, prompt.prompt_ids.values())) or 'local (server has no prompt registry)'}")
+    _print_batch_summary(results)
+
+
+def _design_batch_items(input_path: Path, language: str):
+    """(name, text, output name) for each .txt file or manifest row; rows that fail yield None texts"""
+    if input_path.is_file():
+        for lineno, row in iter_manifest(input_path):
+            try:
+                item = parse_row(row, lineno, input_path.parent, language=language)
+            except (OSError, ValueError) as e:
+                yield f"line {lineno}", None, str(e)
+                continue
+            yield item["output"], item["text"], item["output"]
+        return
+    for txt_file in sorted(input_path.glob("*.txt")):
+        yield txt_file.name, txt_file.read_text(encoding='utf-8').strip(), f"{txt_file.stem}.wav"
+
+
+def cmd_design_batch(input_dir: str, output_dir: str, description: str, design_text: Optional[str] = None,
+                     language: str = "Auto", group_size: int = 16, concurrency: int = 4,
+                     fresh: bool = False, max_rps: Optional[float] = None,
+                     max_cps: Optional[float] = None, **kwargs):
+    """Design a voice once per group and clone it onto many texts"""
+    client = _cli_client(no_cache=True, concurrency=concurrency, max_rps=max_rps, max_cps=max_cps)
+    input_path = Path(input_dir)
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    if input_path.is_file() and input_path.suffix.lower() not in MANIFEST_SUFFIXES:
+        print(f"✗ Manifest must be .jsonl or .csv: {input_path}", file=sys.stderr)
+        sys.exit(1)
 
-            if status["status"] == "completed" and status.get("audio_url"):
-                out_file = output_path / f"{txt_file.stem}.wav"
-                client.download_audio(status["audio_url"], str(out_file))
-                print(f"  ✓ {out_file.name}")
-                results.append({"file": txt_file.name, "status": "success"})
+    print(f"Designing voice: {description}")
+    results = []
+    pending = []
+    with _open_journal(output_path, fresh) as journal:
+        for name, text, output in _design_batch_items(input_path, language):
+            if text is None:
+                print(f"  ✗ {name}: {output}")
+                results.append({"file": name, "status": "error", "error": output})
+                continue
+            if not text:
+                print(f"  ⚠ {name}: empty")
+                continue
+            if design_text is None:
+                # One design utterance for every group, so all groups get the same voice
+                design_text = text
+            out_file = output_path / output
+            fingerprint = cache_key("design-clone", text=text, instruct=description,
+                                    design_text=design_text, language=language)
+            result = {"file": name, "status": "success", "output": str(out_file)}
+            results.append(result)
+            if journal.is_completed(name, fingerprint, str(out_file), _sha256_file):
+                result["unchanged"] = True
             else:
-                error = status.get("error", "Unknown")
-                print(f"  ✗ {error}")
-                results.append({"file": txt_file.name, "status": "failed", "error": error})
-        except Exception as e:
-            print(f"  ✗ {e}")
-            results.append({"file": txt_file.name, "status": "error", "error": str(e)})
-
-    success = sum(1 for r in results if r["status"] == "success")
-    print(f"\nComplete: {success}/{len(results)} successful")
+                out_file.parent.mkdir(parents=True, exist_ok=True)
+                pending.append((name, text, out_file, fingerprint, result))
+
+        groups = [pending[i:i + group_size] for i in range(0, len(pending), max(1, group_size))]
+        print(f"Texts: {len(results)} ({len(pending)} to synthesize in {len(groups)} jobs of up to {group_size})")
+        workers, controller = _batch_controller(client, concurrency)
+
+        def process(i, group, log):
+            log(f"\n[{i}/{len(groups)}] {len(group)} texts")
+            try:
+                status = client.synthesize_design_clone(
+                    description, [g[1] for g in group], [str(g[2]) for g in group],
+                    design_text=design_text, language=language, wait=poller.wait,
+                    on_submit=lambda job_id: log(f"  → {job_id}"))
+                error = None if status.get("outputs") else status.get("error", "Unknown")
+            except Exception as e:
+                status, error = {}, str(e)
+            for name, _, out_file, fingerprint, result in group:
+                if error:
+                    result.update(status="failed", error=error)
+                    journal.record(name, "failed", fingerprint, job_id=status.get("job_id"), error=error)
+                else:
+                    journal.complete(name, fingerprint, str(out_file), _sha256_file, job_id=status["job_id"])
+            log(f"  ✗ {error}" if error else f"  ✓ {', '.join(g[2].name for g in group)}")
+            return {"status": "failed" if error else "success"}
+
+        with JobPoller(client) as poller:
+            _run_batch(groups, process, workers, controller)
+        journal.compact()
+
+    _write_batch_report(output_path, results)
 
 
 def cmd_encode(audio: str, output: Optional[str] = None, **kwargs):
     """Encode audio to tokens"""
-    client = Text2SpeechClient()
+    client = shared_client()
     print(f"Encoding: {audio}")
 
     result = client.encode_audio(audio)
@@ -354,7 +1772,7 @@ def cmd_encode(audio: str, output: Optional[str] = None, **kwargs):
 
 def cmd_decode(tokens_file: str, output: str, **kwargs):
     """Decode tokens to audio"""
-    client = Text2SpeechClient()
+    client = shared_client()
     print(f"Decoding: {tokens_file}")
 
     with open(tokens_file) as f:
@@ -365,13 +1783,97 @@ def cmd_decode(tokens_file: str, output: str, **kwargs):
     print(f"✓ Saved: {output}")
 
 
+def _parse_size(value: str) -> int:
+    """Parse a byte size such as 500M or 2G"""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    value = value.strip().upper().rstrip("B")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def cmd_cache(action: str, max_size: Optional[str] = None, **kwargs):
+    """Inspect or prune the synthesis cache"""
+    cache = SynthesisCache()
+    if action == "stats":
+        stats = cache.stats()
+        print("=== Synthesis Cache ===")
+        print(f"Path: {stats['root']}")
+        print(f"Entries: {stats['entries']}")
+        print(f"Size: {stats['bytes'] / (1 << 20):.1f} MB / {stats['max_bytes'] / (1 << 20):.1f} MB")
+        return
+    if action == "clear":
+        result = cache.clear()
+    else:
+        result = cache.prune(_parse_size(max_size) if max_size else None)
+    print(f"✓ Removed {result['removed']} entries ({result['freed_bytes'] / (1 << 20):.1f} MB)")
+
+
+def cmd_bench(endpoint: str = "custom", concurrency: str = "1,2,4,8", requests_per_level: int = 20,
+              rate: Optional[float] = None, text: Optional[str] = None, text_chars: int = 120,
+              speaker: str = "vivian", description: str = "calm narrator", audio: Optional[str] = None,
+              language: str = "Auto", json_output: Optional[str] = None, **kwargs):
+    """Load-test the backend across a concurrency sweep"""
+    levels = [int(c) for c in concurrency.split(",") if c.strip()]
+    client = shared_client(max_connections=max([DEFAULT_MAX_CONNECTIONS] + [n + 2 for n in levels]))
+    base_text = text or ("The quick brown fox jumps over the lazy dog. " * (text_chars // 45 + 1))[:text_chars]
+
+    params = {"language": language}
+    if endpoint == "custom":
+        params["speaker"] = speaker
+    elif endpoint == "design":
+        params["instruct"] = description
+    elif endpoint == "clone":
+        if not audio or not os.path.exists(audio):
+            print(f"✗ Reference audio required for clone bench: {audio}", file=sys.stderr)
+            sys.exit(1)
+        params["prompt"] = client.create_voice_prompt(audio)
+
+    info = sys.stderr if json_output == "-" else sys.stdout
+    print(f"Benchmarking {endpoint} on {client.base_url}", file=info)
+    print(f"Levels: {levels}  Requests/level: {requests_per_level}  Text: {len(base_text)} chars", file=info)
+
+    report = {"api": client.base_url, "endpoint": endpoint, "text_chars": len(base_text),
+              "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "levels": []}
+    for level in levels:
+        # Vary the text per request so server-side caching cannot skew results
+        texts = [f"{base_text} {i}" for i in range(requests_per_level)]
+        result = run_level(client, endpoint, texts, level, rate, **params)
+        report["levels"].append(result)
+
+        lat = result["latency"]
+        tput = result["throughput"]
+        print(f"\n[c={level}] {result['completed']}/{result['requests']} ok in {result['wall_seconds']:.1f}s", file=info)
+        for phase in PHASES:
+            stats = lat[phase]
+            if stats["p50"] is not None:
+                print(f"  {phase:<10} p50 {stats['p50']:.3f}s  p95 {stats['p95']:.3f}s  p99 {stats['p99']:.3f}s",
+                      file=info)
+        print(f"  throughput {tput['jobs_per_s']:.2f} jobs/s  {tput['chars_per_s']:.0f} chars/s  "
+              f"{tput['audio_seconds_per_s']:.2f} audio-s/s", file=info)
+        for error in result["error_samples"]:
+            print(f"  ✗ {error}", file=info)
+
+    if json_output == "-":
+        print(json.dumps(report, indent=2))
+    elif json_output:
+        _save_json(Path(json_output), report)
+        print(f"\nReport: {json_output}")
+
+
 def cmd_status(**kwargs):
     """Check service status"""
-    client = Text2SpeechClient()
+    client = shared_client()
     health = client.health_check()
 
     print("=== Text2Speech Service Status ===")
-    print(f"API: {API_BASE}")
+    if len(client.backends) > 1:
+        client.backends.check_health(client._backend_healthy)
+        print(f"API ({client.backends.strategy} routing):")
+        for backend in client.backends.backends:
+            print(f"  {'✓' if backend.healthy else '✗'} {backend.url}")
+    else:
+        print(f"API: {client.base_url}")
     print(f"Status: {health.get('status', 'unknown')}")
     print(f"Version: {health.get('version', 'unknown')}")
     print(f"GPU: {health.get('gpu_available', False)}")
@@ -397,7 +1899,7 @@ def cmd_status(**kwargs):
 
 def cmd_speakers(**kwargs):
     """List available speakers"""
-    client = Text2SpeechClient()
+    client = shared_client()
     speakers = client.get_speakers()
 
     print("=== Available Speakers ===")
@@ -409,7 +1911,7 @@ def cmd_speakers(**kwargs):
 
 def cmd_languages(**kwargs):
     """List supported languages"""
-    client = Text2SpeechClient()
+    client = shared_client()
     languages = client.get_languages()
 
     print("=== Supported Languages ===")
@@ -417,27 +1919,79 @@ def cmd_languages(**kwargs):
         print(f"  {lang['code']}: {lang['name']}")
 
 
+def _interrupt(signum, frame):
+    """SIGINT/SIGTERM: unwind as KeyboardInterrupt; main() then cancels the server jobs.
+
+    Nothing else happens here: the interrupted code may hold client locks.
+    The default handler is restored first, so a second signal stops the
+    process at once.
+    """
+    signal.signal(signum, signal.default_int_handler if signum == signal.SIGINT else signal.SIG_DFL)
+    raise KeyboardInterrupt
+
+
+def _cancel_all_in_flight() -> int:
+    with _shared_lock:
+        clients = list(_shared_clients.values())
+    return sum(client.cancel_in_flight() for client in clients)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in PREWARM_COMMANDS:
+        # DNS + TLS handshake overlaps argument parsing and file reading
+        threading.Thread(target=_prewarm, daemon=True).start()
+
     parser = argparse.ArgumentParser(description="Text2SpeechSkill - Qwen3-TTS CLI")
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
+    # Options shared by commands that synthesize audio
+    synth_options = argparse.ArgumentParser(add_help=False)
+    synth_options.add_argument("--no-cache", action="store_true",
+                               help="Bypass the local synthesis cache")
+    synth_options.add_argument("--timings", action="store_true",
+                               help="Print per-job phase timings (submit, queue, synthesis, download)")
+
+    # Client-side submission limits
+    rate_options = argparse.ArgumentParser(add_help=False)
+    rate_options.add_argument("--max-rps", type=float, help="Submit at most this many jobs per second")
+    rate_options.add_argument("--max-cps", type=float, help="Submit at most this many text characters per second")
+
+    # Hedged requests, for commands that run many jobs
+    hedge_options = argparse.ArgumentParser(add_help=False)
+    hedge_options.add_argument("--hedge", type=float, metavar="PCT",
+                               help="Send a copy of a job to another backend once it waits longer than this "
+                                    "percentile of observed queue waits, e.g. 95 (needs several backends)")
+
     # speak - Custom voice
-    speak_parser = subparsers.add_parser("speak", help="Text to speech with preset speaker")
+    speak_parser = subparsers.add_parser("speak", help="Text to speech with preset speaker",
+                                         parents=[synth_options, rate_options, hedge_options])
     speak_parser.add_argument("text", help="Text to speak (or @file.txt)")
     speak_parser.add_argument("-s", "--speaker", default="vivian", help="Speaker name")
     speak_parser.add_argument("-l", "--language", default="Auto", help="Language")
     speak_parser.add_argument("-i", "--instruct", help="Style instruction")
-    speak_parser.add_argument("-o", "--output", required=True, help="Output file")
+    speak_parser.add_argument("-o", "--output", required=True, help="Output file (- for stdout with --stream)")
+    speak_parser.add_argument("--chunk", action="store_true",
+                              help="Split long text at sentence boundaries and synthesize chunks in parallel")
+    speak_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_CHARS,
+                              help=f"Max characters per chunk (default: {DEFAULT_CHUNK_CHARS})")
+    speak_parser.add_argument("-c", "--concurrency", type=int, default=4,
+                              help="Chunks kept in flight with --chunk/--stream (default: 4)")
+    speak_parser.add_argument("--stream", action="store_true",
+                              help="Write audio progressively (use -o - for stdout) and report TTFA")
+    speak_parser.add_argument("--first-chunk-size", type=int, default=DEFAULT_FIRST_CHUNK_CHARS,
+                              help=f"Max characters in the first --stream chunk (default: {DEFAULT_FIRST_CHUNK_CHARS})")
 
     # design - Voice design
-    design_parser = subparsers.add_parser("design", help="Design voice from description")
+    design_parser = subparsers.add_parser("design", help="Design voice from description",
+                                          parents=[synth_options, rate_options])
     design_parser.add_argument("text", help="Text to speak")
     design_parser.add_argument("-d", "--description", required=True, help="Voice description")
     design_parser.add_argument("-l", "--language", default="Auto", help="Language")
     design_parser.add_argument("-o", "--output", required=True, help="Output file")
 
     # clone - Voice clone
-    clone_parser = subparsers.add_parser("clone", help="Clone voice")
+    clone_parser = subparsers.add_parser("clone", help="Clone voice",
+                                         parents=[synth_options, rate_options])
     clone_parser.add_argument("text", help="Text to speak")
     clone_parser.add_argument("-a", "--audio", help="Reference audio file")
     clone_parser.add_argument("-t", "--timbre", help="Use preset timbre instead of audio")
@@ -448,20 +2002,50 @@ def main():
     clone_parser.add_argument("-o", "--output", required=True, help="Output file")
 
     # batch-speak
-    batch_speak_parser = subparsers.add_parser("batch-speak", help="Batch text to speech")
-    batch_speak_parser.add_argument("input_dir", help="Directory with .txt files")
+    batch_speak_parser = subparsers.add_parser("batch-speak", help="Batch text to speech",
+                                               parents=[synth_options, rate_options, hedge_options])
+    batch_speak_parser.add_argument("input_dir", help="Directory with .txt files, or a .jsonl/.csv manifest")
     batch_speak_parser.add_argument("output_dir", help="Output directory")
     batch_speak_parser.add_argument("-s", "--speaker", default="vivian", help="Speaker")
     batch_speak_parser.add_argument("-l", "--language", default="Auto", help="Language")
     batch_speak_parser.add_argument("-i", "--instruct", help="Style instruction")
+    batch_speak_parser.add_argument("-c", "--concurrency", type=_parse_concurrency, default=1,
+                                    help="Jobs kept in flight at once, or 'auto' to adapt to "
+                                         "backend load (default: 1)")
+    batch_speak_parser.add_argument("--fresh", "--force", action="store_true",
+                                    help="Ignore the journal/manifest and redo every file")
 
     # batch-clone
-    batch_clone_parser = subparsers.add_parser("batch-clone", help="Batch voice cloning")
+    batch_clone_parser = subparsers.add_parser("batch-clone", help="Batch voice cloning",
+                                               parents=[synth_options, rate_options, hedge_options])
     batch_clone_parser.add_argument("input_dir", help="Directory with .txt files")
     batch_clone_parser.add_argument("output_dir", help="Output directory")
-    batch_clone_parser.add_argument("-a", "--audio", required=True, help="Reference audio")
+    batch_clone_parser.add_argument("-a", "--audio", dest="reference_audio", required=True,
+                                    help="Reference audio")
     batch_clone_parser.add_argument("-r", "--ref-text", help="Reference transcript")
     batch_clone_parser.add_argument("-l", "--language", default="Auto", help="Language")
+    batch_clone_parser.add_argument("-c", "--concurrency", type=_parse_concurrency, default=1,
+                                    help="Jobs kept in flight at once, or 'auto' to adapt to "
+                                         "backend load (default: 1)")
+    batch_clone_parser.add_argument("--fresh", "--force", action="store_true",
+                                    help="Ignore the journal/manifest and redo every file")
+
+    # design-batch
+    design_batch_parser = subparsers.add_parser("design-batch",
+                                                help="Design a voice and clone it onto many texts",
+                                                parents=[rate_options])
+    design_batch_parser.add_argument("input_dir", help="Directory with .txt files, or a .jsonl/.csv manifest")
+    design_batch_parser.add_argument("output_dir", help="Output directory")
+    design_batch_parser.add_argument("-d", "--description", required=True, help="Voice description")
+    design_batch_parser.add_argument("--design-text", help="Text spoken while designing the voice "
+                                                            "(default: the first text of the batch)")
+    design_batch_parser.add_argument("-l", "--language", default="Auto", help="Language")
+    design_batch_parser.add_argument("-g", "--group-size", type=int, default=16,
+                                     help="Texts per server job (default: 16)")
+    design_batch_parser.add_argument("-c", "--concurrency", type=_parse_concurrency, default=4,
+                                     help="Jobs kept in flight at once, or 'auto' (default: 4)")
+    design_batch_parser.add_argument("--fresh", "--force", action="store_true",
+                                     help="Ignore the journal/manifest and redo every file")
 
     # encode
     encode_parser = subparsers.add_parser("encode", help="Encode audio to tokens")
@@ -473,6 +2057,28 @@ def main():
     decode_parser.add_argument("tokens_file", help="JSON file with tokens")
     decode_parser.add_argument("-o", "--output", required=True, help="Output audio file")
 
+    # bench
+    bench_parser = subparsers.add_parser("bench", help="Load-test the backend and report latency percentiles")
+    bench_parser.add_argument("-e", "--endpoint", choices=["custom", "design", "clone"], default="custom",
+                              help="Endpoint to drive (default: custom)")
+    bench_parser.add_argument("-c", "--concurrency", default="1,2,4,8",
+                              help="Comma-separated concurrency sweep (default: 1,2,4,8)")
+    bench_parser.add_argument("-n", "--requests", dest="requests_per_level", type=int, default=20,
+                              help="Requests per concurrency level (default: 20)")
+    bench_parser.add_argument("--rate", type=float, help="Cap submissions per second")
+    bench_parser.add_argument("--text", help="Text to synthesize (default: generated)")
+    bench_parser.add_argument("--text-chars", type=int, default=120, help="Length of generated text")
+    bench_parser.add_argument("-s", "--speaker", default="vivian", help="Speaker for custom")
+    bench_parser.add_argument("-d", "--description", default="calm narrator", help="Voice description for design")
+    bench_parser.add_argument("-a", "--audio", help="Reference audio for clone")
+    bench_parser.add_argument("-l", "--language", default="Auto", help="Language")
+    bench_parser.add_argument("--json", dest="json_output", help="Write JSON results to file (- for stdout)")
+
+    # cache
+    cache_parser = subparsers.add_parser("cache", help="Inspect or prune the synthesis cache")
+    cache_parser.add_argument("action", choices=["stats", "prune", "clear"], help="Cache action")
+    cache_parser.add_argument("--max-size", help="Prune down to this size (e.g. 500M, 2G)")
+
     # status
     subparsers.add_parser("status", help="Check service status")
 
@@ -489,7 +2095,7 @@ def main():
         sys.exit(1)
 
     # Handle @file.txt syntax
-    if hasattr(args, 'text') and args.text.startswith('@'):
+    if getattr(args, 'text', None) and args.text.startswith('@'):
         file_path = args.text[1:]
         args.text = Path(file_path).read_text(encoding='utf-8').strip()
 
@@ -499,9 +2105,12 @@ def main():
         "design": cmd_design,
         "clone": cmd_clone,
         "batch-speak": cmd_batch_speak,
+        "design-batch": cmd_design_batch,
         "batch-clone": cmd_batch_clone,
         "encode": cmd_encode,
         "decode": cmd_decode,
+        "cache": cmd_cache,
+        "bench": cmd_bench,
         "status": cmd_status,
         "speakers": cmd_speakers,
         "languages": cmd_languages,
@@ -509,7 +2118,14 @@ def main():
 
     cmd_func = commands.get(args.command)
     if cmd_func:
-        cmd_func(**vars(args))
+        signal.signal(signal.SIGINT, _interrupt)
+        signal.signal(signal.SIGTERM, _interrupt)
+        try:
+            cmd_func(**vars(args))
+        except KeyboardInterrupt:
+            _cancel_all_in_flight()
+            print("\n⚠ Interrupted, unfinished server jobs cancelled", file=sys.stderr)
+            sys.exit(130)
     else:
         print(f"Unknown command: {args.command}", file=sys.stderr)
         sys.exit(1)
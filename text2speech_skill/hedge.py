@@ -0,0 +1,57 @@
+"""Hedged requests: back up straggling jobs with a copy on another backend"""
+
+import threading
+from collections import deque
+from typing import Optional
+
+
+class HedgePolicy:
+    """When to send a duplicate of a slow job to another backend.
+
+    A job is hedged once it has sat in the queue, or run without its progress
+    advancing, for longer than the `percentile`th percentile of the queue
+    waits observed so far (and at least `min_delay` seconds). Nothing is
+    hedged until `min_samples` waits have been seen. At most `max_ratio` of
+    jobs are hedged, so a backend that is slow across the board is not
+    flooded with duplicates.
+    """
+
+    def __init__(self, percentile: float = 95.0, min_samples: int = 10, min_delay: float = 0.5,
+                 max_ratio: float = 0.1, window: int = 200):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.jobs = 0
+        self.hedged = 0
+        self._waits = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def begin(self):
+        """Count one more job towards the hedging budget"""
+        with self._lock:
+            self.jobs += 1
+
+    def record(self, wait: float):
+        """Observed queue wait of a job, in seconds"""
+        with self._lock:
+            self._waits.append(wait)
+
+    def delay(self) -> Optional[float]:
+        """Seconds without headway after which a job is hedged; None until enough waits are known"""
+        with self._lock:
+            if len(self._waits) < self.min_samples:
+                return None
+            waits = sorted(self._waits)
+        index = min(len(waits) - 1, int(len(waits) * self.percentile / 100))
+        return max(self.min_delay, waits[index])
+
+    def allow(self) -> bool:
+        """Take one hedge from the budget; False when it is spent"""
+        with self._lock:
+            if self.hedged + 1 > max(1.0, self.jobs * self.max_ratio):
+                return False
+            self.hedged += 1
+            return True
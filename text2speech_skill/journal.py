@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Append-only job journal that lets interrupted batch runs resume"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+JOURNAL_NAME = ".t2s-journal.jsonl"
+MANIFEST_NAME = ".t2s-manifest.json"
+
+
+class BatchJournal:
+    """JSONL log of batch item events kept in the output directory.
+
+    Each line records one event for one item: "submitted" (with the server
+    job id and the URL of the backend running it), "completed" (with the output checksum) or "failed". Every event
+    carries the item's fingerprint: a hash of its text and voice parameters.
+    Replaying the file gives each item's latest state, so a restarted run can
+    skip finished items and re-attach to jobs still running on the server
+    instead of resubmitting them.
+
+    At the end of a run, `compact` folds completed items into a JSON manifest
+    and truncates the log, so the journal does not grow across incremental
+    runs. Unchanged outputs are recognised by size and mtime, so they are not
+    re-hashed.
+    """
+
+    def __init__(self, path: Path, manifest_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.manifest_path = Path(manifest_path) if manifest_path else self.path.parent / MANIFEST_NAME
+        self.state = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            self.state = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line from a crash
+                    self._apply(record)
+        except FileNotFoundError:
+            pass
+
+    def _apply(self, record: dict):
+        item = record.get("item")
+        if item is None:
+            return
+        if self.state.get(item, {}).get("fingerprint") != record.get("fingerprint"):
+            self.state[item] = {}
+        self.state[item].update(record)
+
+    def record(self, item: str, event: str, fingerprint: str, **fields):
+        """Append one event and flush it to the OS before returning"""
+        record = {"item": item, "event": event, "fingerprint": fingerprint, "time": time.time(), **fields}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self._apply(record)
+
+    def is_completed(self, item: str, fingerprint: str, output_path: str, checksum) -> bool:
+        """True if item finished with this fingerprint and its output is intact.
+
+        An output whose size and mtime match the record is trusted as is.
+        Otherwise `checksum(path)` must reproduce the recorded sha256.
+        """
+        entry = self.state.get(item, {})
+        if entry.get("event") != "completed" or entry.get("fingerprint") != fingerprint:
+            return False
+        try:
+            st = os.stat(output_path)
+        except OSError:
+            return False
+        if entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return True
+        if entry.get("sha256") != checksum(output_path):
+            return False
+        with self._lock:
+            entry.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+        return True
+
+    def complete(self, item: str, fingerprint: str, output_path: str, checksum, **fields):
+        """Record a finished item together with its output's checksum and stat signature"""
+        st = os.stat(output_path)
+        self.record(item, "completed", fingerprint, output=str(output_path), sha256=checksum(output_path),
+                    size=st.st_size, mtime_ns=st.st_mtime_ns, **fields)
+
+    def pending_job(self, item: str, fingerprint: str) -> Optional[str]:
+        """Server job id of an item that was submitted but never finished"""
+        entry = self.state.get(item, {})
+        if entry.get("event") == "submitted" and entry.get("fingerprint") == fingerprint:
+            return entry.get("job_id")
+        return None
+
+    def pending_backend(self, item: str, fingerprint: str) -> Optional[str]:
+        """URL of the backend running the item's pending job, if it was recorded"""
+        entry = self.state.get(item, {})
+        if entry.get("event") == "submitted" and entry.get("fingerprint") == fingerprint:
+            return entry.get("backend")
+        return None
+
+    def compact(self):
+        """Fold completed items into the manifest and truncate the event log"""
+        with self._lock:
+            manifest = {item: entry for item, entry in self.state.items() if entry.get("event") == "completed"}
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.manifest_path.with_name(f".{self.manifest_path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=1, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.manifest_path)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def reset(self):
+        """Forget all recorded state (for a fresh run)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            for path in (self.path, self.manifest_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self.state = {}
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,132 @@
+"""Client-side rate limiting and adaptive concurrency for Text2Speech (TTSWeb) jobs"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` per second, holding at most `burst`.
+
+    `acquire(n)` takes n tokens and sleeps off any shortfall. The bucket may go
+    into debt, so a single request larger than `burst` (a long text against a
+    characters/s limit) waits its fair share instead of blocking forever.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take `amount` tokens, sleeping as needed; returns seconds waited"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Requests-per-second and characters-per-second limits on job submissions"""
+
+    def __init__(self, requests_per_second: Optional[float] = None,
+                 chars_per_second: Optional[float] = None):
+        self.requests = TokenBucket(requests_per_second) if requests_per_second else None
+        self.chars = TokenBucket(chars_per_second) if chars_per_second else None
+
+    def acquire(self, chars: int = 0) -> float:
+        """Block until one request of `chars` characters may be sent; returns seconds waited"""
+        waited = 0.0
+        if self.requests:
+            waited += self.requests.acquire()
+        if self.chars and chars:
+            waited += self.chars.acquire(chars)
+        return waited
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease limit on in-flight jobs.
+
+    Until the first sign of congestion, every completion adds one slot, so the
+    limit doubles each round (slow start). After that, while the smoothed queue
+    wait stays within `tolerance` times its baseline (plus `floor` seconds),
+    every completion adds `increase / limit`, so the limit grows by about
+    `increase` per round of jobs. An error, a throttling response or a
+    latency rise multiplies the limit by `decrease`. After a decrease, the
+    jobs that were already in flight must finish before it can happen again.
+    Their queue waits describe the old limit, and one burst of failures
+    should not collapse the limit to `minimum`. The baseline is the lowest smoothed queue wait
+    seen, and it drifts slowly upward so a lasting change in the backend is
+    eventually accepted.
+    """
+
+    def __init__(self, initial: int = 2, minimum: int = 1, maximum: int = 32,
+                 increase: float = 1.0, decrease: float = 0.5, tolerance: float = 2.0,
+                 floor: float = 0.25, smoothing: float = 0.3):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.peak = self.limit
+        self.increase = increase
+        self.decrease = decrease
+        self.tolerance = tolerance
+        self.floor = floor
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self._latency = None
+        self._baseline = None
+        self._since_decrease = 0
+        self._recovery = 0
+        self._slow_start = True
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until another job fits under the current limit"""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: Optional[float] = None, error: bool = False):
+        """Finish a job, feeding back its queue wait (None if unknown) and whether it failed"""
+        with self._cond:
+            self.in_flight -= 1
+            if error or latency is not None:
+                self._update(latency, error)
+            self._cond.notify_all()
+
+    def throttle(self):
+        """Congestion signal without a completion (e.g. a 429 that was retried)"""
+        with self._cond:
+            self._update(None, True)
+
+    def _update(self, latency: Optional[float], error: bool):
+        self._since_decrease += 1
+        congested = error
+        if latency is not None:
+            if self._latency is None:
+                self._latency = self._baseline = latency
+            else:
+                self._latency += self.smoothing * (latency - self._latency)
+                self._baseline = min(self._latency, self._baseline + 0.01 * (self._latency - self._baseline))
+            congested = congested or self._latency > self._baseline * self.tolerance + self.floor
+        if congested:
+            self._slow_start = False
+            if self._since_decrease >= self._recovery:
+                self.limit = max(float(self.minimum), self.limit * self.decrease)
+                self._since_decrease = 0
+                self._recovery = self.in_flight + 1
+        else:
+            step = 1.0 if self._slow_start else self.increase / self.limit
+            self.limit = min(float(self.maximum), self.limit + step)
+        self.peak = max(self.peak, self.limit)
@@ -0,0 +1,88 @@
+"""Batch manifests: one synthesis item per JSONL line or CSV row"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+ENDPOINTS = ("custom", "design", "clone", "timbre")
+MANIFEST_SUFFIXES = (".jsonl", ".csv")
+_TRUE = ("1", "true", "yes", "y")
+
+
+def iter_manifest(path: Path) -> Iterator[Tuple[int, dict]]:
+    """Yield (line number, raw row) pairs, reading the file incrementally.
+
+    JSONL lines that are blank or start with "#" are skipped. A malformed line
+    yields {"error": ...} so one bad row does not stop the whole batch. Empty
+    CSV cells are dropped so they fall back to defaults.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {k.strip(): v for k, v in row.items() if k and v not in (None, "")}
+            return
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                row = {"error": f"invalid JSON: {e}"}
+            if not isinstance(row, dict):
+                row = {"error": "row is not a JSON object"}
+            yield lineno, row
+
+
+def parse_row(row: dict, lineno: int, base_dir: Path, speaker: Optional[str] = None,
+              language: str = "Auto", instruct: Optional[str] = None) -> dict:
+    """Validate one manifest row and return {"kind", "text", "output", "params"}.
+
+    `speaker`, `language` and `instruct` are the batch-wide defaults for
+    custom-voice rows. Relative `text_file` and `ref_audio` paths resolve
+    against `base_dir` (the manifest's directory); `output` must stay inside
+    the output directory. Raises ValueError for rows that cannot be synthesized.
+    """
+    if "error" in row:
+        raise ValueError(row["error"])
+    kind = str(row.get("endpoint", "custom")).lower()
+    if kind not in ENDPOINTS:
+        raise ValueError(f"unknown endpoint {kind!r} (expected one of {', '.join(ENDPOINTS)})")
+
+    text_file = row.get("text_file")
+    if row.get("text"):
+        text = str(row["text"]).strip()
+    elif text_file:
+        text = (base_dir / text_file).read_text(encoding="utf-8").strip()
+    else:
+        raise ValueError("row has neither text nor text_file")
+    if not text:
+        raise ValueError("empty text")
+
+    output = Path(row.get("output") or (f"{Path(text_file).stem}.wav" if text_file else f"line{lineno:05d}.wav"))
+    if output.is_absolute() or ".." in output.parts:
+        raise ValueError(f"output must be a relative path inside the output directory: {output}")
+    params = {"language": row.get("language") or language}
+    if kind == "custom":
+        params.update(speaker=row.get("speaker") or speaker, instruct=row.get("instruct", instruct))
+    elif kind == "design":
+        description = row.get("instruct") or row.get("description")
+        if not description:
+            raise ValueError("design rows need instruct (the voice description)")
+        params["instruct"] = description
+    elif kind == "timbre":
+        if not row.get("speaker"):
+            raise ValueError("timbre rows need speaker (the timbre name)")
+        params.update(speaker=row["speaker"], instruct=row.get("instruct"))
+    else:
+        if not row.get("ref_audio"):
+            raise ValueError("clone rows need ref_audio")
+        ref_audio = base_dir / row["ref_audio"]
+        if not ref_audio.exists():
+            raise ValueError(f"reference audio not found: {ref_audio}")
+        params.update(audio_path=str(ref_audio), ref_text=row.get("ref_text"), instruct=row.get("instruct"),
+                      x_vector_only=str(row.get("x_vector_only", "")).lower() in _TRUE)
+    return {"kind": kind, "text": text, "output": str(output), "params": params}
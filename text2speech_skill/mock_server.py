@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""Local stand-in for the TTSWeb API, for offline tests and benchmarks.
+
+Run it with `python -m text2speech_skill.mock_server --port 24536` and point a
+client at LOCAL_API, or start it in-process:
+
+    with MockServer(MockConfig(workers=2, latency="lognormal:-1,0.5")) as server:
+        client = Text2SpeechClient(server.base_url)
+
+Jobs are queued onto `workers` simulated GPU slots. Each job waits for a free
+slot, then "synthesizes" for a time drawn from the latency distribution plus a
+per-character cost, plus the load time of its model if no job has used that
+model yet. Completed jobs serve a synthetic sine-wave WAV whose length
+follows the text length.
+"""
+
+import argparse
+import json
+import math
+import random
+import struct
+import threading
+import time
+import uuid
+from collections import deque
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from text2speech_skill.audio import pcm16_wav
+
+API_PREFIX = "/api/v1"
+
+SPEAKERS = [
+    {"name": "vivian", "description": "Bright, warm young female voice", "languages": ["Chinese", "English"]},
+    {"name": "serena", "description": "Gentle, soft-spoken female voice", "languages": ["Chinese", "English"]},
+    {"name": "uncle_fu", "description": "Mellow, low-pitched mature male voice", "languages": ["Chinese"]},
+    {"name": "dylan", "description": "Youthful Beijing male voice", "languages": ["Chinese"]},
+    {"name": "eric", "description": "Lively Chengdu male voice", "languages": ["Chinese"]},
+    {"name": "ryan", "description": "Dynamic male voice with strong rhythm", "languages": ["English"]},
+    {"name": "aiden", "description": "Sunny American male voice", "languages": ["English"]},
+    {"name": "ono_anna", "description": "Playful Japanese female voice", "languages": ["Japanese"]},
+    {"name": "sohee", "description": "Warm Korean female voice", "languages": ["Korean"]},
+]
+
+LANGUAGES = [
+    {"code": code, "name": code}
+    for code in ["Auto", "Chinese", "English", "Japanese", "Korean", "German",
+                 "French", "Russian", "Portuguese", "Spanish", "Italian"]
+]
+
+MODELS = ["custom_voice", "voice_design", "base"]
+ENDPOINT_MODELS = {"custom-voice": "custom_voice", "voice-design": "voice_design",
+                   "voice-clone": "base", "voice-design-clone": "voice_design"}
+
+
+def sample_latency(spec: str, rng: random.Random = random) -> float:
+    """Draw seconds from a spec such as "fixed:0.5", "uniform:0.2,1", "exp:0.5" or "lognormal:-1,0.5" """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    if kind == "fixed":
+        return values[0]
+    if kind == "uniform":
+        return rng.uniform(values[0], values[1])
+    if kind == "exp":
+        return rng.expovariate(1.0 / values[0])
+    if kind == "lognormal":
+        return rng.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def synth_wav(seconds: float, sample_rate: int = 24000, period: int = 110) -> bytes:
+    """16-bit mono PCM WAV containing a sine tone (one cycle every `period` samples)"""
+    frames = max(1, int(seconds * sample_rate))
+    cycle = struct.pack(f"<{period}h", *(int(8000 * math.sin(2 * math.pi * i / period)) for i in range(period)))
+    return pcm16_wav((cycle * (frames // period + 1))[:frames * 2], sample_rate)
+
+
+class MockConfig:
+    """Behaviour knobs for MockServer"""
+
+    def __init__(self, workers: int = 4, latency: str = "fixed:0.2", seconds_per_char: float = 0.0,
+                 audio_seconds_per_char: float = 0.06, queue_capacity: int = 0,
+                 fail_rate: float = 0.0, error_rate: float = 0.0, stall_rate: float = 0.0,
+                 sample_rate: int = 24000,
+                 bulk_status: bool = True, voice_prompts: bool = True, models: Optional[list] = None,
+                 load_seconds: float = 0.0, seed: Optional[int] = None):
+        self.workers = workers
+        self.latency = latency
+        self.seconds_per_char = seconds_per_char
+        self.audio_seconds_per_char = audio_seconds_per_char
+        self.queue_capacity = queue_capacity  # 0 = unbounded
+        self.fail_rate = fail_rate  # jobs that end in "failed"
+        self.error_rate = error_rate  # submissions answered with HTTP 500
+        self.stall_rate = stall_rate  # jobs whose progress freezes while running, until cancelled
+        self.sample_rate = sample_rate
+        self.bulk_status = bulk_status
+        self.voice_prompts = voice_prompts
+        self.models = MODELS if models is None else models  # loaded at startup
+        self.load_seconds = load_seconds  # cold-load time for any other model
+        self.seed = seed
+
+
+class MockJob:
+    def __init__(self, kind: str, texts: list):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.texts = texts
+        self.status = "queued"
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.duration = None
+        self.finished = None
+        self.stalled_at = None  # progress the job froze at, if it stalls
+
+    def to_status(self) -> dict:
+        status = {"job_id": self.id, "status": self.status, "progress": 0.0, "created_at": self.created}
+        if self.status == "running" and self.stalled_at is not None:
+            status["progress"] = self.stalled_at
+        elif self.status == "running" and self.duration:
+            status["progress"] = round(min(0.99, (time.time() - self.started) / self.duration), 3)
+        if self.started:
+            status["started_at"] = self.started
+        if self.status == "completed":
+            status["progress"] = 1.0
+            status["completed_at"] = self.finished
+            urls = [f"{API_PREFIX}/audio/{self.id}-{i}.wav" for i in range(len(self.texts))]
+            status["audio_url"] = urls[0]
+            if self.kind == "voice-design-clone":
+                status["audio_urls"] = urls
+        if self.error:
+            status["error"] = self.error
+        return status
+
+
+class MockBackend:
+    """Job queue and simulated GPU workers behind the HTTP handler"""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.jobs: Dict[str, MockJob] = {}
+        self.prompts: Dict[str, bytes] = {}
+        self.idempotency: Dict[str, str] = {}
+        self.loaded: Dict[str, float] = {name: 0.0 for name in config.models}  # model -> monotonic ready time
+        self.queue = deque()
+        self.lock = threading.Condition()
+        self.stats = {"submitted": 0, "rejected": 0, "status_requests": 0, "meta_requests": 0, "downloads": 0}
+        self.closed = False
+        self.threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(config.workers)]
+        for t in self.threads:
+            t.start()
+
+    def submit(self, kind: str, texts: list, idempotency_key: Optional[str] = None) -> MockJob:
+        with self.lock:
+            if idempotency_key in self.idempotency:
+                return self.jobs[self.idempotency[idempotency_key]]
+            if self.config.queue_capacity and len(self.queue) >= self.config.queue_capacity:
+                self.stats["rejected"] += 1
+                raise OverflowError("queue full")
+            job = MockJob(kind, texts)
+            self.jobs[job.id] = job
+            if idempotency_key:
+                self.idempotency[idempotency_key] = job.id
+            self.queue.append(job)
+            self.stats["submitted"] += 1
+            self.lock.notify()
+        return job
+
+    def cancel(self, job_id: str) -> Optional[MockJob]:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job and job.status in ("queued", "running"):
+                job.status = "cancelled"
+                self.lock.notify_all()
+            return job
+
+    def _worker(self):
+        while True:
+            with self.lock:
+                while not self.queue and not self.closed:
+                    self.lock.wait()
+                if self.closed:
+                    return
+                job = self.queue.popleft()
+                if job.status != "queued":
+                    continue
+                chars = sum(len(t) for t in job.texts)
+                job.duration = sample_latency(self.config.latency, self.rng) + chars * self.config.seconds_per_char
+                # The first job needing an unloaded model pays its load time (later ones wait out the rest)
+                ready = self.loaded.setdefault(ENDPOINT_MODELS[job.kind], time.monotonic() + self.config.load_seconds)
+                job.duration += max(0.0, ready - time.monotonic())
+                job.started = time.time()
+                job.status = "running"
+                fail = self.rng.random() < self.config.fail_rate
+                if self.rng.random() < self.config.stall_rate:
+                    job.stalled_at = round(self.rng.uniform(0.1, 0.6), 3)
+                    job.duration = float("inf")
+                deadline = time.monotonic() + job.duration
+                while job.status == "running" and not self.closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.lock.wait(min(remaining, 3600.0))
+                if job.status == "running":
+                    job.finished = time.time()
+                    if fail:
+                        job.status, job.error = "failed", "Injected failure"
+                    else:
+                        job.status = "completed"
+
+    def audio(self, name: str) -> Optional[bytes]:
+        job_id, _, index = name.rpartition(".")[0].rpartition("-")
+        job = self.jobs.get(job_id)
+        if not job or job.status != "completed":
+            return None
+        text = job.texts[int(index or 0)]
+        seconds = max(0.25, len(text) * self.config.audio_seconds_per_char)
+        return synth_wav(seconds, self.config.sample_rate)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.lock.notify_all()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    backend: MockBackend = None
+    protocol_version = "HTTP/1.1"
+    # Buffer headers and body into one write and skip Nagle, so keep-alive
+    # requests are not stalled by delayed ACKs
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, code: int, body: bytes, content_type: str = "application/json", headers=None):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, data, code: int = 200, headers=None):
+        self._send(code, json.dumps(data).encode(), headers=headers)
+
+    def _error(self, code: int, detail: str, headers=None):
+        self._json({"detail": detail}, code, headers)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _form(self, body: bytes) -> dict:
+        """Parse JSON or multipart/form-data into a dict (file parts as bytes)"""
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("application/json"):
+            return json.loads(body or b"{}")
+        if content_type.startswith("multipart/form-data"):
+            message = BytesParser(policy=HTTP).parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+            form = {}
+            for part in message.iter_parts():
+                name = part.get_param("name", header="content-disposition")
+                payload = part.get_payload(decode=True)
+                form[name] = payload if part.get_filename() else payload.decode("utf-8")
+            return form
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            from urllib.parse import parse_qsl
+            return dict(parse_qsl(body.decode("utf-8")))
+        return {}
+
+    def _route(self) -> str:
+        path = urlparse(self.path).path
+        return path[len(API_PREFIX):] if path.startswith(API_PREFIX) else path
+
+    def do_GET(self):
+        path = self._route()
+        backend = self.backend
+        if path == "/health" or path.startswith("/meta/"):
+            backend.stats["meta_requests"] += 1
+        if path == "/health":
+            return self._json({"status": "ok", "version": "mock", "gpu_available": False, "mock_mode": True})
+        if path == "/meta/speakers":
+            return self._json(SPEAKERS)
+        if path == "/meta/languages":
+            return self._json(LANGUAGES)
+        if path == "/meta/models":
+            now = time.monotonic()
+            return self._json([{"name": name, "loaded": backend.loaded.get(name, now + 1) <= now} for name in MODELS])
+        if path.startswith("/jobs/") and path.endswith("/status"):
+            backend.stats["status_requests"] += 1
+            job = backend.jobs.get(path.split("/")[2])
+            if not job:
+                return self._error(404, "Job not found")
+            return self._json(job.to_status())
+        if path.startswith("/audio/"):
+            audio = backend.audio(path[len("/audio/"):])
+            if audio is None:
+                return self._error(404, "Audio not found")
+            backend.stats["downloads"] += 1
+            return self._send(200, audio, "audio/wav")
+        return self._error(404, "Not found")
+
+    def do_POST(self):
+        path = self._route()
+        backend = self.backend
+        config = backend.config
+        body = self._body()
+        if path.startswith("/tts/"):
+            return self._submit(path[len("/tts/"):], self._form(body))
+        if path == "/jobs/status" and config.bulk_status:
+            ids = self._form(body).get("job_ids", [])
+            backend.stats["status_requests"] += 1
+            return self._json({"jobs": [backend.jobs[i].to_status() for i in ids if i in backend.jobs]})
+        if path.startswith("/jobs/") and path.endswith("/cancel"):
+            job = backend.cancel(path.split("/")[2])
+            if not job:
+                return self._error(404, "Job not found")
+            return self._json(job.to_status())
+        if path == "/tokenizer/encode":
+            audio = self._form(body).get("audio", b"")
+            tokens = list(audio[44:44 + 2000:4])
+            return self._json({"tokens": tokens, "count": len(tokens)})
+        if path == "/tokenizer/decode":
+            tokens = self._form(body).get("tokens", [])
+            return self._send(200, synth_wav(len(tokens) / 12.5, config.sample_rate), "audio/wav")
+        return self._error(404, "Not found")
+
+    def _submit(self, endpoint: str, form: dict):
+        backend = self.backend
+        config = backend.config
+        if endpoint == "voice-prompts":
+            if not config.voice_prompts:
+                return self._error(404, "Not found")
+            prompt_id = uuid.uuid4().hex[:12]
+            backend.prompts[prompt_id] = form.get("audio", b"")
+            return self._json({"prompt_id": prompt_id})
+        if endpoint not in ("custom-voice", "voice-design", "voice-clone", "voice-design-clone"):
+            return self._error(404, "Not found")
+        if backend.rng.random() < config.error_rate:
+            return self._error(500, "Injected server error")
+        if endpoint == "voice-clone" and "audio" not in form and form.get("prompt_id") not in backend.prompts:
+            return self._error(404 if "prompt_id" in form else 422, "Reference audio required")
+        texts = form.get("clone_texts") if endpoint == "voice-design-clone" else [form.get("text", "")]
+        if not texts or not all(texts):
+            return self._error(422, "Text required")
+        try:
+            job = backend.submit(endpoint, texts, self.headers.get("Idempotency-Key"))
+        except OverflowError:
+            return self._error(429, "Queue full", headers={"Retry-After": "1"})
+        return self._json({"job_id": job.id, "status": job.status})
+
+
+class MockServer:
+    """Threaded mock TTSWeb server; usable as a context manager"""
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self.backend = MockBackend(self.config)
+        handler = type("BoundMockHandler", (MockHandler,), {"backend": self.backend})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.backend.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock TTSWeb server for offline tests and benchmarks")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=24536, help="Port (default: 24536, as LOCAL_API)")
+    parser.add_argument("--workers", type=int, default=4, help="Simulated GPU slots")
+    parser.add_argument("--latency", default="fixed:0.2",
+                        help="Per-job synthesis time: fixed:S, uniform:A,B, exp:MEAN or lognormal:MU,SIGMA")
+    parser.add_argument("--seconds-per-char", type=float, default=0.0, help="Extra synthesis time per character")
+    parser.add_argument("--queue-capacity", type=int, default=0, help="Max queued jobs before 429 (0 = unbounded)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of jobs that end in 'failed'")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of submissions answered with 500")
+    parser.add_argument("--stall-rate", type=float, default=0.0,
+                        help="Fraction of jobs whose progress freezes while running (until cancelled)")
+    parser.add_argument("--no-bulk-status", action="store_true", help="Disable POST /jobs/status")
+    parser.add_argument("--no-voice-prompts", action="store_true", help="Disable POST /tts/voice-prompts")
+    parser.add_argument("--models", help=f"Comma-separated models loaded at startup (default: all of {','.join(MODELS)})")
+    parser.add_argument("--load-seconds", type=float, default=0.0, help="Time to load any other model on first use")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+
+    config = MockConfig(workers=args.workers, latency=args.latency, seconds_per_char=args.seconds_per_char,
+                        queue_capacity=args.queue_capacity, fail_rate=args.fail_rate,
+                        error_rate=args.error_rate, stall_rate=args.stall_rate, bulk_status=not args.no_bulk_status,
+                        voice_prompts=not args.no_voice_prompts,
+                        models=None if args.models is None else [m for m in args.models.split(",") if m],
+                        load_seconds=args.load_seconds, seed=args.seed)
+    server = MockServer(config, args.host, args.port)
+    print(f"Mock TTSWeb listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        server.backend.close()
+
+
+if __name__ == "__main__":
+    main()
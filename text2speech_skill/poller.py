@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""Job status polling for Text2Speech (TTSWeb) jobs"""
+
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from text2speech_skill.retry import is_transient, parse_retry_after
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class PollPolicy:
+    """Adaptive schedule for job status polling.
+
+    Delays start at `initial` and grow by `multiplier` up to `maximum`. Once the
+    job reports advancing `progress`, the next poll is pulled in to the
+    predicted completion time. Every delay is spread by +/- `jitter` so many
+    clients do not poll in lockstep, and a server retry hint is treated as a
+    lower bound.
+    """
+
+    def __init__(self, initial: float = 0.1, maximum: float = 5.0, multiplier: float = 1.6,
+                 jitter: float = 0.2, min_interval: float = 0.05, use_eta: bool = True):
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.min_interval = min_interval
+        self.use_eta = use_eta
+
+    @classmethod
+    def fixed(cls, interval: float) -> "PollPolicy":
+        """Constant interval without jitter or ETA prediction"""
+        return cls(initial=interval, maximum=interval, multiplier=1.0, jitter=0.0,
+                   min_interval=interval, use_eta=False)
+
+    @staticmethod
+    def estimate_remaining(samples: List[tuple]) -> Optional[float]:
+        """Seconds until progress reaches 1.0 from (timestamp, progress) samples"""
+        if len(samples) < 2:
+            return None
+        (t0, p0), (t1, p1) = samples[0], samples[-1]
+        if p1 <= p0 or t1 <= t0:
+            return None
+        return max(0.0, (1.0 - p1) * (t1 - t0) / (p1 - p0))
+
+    def next_delay(self, attempt: int, samples: Optional[List[tuple]] = None,
+                   retry_after: Optional[float] = None) -> float:
+        """Delay before poll number `attempt + 1`"""
+        delay = min(self.maximum, self.initial * (self.multiplier ** attempt))
+        if self.use_eta and samples:
+            eta = self.estimate_remaining(samples)
+            if eta is not None:
+                delay = min(delay, eta)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        delay = max(self.min_interval, delay)
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+
+def retry_after_hint(status: dict) -> Optional[float]:
+    """Server-suggested seconds before the next poll, if the status carries one"""
+    for key in ("retry_after", "poll_after"):
+        seconds = parse_retry_after(status.get(key))
+        if seconds is not None:
+            return seconds
+    return None
+
+
+class JobStalled(TimeoutError):
+    """A running job's progress stopped advancing (see StallPolicy); the job was cancelled"""
+
+    def __init__(self, job_id: str, stalled_for: float):
+        super().__init__(f"Job {job_id} stalled: no progress for {stalled_for:.0f}s")
+        self.job_id = job_id
+        self.stalled_for = stalled_for
+
+
+class StallPolicy:
+    """When a running job with flat progress counts as stalled, and how often to resubmit it.
+
+    Every job's gaps between progress advances feed a smoothed typical gap. A
+    running job is stalled once its progress has stayed flat for `factor`
+    times the larger of that typical gap and the job's own longest gap,
+    clamped to [min_window, max_window]. Detection starts after `min_samples`
+    gaps, so a server that only reports progress at the end does not look
+    stalled. Text2SpeechClient.synthesize cancels a stalled job and
+    resubmits it up to `max_resubmits` times, to a different backend when
+    `other_backend` is set and one exists. At most `budget` of all jobs are
+    resubmitted.
+    """
+
+    def __init__(self, factor: float = 4.0, min_window: float = 30.0, max_window: float = 600.0,
+                 min_samples: int = 5, max_resubmits: int = 2, budget: float = 0.1,
+                 other_backend: bool = True, smoothing: float = 0.2):
+        self.factor = factor
+        self.min_window = min_window
+        self.max_window = max_window
+        self.min_samples = min_samples
+        self.max_resubmits = max_resubmits
+        self.budget = budget
+        self.other_backend = other_backend
+        self.smoothing = smoothing
+        self.gaps = 0
+        self.jobs = 0
+        self.resubmitted = 0
+        self._typical = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def none(cls) -> "StallPolicy":
+        """Policy that never declares a job stalled"""
+        return cls(factor=0.0, max_resubmits=0)
+
+    def record_gap(self, gap: float):
+        """Seconds between two progress advances of a running job"""
+        with self._lock:
+            self.gaps += 1
+            self._typical = gap if self._typical is None else self._typical + self.smoothing * (gap - self._typical)
+
+    def window(self, longest_gap: float = 0.0) -> Optional[float]:
+        """Seconds of flat progress after which a job is stalled; None while detection is off"""
+        with self._lock:
+            if self.factor <= 0 or self.gaps < self.min_samples:
+                return None
+            typical = self._typical
+        return min(self.max_window, max(self.min_window, self.factor * max(typical, longest_gap)))
+
+    def begin(self):
+        """Count one more job towards the resubmission budget"""
+        with self._lock:
+            self.jobs += 1
+
+    def allow(self, resubmits: int) -> bool:
+        """Whether a job already resubmitted `resubmits` times may be resubmitted again (takes budget)"""
+        with self._lock:
+            if resubmits >= self.max_resubmits or self.resubmitted + 1 > max(1.0, self.jobs * self.budget):
+                return False
+            self.resubmitted += 1
+            return True
+
+
+class StallWatch:
+    """Follows one job's progress and reports when StallPolicy deems it stalled"""
+
+    def __init__(self, policy: Optional[StallPolicy]):
+        self.policy = policy
+        self.progress = None
+        self.since = None  # when progress last changed while running
+        self.longest = 0.0
+
+    def observe(self, status: dict) -> Optional[float]:
+        """Feed one status; returns seconds of flat progress once past the window, else None"""
+        if self.policy is None:
+            return None
+        now = time.monotonic()
+        state = status.get("status")
+        if state == "completed" and self.since is not None:
+            self.policy.record_gap(now - self.since)
+        if state != "running":
+            return None
+        progress = status.get("progress")
+        if self.since is None or progress != self.progress:
+            if self.since is not None:
+                self.longest = max(self.longest, now - self.since)
+                self.policy.record_gap(now - self.since)
+            self.progress, self.since = progress, now
+            return None
+        window = self.policy.window(self.longest)
+        flat = now - self.since
+        return flat if window is not None and flat >= window else None
+
+
+class _TrackedJob:
+    def __init__(self, job_id: str, deadline: float, progress_callback=None,
+                 stall: Optional[StallPolicy] = None):
+        self.job_id = job_id
+        self.deadline = deadline
+        self.progress_callback = progress_callback
+        self.future = Future()
+        self.attempt = 0
+        self.samples = []
+        self.watch = StallWatch(stall)
+        self.next_due = time.monotonic()
+
+    def observe(self, status: dict):
+        progress = status.get("progress")
+        if isinstance(progress, (int, float)):
+            if self.samples and progress < self.samples[-1][1]:
+                self.samples = []
+            self.samples = self.samples[-4:] + [(time.monotonic(), float(progress))]
+
+
+class JobPoller:
+    """Track many jobs from one polling thread.
+
+    Jobs registered with `track` are polled on the client's PollPolicy over
+    the client's shared session. When a backend exposes the bulk
+    `POST /jobs/status` endpoint, all its due jobs are fetched in one request;
+    otherwise they are polled one by one from the same thread. Jobs falling
+    due within `coalesce` seconds of the earliest one are polled with it
+    while bulk fetches are possible, so jittered schedules still share
+    requests. Each job resolves a Future with
+    its final status dict, or fails with TimeoutError, or JobStalled under
+    the client's StallPolicy.
+    """
+
+    def __init__(self, client, timeout: float = 300.0, bulk: Optional[bool] = None,
+                 max_batch: int = 100, coalesce: float = 0.5):
+        self.client = client
+        self.timeout = timeout
+        self.bulk = bulk  # None = probe on first use
+        self.max_batch = max_batch
+        self.coalesce = coalesce
+        self._jobs: Dict[str, _TrackedJob] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._jobs)
+
+    def track(self, job_id: str, callback: Optional[Callable[[dict], None]] = None,
+              progress_callback: Optional[Callable[[dict], None]] = None,
+              timeout: Optional[float] = None) -> Future:
+        """Start tracking a job; returns a Future resolving to its final status"""
+        job = _TrackedJob(job_id, time.monotonic() + (timeout or self.timeout), progress_callback,
+                          self.client.stall)
+        if callback:
+            job.future.add_done_callback(
+                lambda f: callback(f.result()) if not f.cancelled() and f.exception() is None else None)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JobPoller is closed")
+            self._jobs[job_id] = job
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="t2s-job-poller", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return job.future
+
+    def wait(self, job_id: str, progress_callback=None, timeout: Optional[float] = None) -> dict:
+        """Blocking helper mirroring Text2SpeechClient.wait_for_completion"""
+        return self.track(job_id, progress_callback=progress_callback, timeout=timeout).result()
+
+    def close(self):
+        """Stop polling; jobs still tracked are cancelled, on the server too"""
+        with self._lock:
+            self._closed = True
+            pending = list(self._jobs.values())
+            self._jobs.clear()
+        self._wake.set()
+        for job in pending:
+            job.future.cancel()
+        if pending:
+            self.client.cancel_jobs([job.job_id for job in pending])
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                # Cleared before the scan: a track() after this point sets it again
+                self._wake.clear()
+                now = time.monotonic()
+                upcoming = min((j.next_due for j in self._jobs.values()), default=None)
+                window = self.coalesce if self._bulk_possible() else 0.0
+                due = [j for j in self._jobs.values()
+                       if upcoming is not None and upcoming <= now and j.next_due <= now + window]
+            if not due:
+                self._wake.wait(None if upcoming is None else max(0.0, upcoming - now))
+                continue
+            for start in range(0, len(due), self.max_batch):
+                self._poll(due[start:start + self.max_batch])
+
+    def _poll(self, jobs: List[_TrackedJob]):
+        try:
+            statuses = self._fetch([j.job_id for j in jobs])
+        except Exception as e:
+            statuses = {j.job_id: e for j in jobs}
+        expired = []
+        stalled = []
+        for job in jobs:
+            result = statuses.get(job.job_id)
+            if isinstance(result, Exception) and not is_transient(result):
+                self._finish(job, error=result)
+                continue
+            if isinstance(result, dict):
+                try:
+                    if job.progress_callback:
+                        job.progress_callback(result)
+                    flat = job.watch.observe(result)
+                except Exception as e:
+                    # A failing callback fails its own job, not the polling thread
+                    self._finish(job, error=e)
+                    continue
+                if result.get("status") in TERMINAL_STATUSES:
+                    self._finish(job, status=result)
+                    continue
+                if flat is not None:
+                    stalled.append((job, flat))
+                    continue
+                job.observe(result)
+            if time.monotonic() >= job.deadline:
+                expired.append(job)
+                continue
+            hint = retry_after_hint(result) if isinstance(result, dict) else None
+            delay = self.client.poll_policy.next_delay(job.attempt, job.samples, hint)
+            job.attempt += 1
+            job.next_due = min(time.monotonic() + delay, job.deadline)
+        if expired or stalled:
+            # Free the GPU time a timed-out or stuck job would still use
+            self.client.cancel_jobs([job.job_id for job in expired] + [job.job_id for job, _ in stalled])
+            for job in expired:
+                self._finish(job, error=TimeoutError(f"Job {job.job_id} timeout"))
+            for job, flat in stalled:
+                self._finish(job, error=JobStalled(job.job_id, flat))
+
+    def _finish(self, job: _TrackedJob, status: Optional[dict] = None,
+                error: Optional[BaseException] = None):
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+        if job.future.done():
+            return
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(status)
+
+    def _bulk_possible(self) -> bool:
+        """Whether due jobs may share a request; early polls only pay off then"""
+        return self.bulk is not False and any(b.bulk_status is not False for b in self.client.backends.backends)
+
+    def _fetch(self, job_ids: List[str]) -> Dict[str, object]:
+        """Map job id -> status dict (or the exception raised fetching it)"""
+        return self.client.get_job_statuses(job_ids, bulk=self.bulk is not False)
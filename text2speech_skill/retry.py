@@ -0,0 +1,73 @@
+"""Timeouts and retries for Text2Speech (TTSWeb) HTTP calls"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# (connect, read) seconds per endpoint family. The read timeout bounds each
+# socket read, not the whole transfer, so long streamed downloads are fine.
+DEFAULT_TIMEOUTS = {
+    "meta": (5.0, 15.0),       # /health, /meta/*
+    "submit": (5.0, 60.0),     # /tts/* (may upload reference audio)
+    "status": (5.0, 15.0),     # /jobs/*
+    "download": (5.0, 60.0),   # audio files
+    "tokens": (5.0, 300.0),    # /tokenizer/*
+}
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Seconds from a Retry-After value (delta-seconds or HTTP date); None if absent or invalid"""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def is_transient(error: BaseException) -> bool:
+    """Errors worth retrying: network trouble, 429 and 5xx"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return isinstance(error, OSError)
+    return response.status_code == 429 or response.status_code >= 500
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for failed requests.
+
+    Attempt n waits a random time between half and all of
+    min(maximum, initial * multiplier ** n). A server Retry-After is used as a
+    lower bound. One longer than `maximum` ends the retries, so the caller sees
+    the response instead of sleeping for minutes.
+    """
+
+    def __init__(self, attempts: int = 4, initial: float = 0.5, maximum: float = 30.0,
+                 multiplier: float = 2.0):
+        self.attempts = max(1, attempts)
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+
+    @classmethod
+    def none(cls) -> "RetryPolicy":
+        """Policy that never retries"""
+        return cls(attempts=1)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Seconds to wait before retry number attempt + 1, or None to give up"""
+        if attempt + 1 >= self.attempts:
+            return None
+        if retry_after is not None and retry_after > self.maximum:
+            return None
+        backoff = min(self.maximum, self.initial * self.multiplier ** attempt)
+        delay = random.uniform(backoff / 2, backoff)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay